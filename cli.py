@@ -0,0 +1,359 @@
+"""Headless command-line entry point for Cameraide.
+
+Run inside Blender in background mode, arguments after ``--``:
+
+    blender -b shot.blend --python /path/to/Cameraide/cli.py -- render \\
+        --cameras "CAM_A,CAM_B*" --frames 1-48 --json result.json
+
+    blender -b shot.blend --python cli.py -- serve --host 0.0.0.0 --chunk-size 10
+    blender -b --python cli.py -- work --url http://coordinator:8765
+
+    blender -b shot.blend --python cli.py -- export -o shot_manifest.json
+    blender -b --python cli.py -- render --manifest shot_manifest.json --jobs 0-3
+
+The queue is built with build_render_queue (same jobs as "All Cameras")
+or read from a manifest written by ``export``, filtered, rendered
+synchronously, and summarised as JSON (stdout, or the file given with
+--json). ``render`` and ``serve`` validate the whole queue first (skip
+with --skip-preflight). ``render --metrics-port 9464`` serves live
+progress for Prometheus while it runs. Exit code is 0 on success, 1 if a
+job failed, 2 for bad arguments and 3 if pre-flight validation found
+errors.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import bpy
+
+_RANGE_RE = re.compile(r'^\s*(-?\d+)\s*(?:-\s*(-?\d+))?\s*$')
+
+
+def parse_frame_ranges(text):
+    """Parse "1-48,60,100-120" into [(1, 48), (60, 60), (100, 120)]."""
+    ranges = []
+    for part in text.split(','):
+        if not part.strip():
+            continue
+        match = _RANGE_RE.match(part)
+        if not match:
+            raise ValueError(f"Invalid frame range '{part.strip()}'")
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) is not None else start
+        if end < start:
+            raise ValueError(f"Inverted frame range '{part.strip()}'")
+        ranges.append((start, end))
+    return ranges
+
+
+def filter_queue(queue, camera_patterns=None, frame_ranges=None):
+    """Restrict (camera, start, end) jobs to matching cameras and frames.
+    A job overlapping several frame ranges is split into one job per overlap."""
+    from .utils.camera_names import camera_name_matches
+
+    filtered = []
+    for cam_obj, start, end in queue:
+        if camera_patterns and not any(camera_name_matches(cam_obj, p) for p in camera_patterns):
+            continue
+        if not frame_ranges:
+            filtered.append((cam_obj, start, end))
+            continue
+        for lo, hi in frame_ranges:
+            s, e = max(start, lo), min(end, hi)
+            if s <= e:
+                filtered.append((cam_obj, s, e))
+    return filtered
+
+
+def _describe_job(cam_obj, start, end):
+    from .utils.camera_names import get_clean_camera_name
+    return {'camera': get_clean_camera_name(cam_obj), 'object': cam_obj.name,
+            'frame_start': start, 'frame_end': end}
+
+
+def _coordinator_job(cam_obj, start, end):
+    from .utils.camera_names import get_clean_camera_name
+    from .render.manifest import settings_to_dict
+    from .utils.profiles import effective_settings
+    settings = effective_settings(cam_obj)
+    return {
+        'settings': settings_to_dict(settings),
+        'camera': get_clean_camera_name(cam_obj),
+        'object': cam_obj.name,
+        'start': start,
+        'end': end,
+        'step': settings.frame_step,
+        'hold': settings.hold_frames,
+        'video': settings.output_format in {'H264_MP4', 'H264_MKV', 'PRORES_MOV'},
+    }
+
+
+def _write_summary(summary, path):
+    text = json.dumps(summary, indent=2)
+    if path:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+def _open_blend(path):
+    if path:
+        bpy.ops.wm.open_mainfile(filepath=os.path.abspath(path))
+
+
+def parse_job_ids(text):
+    """Parse "0-3,7" into {0, 1, 2, 3, 7}."""
+    return {i for start, end in parse_frame_ranges(text) for i in range(start, end + 1)}
+
+
+def _load_queue(args):
+    """Open the .blend and build the filtered queue, from the scene or from
+    --manifest (which also names the .blend unless --blend is given)."""
+    camera_patterns = [p.strip() for p in (args.cameras or "").split(',') if p.strip()]
+    frame_ranges = parse_frame_ranges(args.frames) if args.frames else None
+
+    manifest_path = getattr(args, 'manifest', None)
+    if manifest_path:
+        from .render.manifest import load_manifest, select_jobs, manifest_queue
+        manifest = load_manifest(manifest_path)
+        _open_blend(args.blend or manifest.get('blend'))
+        job_ids = parse_job_ids(args.jobs) if args.jobs else None
+        jobs = select_jobs(manifest, job_ids, camera_patterns, frame_ranges)
+        return bpy.context, manifest_queue(bpy.context, jobs)
+
+    from .operators.render_batch import build_render_queue
+    _open_blend(args.blend)
+    context = bpy.context
+    return context, filter_queue(build_render_queue(context), camera_patterns, frame_ranges)
+
+
+def _preflight(args, context, queue, summary):
+    """Validate the queue into summary['preflight']. Returns False when it
+    found errors and the run should stop."""
+    if args.skip_preflight:
+        return True
+    from .utils.preflight import validate_queue
+    report = validate_queue(context, queue)
+    summary['preflight'] = report.to_dict()
+    for issue in report.issues:
+        print(f"cameraide: pre-flight {issue['severity']}: {issue['camera'] or 'queue'}: "
+              f"{issue['message']}", file=sys.stderr)
+    return report.ok
+
+
+def cmd_render(args):
+    from .render.runner import run_queue
+
+    context, queue = _load_queue(args)
+
+    summary = {
+        'blend': bpy.data.filepath,
+        'scene': context.scene.name,
+        'engine': context.scene.render.engine,
+        'jobs': [],
+    }
+    preflight_ok = _preflight(args, context, queue, summary)
+    if args.dry_run:
+        summary['jobs'] = [_describe_job(*job) for job in queue]
+        _write_summary(summary, args.json)
+        return 0 if preflight_ok else 3
+    if not preflight_ok:
+        _write_summary(summary, args.json)
+        return 3
+
+    if args.telemetry:
+        context.scene.cameraide_batch.use_telemetry = True
+        context.scene.cameraide_batch.telemetry_dir = args.telemetry
+    if args.metrics_port is not None or args.status_file:
+        batch = context.scene.cameraide_batch
+        batch.use_metrics = True
+        batch.metrics_port = args.metrics_port or 0
+        batch.metrics_status_file = args.status_file or ""
+
+    if args.trace:
+        from .utils import profiling
+        profiling.start_recording()
+
+    t0 = time.perf_counter()
+    try:
+        results = run_queue(context, queue)
+    finally:
+        if args.trace:
+            profiling.stop_recording(args.trace)
+    if args.telemetry:
+        from .utils.telemetry import RenderTelemetry
+        summary['telemetry_log'] = RenderTelemetry.last_log_path
+    if args.metrics_port:
+        from .utils.metrics import MetricsExporter
+        if MetricsExporter.error:
+            summary['metrics_error'] = MetricsExporter.error
+    summary.update({
+        'jobs': results,
+        'frames': sum(r['frames'] for r in results),
+        'failed': sum(1 for r in results if r['status'] != 'FINISHED'),
+        'seconds': round(time.perf_counter() - t0, 3),
+        'bytes_written': sum(r['bytes_written'] for r in results),
+    })
+    _write_summary(summary, args.json)
+    return 1 if summary['failed'] else 0
+
+
+def cmd_serve(args):
+    from .render.coordinator import JobCoordinator, CoordinatorServer, make_chunks
+
+    context, queue = _load_queue(args)
+    preflight = {}
+    if not _preflight(args, context, queue, preflight):
+        _write_summary(preflight, args.json)
+        return 3
+    if context.scene.cameraide_batch.use_persistent_batch:
+        from .operators.render_batch import order_queue_by_affinity
+        queue = order_queue_by_affinity(queue)
+    chunks = make_chunks([_coordinator_job(*job) for job in queue], args.chunk_size)
+    coordinator = JobCoordinator(
+        chunks, lease_seconds=args.lease_seconds, max_attempts=args.max_attempts,
+        info={'blend': bpy.data.filepath, 'scene': context.scene.name},
+    )
+    server = CoordinatorServer(coordinator, host=args.host, port=args.port).start()
+    print(f"cameraide: serving {len(chunks)} chunks from {len(queue)} jobs at {server.url}",
+          file=sys.stderr)
+    try:
+        server.wait()
+    finally:
+        summary = coordinator.status()
+        server.stop()
+    _write_summary(summary, args.json)
+    return 1 if summary['failed'] else 0
+
+
+def cmd_work(args):
+    import socket
+    from .render.coordinator import CoordinatorClient
+    from .render.worker import run_worker
+
+    worker_id = args.worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    client = CoordinatorClient(args.url, worker_id)
+    blend = args.blend or client.status()['info'].get('blend')
+    _open_blend(blend)
+
+    t0 = time.perf_counter()
+    results = run_worker(bpy.context, client, poll_seconds=args.poll_seconds)
+    summary = {
+        'worker': worker_id,
+        'blend': bpy.data.filepath,
+        'chunks': results,
+        'frames': sum(r['frames'] for r in results),
+        'failed': sum(1 for r in results if r['status'] != 'FINISHED'),
+        'seconds': round(time.perf_counter() - t0, 3),
+    }
+    _write_summary(summary, args.json)
+    return 1 if summary['failed'] else 0
+
+
+def cmd_export(args):
+    from .render.manifest import export_manifest
+
+    context, queue = _load_queue(args)
+    manifest = export_manifest(context, queue, args.output)
+    print(f"cameraide: wrote {len(manifest['jobs'])} jobs to {args.output}", file=sys.stderr)
+    return 0
+
+
+def _add_queue_filters(parser, manifest=True):
+    parser.add_argument("--blend", help="Open this .blend before building the queue")
+    parser.add_argument("--cameras", help="Comma-separated camera names (wildcards allowed)")
+    parser.add_argument("--frames", help="Frame ranges to keep, e.g. 1-48,60")
+    if manifest:
+        parser.add_argument("--manifest", help="Take the jobs from this manifest instead of the scene")
+        parser.add_argument("--jobs", help="Manifest job ids to run, e.g. 0-3,7")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="cameraide", description="Cameraide headless tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    render = sub.add_parser("render", help="Render the Cameraide queue synchronously")
+    _add_queue_filters(render)
+    render.add_argument("--json", help="Write the JSON summary here instead of stdout")
+    render.add_argument("--dry-run", action="store_true", help="List the jobs without rendering")
+    render.add_argument("--telemetry", metavar="DIR", help="Record per-frame telemetry into this folder")
+    render.add_argument("--trace", metavar="FILE", help="Write a Chrome/Perfetto trace of the run")
+    render.add_argument("--metrics-port", type=int, metavar="PORT",
+                        help="Serve OpenMetrics progress on localhost:PORT/metrics")
+    render.add_argument("--status-file", metavar="FILE",
+                        help="Rewrite this JSON file with the batch progress every few seconds")
+    render.add_argument("--skip-preflight", action="store_true",
+                        help="Render without validating the queue first")
+    render.set_defaults(func=cmd_render)
+
+    serve = sub.add_parser("serve", help="Publish the queue to workers in frame chunks")
+    _add_queue_filters(serve)
+    serve.add_argument("--host", default="127.0.0.1", help="Interface to bind (0.0.0.0 for other nodes)")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--chunk-size", type=int, default=10, help="Frames per chunk")
+    serve.add_argument("--lease-seconds", type=float, default=600.0,
+                       help="Requeue a chunk if its worker is silent this long")
+    serve.add_argument("--max-attempts", type=int, default=3)
+    serve.add_argument("--json", help="Write the final status here instead of stdout")
+    serve.add_argument("--skip-preflight", action="store_true",
+                       help="Serve without validating the queue first")
+    serve.set_defaults(func=cmd_serve)
+
+    export = sub.add_parser("export", help="Write the queue to a JSON render manifest")
+    _add_queue_filters(export, manifest=False)
+    export.add_argument("--output", "-o", required=True, help="Manifest file to write")
+    export.set_defaults(func=cmd_export)
+
+    work = sub.add_parser("work", help="Render chunks leased from a coordinator")
+    work.add_argument("--url", required=True, help="Coordinator URL, e.g. http://host:8765")
+    work.add_argument("--blend", help="Local path of the .blend (default: the coordinator's)")
+    work.add_argument("--worker-id", help="Name reported to the coordinator")
+    work.add_argument("--poll-seconds", type=float, default=2.0)
+    work.add_argument("--json", help="Write the worker summary here instead of stdout")
+    work.set_defaults(func=cmd_work)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 2
+    try:
+        return args.func(args)
+    except ValueError as e:
+        print(f"cameraide: {e}", file=sys.stderr)
+        return 2
+
+
+def _bootstrap():
+    """Import this file as part of the add-on package when it is run with
+    --python, reusing the enabled add-on module if Blender loaded it."""
+    import importlib
+
+    pkg_dir = os.path.dirname(os.path.abspath(__file__))
+    package = None
+    for module in list(sys.modules.values()):
+        path = getattr(module, '__file__', None)
+        if (path and os.path.basename(path) == '__init__.py'
+                and os.path.dirname(os.path.abspath(path)) == pkg_dir):
+            package = module
+            break
+    if package is None:
+        parent, name = os.path.split(pkg_dir)
+        if parent not in sys.path:
+            sys.path.insert(0, parent)
+        package = importlib.import_module(name)
+    if not hasattr(bpy.types.Camera, 'cameraide_settings'):
+        package.register()
+    return importlib.import_module(package.__name__ + ".cli")
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    sys.exit(_bootstrap().main(argv))
@@ -5,6 +5,13 @@ from . import resolution_presets
 from . import render_snapshot
 from . import render_playblast
 from . import render_batch
+from . import render_tiled
+from . import bulk
+from . import profiling
+from . import manifest
+from . import benchmark
+from . import output_targets
+from . import profiles
 
 
 def register():
@@ -14,9 +21,23 @@ def register():
     render_snapshot.register()
     render_playblast.register()
     render_batch.register()
+    render_tiled.register()
+    bulk.register()
+    profiling.register()
+    manifest.register()
+    benchmark.register()
+    output_targets.register()
+    profiles.register()
 
 
 def unregister():
+    profiles.unregister()
+    output_targets.unregister()
+    benchmark.unregister()
+    manifest.unregister()
+    profiling.unregister()
+    bulk.unregister()
+    render_tiled.unregister()
     render_batch.unregister()
     render_playblast.unregister()
     render_snapshot.unregister()
@@ -0,0 +1,112 @@
+"""Encoder and file format benchmark operators for Cameraide"""
+import bpy
+from bpy.types import Operator
+from ..utils.benchmark import EncoderBenchmark, FormatBenchmark
+from ..utils.profiles import effective_settings
+
+VIDEO_FORMATS = {'H264_MP4', 'H264_MKV', 'PRORES_MOV'}
+
+
+class CAMERAIDE_OT_benchmark_encoder(Operator):
+    """Encode a short clip of this camera with every encoder speed profile"""
+    bl_idname = "cameraide.benchmark_encoder"
+    bl_label = "Benchmark Encoder"
+    bl_description = ("Render a short clip from the current frame once, encode it with each "
+                      "encoder speed profile and report frames per second and file size")
+
+    frame_count: bpy.props.IntProperty(name="Frames", default=24, min=2, max=500)
+
+    @classmethod
+    def poll(cls, context):
+        cam = context.scene.camera
+        if cam is None or not cam.data.cameraide_settings.use_custom_settings:
+            return False
+        return effective_settings(cam, context.scene).output_format in VIDEO_FORMATS
+
+    def execute(self, context):
+        cam_obj = context.scene.camera
+        try:
+            result = EncoderBenchmark.run(context, cam_obj, self.frame_count)
+        except Exception as e:
+            self.report({'ERROR'}, f"Benchmark failed: {e}")
+            return {'CANCELLED'}
+        if not result:
+            self.report({'ERROR'}, "Benchmark rendered no frames")
+            return {'CANCELLED'}
+
+        summary = ", ".join(
+            f"{p['name']} {p['fps']} fps / {p['bytes'] / 1e6:.1f} MB" for p in result['profiles']
+        )
+        self.report({'INFO'}, f"{result['frames']} frames: {summary}")
+        return {'FINISHED'}
+
+
+def _benchmark_camera(context):
+    cam = context.scene.camera
+    if cam is None or not cam.data.cameraide_settings.use_custom_settings:
+        return None
+    return cam
+
+
+class CAMERAIDE_OT_benchmark_formats(Operator):
+    """Write one frame of this camera with every format option and time it"""
+    bl_idname = "cameraide.benchmark_formats"
+    bl_label = "Benchmark Formats"
+    bl_description = ("Render the current frame once, write it with each PNG compression, JPEG "
+                      "quality, EXR codec and H.264 quality and measure write time, read time "
+                      "and size. Results are kept for this machine")
+
+    @classmethod
+    def poll(cls, context):
+        return _benchmark_camera(context) is not None
+
+    def execute(self, context):
+        cam_obj = _benchmark_camera(context)
+        try:
+            result = FormatBenchmark.run(context, cam_obj)
+        except Exception as e:
+            self.report({'ERROR'}, f"Benchmark failed: {e}")
+            return {'CANCELLED'}
+        if not result:
+            self.report({'ERROR'}, "Benchmark rendered no frame")
+            return {'CANCELLED'}
+
+        res_x, res_y = result['resolution']
+        self.report({'INFO'}, f"Benchmarked {len(result['options'])} options at {res_x}x{res_y}")
+        return {'FINISHED'}
+
+
+class CAMERAIDE_OT_apply_format_recommendation(Operator):
+    """Use the fastest benchmarked option for this camera's format"""
+    bl_idname = "cameraide.apply_format_recommendation"
+    bl_label = "Use Recommended Option"
+    bl_description = ("Switch to the fastest-writing option that keeps at least the current "
+                      "quality, from the format benchmark")
+    bl_options = {'REGISTER', 'UNDO', 'INTERNAL'}
+
+    def execute(self, context):
+        cam_obj = _benchmark_camera(context)
+        if cam_obj is None:
+            return {'CANCELLED'}
+        settings = effective_settings(cam_obj, context.scene)
+        recommendation = FormatBenchmark.recommend(settings)
+        if recommendation is None:
+            self.report({'WARNING'}, "No benchmark results for this format")
+            return {'CANCELLED'}
+        option = recommendation['option']
+        for name, value in option['settings'].items():
+            setattr(settings, name, value)
+        self.report({'INFO'}, f"Using {option['label']}")
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(CAMERAIDE_OT_benchmark_encoder)
+    bpy.utils.register_class(CAMERAIDE_OT_benchmark_formats)
+    bpy.utils.register_class(CAMERAIDE_OT_apply_format_recommendation)
+
+
+def unregister():
+    bpy.utils.unregister_class(CAMERAIDE_OT_apply_format_recommendation)
+    bpy.utils.unregister_class(CAMERAIDE_OT_benchmark_formats)
+    bpy.utils.unregister_class(CAMERAIDE_OT_benchmark_encoder)
@@ -0,0 +1,213 @@
+"""Bulk camera operators for Cameraide (befriend / batch-edit many cameras)"""
+import bpy
+from bpy.types import Operator
+from bpy.props import EnumProperty, StringProperty, BoolProperty
+from ..properties import CameraideSettings
+from ..utils.callbacks import befriend_cameras, apply_cameraide_to_native
+from ..utils.camera_names import camera_name_matches
+from ..utils.profiles import effective_settings, setting_owner
+from ..utils.frame_manager import frame_manager, prevent_recursive_update, apply_frame_range_to_scene
+
+TARGET_ITEMS = [
+    ('SELECTED', "Selected", "Selected camera objects"),
+    ('CAMERAIDE', "Cameraide", "All cameras with Cameraide enabled"),
+    ('ALL', "All", "All cameras in the scene"),
+]
+
+# Settings that are managed by befriend/unfriend rather than edited directly
+_EXCLUDED_SETTINGS = {'rna_type', 'name', 'use_custom_settings',
+                      'stored_frame_start', 'stored_frame_end', 'output_targets_index'}
+
+
+def collect_target_cameras(context, target, name_filter=""):
+    """Camera objects for a bulk operation, optionally filtered by a
+    case-insensitive wildcard on the clean camera name."""
+    if target == 'SELECTED':
+        cameras = [obj for obj in context.selected_objects if obj.type == 'CAMERA']
+    else:
+        cameras = [obj for obj in context.scene.objects if obj.type == 'CAMERA']
+        if target == 'CAMERAIDE':
+            cameras = [c for c in cameras if c.data.cameraide_settings.use_custom_settings]
+
+    if name_filter:
+        cameras = [c for c in cameras if camera_name_matches(c, name_filter)]
+    return cameras
+
+
+def _settings_property_items(self, context):
+    items = []
+    for prop in CameraideSettings.bl_rna.properties:
+        if prop.identifier in _EXCLUDED_SETTINGS or prop.type in {'POINTER', 'COLLECTION'}:
+            continue
+        items.append((prop.identifier, prop.name or prop.identifier, prop.description))
+    return items
+
+
+def parse_setting_value(prop_name, text):
+    """Convert a text value to the RNA type of a CameraideSettings property.
+    Raises ValueError for values the property can't hold."""
+    prop = CameraideSettings.bl_rna.properties[prop_name]
+    text = text.strip()
+    if prop.type == 'BOOLEAN':
+        lowered = text.lower()
+        if lowered in {'1', 'true', 'yes', 'on'}:
+            return True
+        if lowered in {'0', 'false', 'no', 'off'}:
+            return False
+        raise ValueError(f"'{text}' is not a boolean")
+    if prop.type == 'INT':
+        value = int(text)
+        if not prop.hard_min <= value <= prop.hard_max:
+            raise ValueError(f"{value} is outside {prop.hard_min}..{prop.hard_max}")
+        return value
+    if prop.type == 'FLOAT':
+        return float(text)
+    if prop.type == 'ENUM':
+        identifiers = {item.identifier for item in prop.enum_items}
+        if prop.is_enum_flag:
+            values = {part.strip() for part in text.split(',') if part.strip()}
+            unknown = values - identifiers
+            if unknown:
+                raise ValueError(f"'{', '.join(sorted(unknown))}' not in {', '.join(sorted(identifiers))}")
+            return values
+        if text not in identifiers:
+            raise ValueError(f"'{text}' is not one of {', '.join(sorted(identifiers))}")
+        return text
+    return text
+
+
+class CAMERAIDE_OT_bulk_befriend(Operator):
+    """Befriend or unfriend several cameras at once"""
+    bl_idname = "cameraide.bulk_befriend"
+    bl_label = "Bulk Befriend"
+    bl_description = "Enable or disable Cameraide on many cameras in one pass"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    action: EnumProperty(
+        name="Action",
+        items=[
+            ('BEFRIEND', "Befriend", "Enable Cameraide settings"),
+            ('UNFRIEND', "Unfriend", "Disable Cameraide settings"),
+        ],
+        default='BEFRIEND'
+    )
+    target: EnumProperty(name="Cameras", items=TARGET_ITEMS, default='SELECTED')
+    name_filter: StringProperty(
+        name="Name Filter",
+        description="Only cameras whose name matches (wildcards allowed)",
+        default=""
+    )
+
+    def execute(self, context):
+        cameras = collect_target_cameras(context, self.target, self.name_filter)
+        if not cameras:
+            self.report({'WARNING'}, "No matching cameras")
+            return {'CANCELLED'}
+
+        changed = befriend_cameras(cameras, self.action == 'BEFRIEND')
+        verb = "Befriended" if self.action == 'BEFRIEND' else "Unfriended"
+        self.report({'INFO'}, f"{verb} {changed} of {len(cameras)} cameras")
+        return {'FINISHED'}
+
+
+class CAMERAIDE_OT_bulk_set_setting(Operator):
+    """Set one Cameraide setting on several cameras at once"""
+    bl_idname = "cameraide.bulk_set_setting"
+    bl_label = "Batch Edit Cameras"
+    bl_description = "Set a Cameraide setting on many cameras in one pass"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    target: EnumProperty(name="Cameras", items=TARGET_ITEMS, default='SELECTED')
+    name_filter: StringProperty(
+        name="Name Filter",
+        description="Only cameras whose name matches (wildcards allowed)",
+        default=""
+    )
+    property_name: EnumProperty(name="Setting", items=_settings_property_items)
+    use_active_value: BoolProperty(
+        name="Copy From Active",
+        description="Use the active camera's value instead of the typed value",
+        default=True
+    )
+    value: StringProperty(
+        name="Value",
+        description="New value (enum identifier, number, true/false or text)",
+        default=""
+    )
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "target")
+        layout.prop(self, "name_filter")
+        layout.prop(self, "property_name")
+        layout.prop(self, "use_active_value")
+        row = layout.row()
+        row.enabled = not self.use_active_value
+        row.prop(self, "value")
+
+    def execute(self, context):
+        if self.use_active_value:
+            source = context.active_object
+            if not source or source.type != 'CAMERA':
+                source = context.scene.camera
+            if not source:
+                self.report({'ERROR'}, "No active camera to copy from")
+                return {'CANCELLED'}
+            value = getattr(effective_settings(source, context.scene), self.property_name)
+        else:
+            try:
+                value = parse_setting_value(self.property_name, self.value)
+            except ValueError as e:
+                self.report({'ERROR'}, f"Invalid value: {e}")
+                return {'CANCELLED'}
+
+        cameras = collect_target_cameras(context, self.target, self.name_filter)
+        if not cameras:
+            self.report({'WARNING'}, "No matching cameras")
+            return {'CANCELLED'}
+
+        # Camera data can be shared between objects and shared settings live
+        # in the camera's profile; write each settings group once.
+        scene = context.scene
+        seen = set()
+        profiles = 0
+        with prevent_recursive_update():
+            for cam in cameras:
+                owner = setting_owner(effective_settings(cam, scene), self.property_name)
+                key = owner.as_pointer()
+                if key in seen:
+                    continue
+                seen.add(key)
+                if key != cam.data.cameraide_settings.as_pointer():
+                    profiles += 1
+                setattr(owner, self.property_name, value)
+            for cam in cameras:
+                frame_manager.store_range(cam)
+
+            if scene.camera in cameras:
+                settings = scene.camera.data.cameraide_settings
+                if settings.sync_frame_range and settings.frame_range_mode == 'PER_CAMERA':
+                    apply_frame_range_to_scene(scene.camera, scene)
+                apply_cameraide_to_native(scene.camera, scene)
+
+        context.view_layer.update()
+        cameras_set = len(seen) - profiles
+        if profiles:
+            self.report({'INFO'}, f"Set {self.property_name} on {cameras_set} camera(s) "
+                                  f"and {profiles} profile(s)")
+        else:
+            self.report({'INFO'}, f"Set {self.property_name} on {cameras_set} camera(s)")
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(CAMERAIDE_OT_bulk_befriend)
+    bpy.utils.register_class(CAMERAIDE_OT_bulk_set_setting)
+
+
+def unregister():
+    bpy.utils.unregister_class(CAMERAIDE_OT_bulk_set_setting)
+    bpy.utils.unregister_class(CAMERAIDE_OT_bulk_befriend)
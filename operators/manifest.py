@@ -0,0 +1,48 @@
+"""Render manifest export operator for Cameraide"""
+import bpy
+from bpy.types import Operator
+from bpy_extras.io_utils import ExportHelper
+from ..render.manifest import export_manifest
+from .render_batch import build_render_queue
+
+
+class CAMERAIDE_OT_export_manifest(Operator, ExportHelper):
+    """Write the render queue of all Cameraide cameras to a JSON manifest"""
+    bl_idname = "cameraide.export_manifest"
+    bl_label = "Export Render Manifest"
+    bl_description = ("Write every Cameraide job (resolved frame ranges, settings and output paths) "
+                      "to a JSON manifest that headless workers can render without this scene")
+
+    filename_ext = ".json"
+    filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        return any(
+            obj.type == 'CAMERA' and obj.data.cameraide_settings.use_custom_settings
+            for obj in context.scene.objects
+        )
+
+    def execute(self, context):
+        if not bpy.data.filepath:
+            self.report({'ERROR'}, "Save the .blend first; workers open it by path")
+            return {'CANCELLED'}
+        if bpy.data.is_dirty:
+            self.report({'WARNING'}, "Unsaved changes are not in the .blend workers will open")
+
+        queue = build_render_queue(context)
+        try:
+            manifest = export_manifest(context, queue, self.filepath)
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not write manifest: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Wrote {len(manifest['jobs'])} jobs to {self.filepath}")
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(CAMERAIDE_OT_export_manifest)
+
+
+def unregister():
+    bpy.utils.unregister_class(CAMERAIDE_OT_export_manifest)
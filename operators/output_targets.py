@@ -0,0 +1,63 @@
+"""Operators for a camera's extra output targets"""
+import bpy
+from bpy.types import Operator
+from bpy.props import IntProperty
+from ..utils.profiles import effective_settings
+
+
+def _active_camera_settings(context):
+    if context.active_object and context.active_object.type == 'CAMERA':
+        return effective_settings(context.active_object, context.scene)
+    if context.scene.camera:
+        return effective_settings(context.scene.camera, context.scene)
+    return None
+
+
+class CAMERAIDE_OT_output_target_add(Operator):
+    """Add an output written from this camera's rendered frames"""
+    bl_idname = "cameraide.output_target_add"
+    bl_label = "Add Output"
+    bl_description = "Write another format from the same render (converted in the background)"
+    bl_options = {'REGISTER', 'UNDO', 'INTERNAL'}
+
+    def execute(self, context):
+        settings = _active_camera_settings(context)
+        if settings is None:
+            self.report({'ERROR'}, "No active camera found")
+            return {'CANCELLED'}
+        target = settings.output_targets.add()
+        # A review movie of an image render, or frames of a movie render
+        if settings.output_format in {'H264_MP4', 'H264_MKV', 'PRORES_MOV'}:
+            target.output_format = 'PNG'
+            target.subfolder = "frames"
+        settings.output_targets_index = len(settings.output_targets) - 1
+        return {'FINISHED'}
+
+
+class CAMERAIDE_OT_output_target_remove(Operator):
+    """Remove an extra output"""
+    bl_idname = "cameraide.output_target_remove"
+    bl_label = "Remove Output"
+    bl_description = "Remove this extra output"
+    bl_options = {'REGISTER', 'UNDO', 'INTERNAL'}
+
+    index: IntProperty(default=-1)
+
+    def execute(self, context):
+        settings = _active_camera_settings(context)
+        if settings is None or not 0 <= self.index < len(settings.output_targets):
+            return {'CANCELLED'}
+        settings.output_targets.remove(self.index)
+        settings.output_targets_index = min(settings.output_targets_index,
+                                            max(len(settings.output_targets) - 1, 0))
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(CAMERAIDE_OT_output_target_add)
+    bpy.utils.register_class(CAMERAIDE_OT_output_target_remove)
+
+
+def unregister():
+    bpy.utils.unregister_class(CAMERAIDE_OT_output_target_remove)
+    bpy.utils.unregister_class(CAMERAIDE_OT_output_target_add)
@@ -0,0 +1,91 @@
+"""Operators for shared settings profiles"""
+import bpy
+from bpy.types import Operator
+from bpy.props import StringProperty
+from ..utils.profiles import (copy_shared, detach_profile, effective_settings,
+                              profile_users, unique_profile_name)
+
+
+def _active_camera(context):
+    if context.active_object and context.active_object.type == 'CAMERA':
+        return context.active_object
+    return context.scene.camera
+
+
+class CAMERAIDE_OT_profile_new(Operator):
+    """Create a settings profile from this camera and use it"""
+    bl_idname = "cameraide.profile_new"
+    bl_label = "New Profile"
+    bl_description = ("Store this camera's resolution, format and quality settings as a profile "
+                      "other cameras can share")
+    bl_options = {'REGISTER', 'UNDO'}
+
+    name: StringProperty(name="Name", default="Profile")
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        cam_obj = _active_camera(context)
+        if cam_obj is None:
+            self.report({'ERROR'}, "No active camera found")
+            return {'CANCELLED'}
+        scene = context.scene
+        profile = scene.cameraide_profiles.add()
+        profile.name = unique_profile_name(scene, self.name.strip() or "Profile")
+        copy_shared(effective_settings(cam_obj, scene), profile)
+        settings = cam_obj.data.cameraide_settings
+        settings.profile_overrides = set()
+        settings.profile = profile.name
+        self.report({'INFO'}, f"Created profile '{profile.name}'")
+        return {'FINISHED'}
+
+
+class CAMERAIDE_OT_profile_detach(Operator):
+    """Stop using the profile and keep its values on this camera"""
+    bl_idname = "cameraide.profile_detach"
+    bl_label = "Detach Profile"
+    bl_description = "Copy the profile's settings to this camera and stop using the profile"
+    bl_options = {'REGISTER', 'UNDO', 'INTERNAL'}
+
+    def execute(self, context):
+        cam_obj = _active_camera(context)
+        if cam_obj is None or not detach_profile(cam_obj.data.cameraide_settings, context.scene):
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+
+class CAMERAIDE_OT_profile_remove(Operator):
+    """Delete this camera's profile"""
+    bl_idname = "cameraide.profile_remove"
+    bl_label = "Delete Profile"
+    bl_description = ("Delete the profile. Cameras using it keep its settings as their own")
+    bl_options = {'REGISTER', 'UNDO', 'INTERNAL'}
+
+    def execute(self, context):
+        cam_obj = _active_camera(context)
+        scene = context.scene
+        if cam_obj is None:
+            return {'CANCELLED'}
+        name = cam_obj.data.cameraide_settings.profile
+        index = scene.cameraide_profiles.find(name)
+        if index < 0:
+            return {'CANCELLED'}
+        users = profile_users(scene, name)
+        for cam in users:
+            detach_profile(cam.cameraide_settings, scene)
+        scene.cameraide_profiles.remove(index)
+        self.report({'INFO'}, f"Deleted profile '{name}' ({len(users)} camera(s) detached)")
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(CAMERAIDE_OT_profile_new)
+    bpy.utils.register_class(CAMERAIDE_OT_profile_detach)
+    bpy.utils.register_class(CAMERAIDE_OT_profile_remove)
+
+
+def unregister():
+    bpy.utils.unregister_class(CAMERAIDE_OT_profile_remove)
+    bpy.utils.unregister_class(CAMERAIDE_OT_profile_detach)
+    bpy.utils.unregister_class(CAMERAIDE_OT_profile_new)
@@ -0,0 +1,37 @@
+"""Developer trace-recording operator for Cameraide"""
+import bpy
+from bpy.types import Operator
+from ..utils import profiling
+
+
+class CAMERAIDE_OT_toggle_trace(Operator):
+    """Start or stop recording a Chrome/Perfetto trace of Cameraide callbacks"""
+    bl_idname = "cameraide.toggle_trace"
+    bl_label = "Record Trace"
+    bl_description = ("Record trace events for Cameraide callbacks, panel draws and render jobs; "
+                      "stopping writes the trace file")
+
+    def execute(self, context):
+        if not profiling.is_recording():
+            profiling.start_recording()
+            self.report({'INFO'}, "Cameraide trace recording started")
+            return {'FINISHED'}
+
+        path = context.scene.cameraide_batch.trace_path
+        try:
+            count = profiling.stop_recording(path)
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not write trace: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Wrote {count} trace events to {bpy.path.abspath(path)}")
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(CAMERAIDE_OT_toggle_trace)
+
+
+def unregister():
+    if profiling.is_recording():
+        profiling.stop_recording()
+    bpy.utils.unregister_class(CAMERAIDE_OT_toggle_trace)
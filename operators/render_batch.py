@@ -2,8 +2,19 @@
 import bpy
 from bpy.types import Operator
 from ..utils.render_manager import RenderCleanupManager
+from ..utils.telemetry import RenderTelemetry
+from ..utils.metrics import MetricsExporter
+from ..utils.profiles import effective_settings
+from ..utils import profiling
 from ..utils.marker_detection import get_marker_frame_ranges
+from ..utils.preflight import Preflight
 from ..utils.callbacks import on_active_camera_changed, apply_cameraide_to_native
+from ..render.playblast import apply_fast_playblast
+from ..render.postprocess import JobPostProcess
+from ..render.tiles import TiledJob
+from ..render.processes import BackgroundRender
+from ..render.transfer import TransferQueue
+from ..render.derive import DerivePool
 
 
 def build_render_queue(context):
@@ -34,6 +45,72 @@ def build_render_queue(context):
     return queue
 
 
+VIDEO_FORMATS = {'H264_MP4', 'H264_MKV', 'PRORES_MOV'}
+
+
+def _settings_affinity_key(cam_obj):
+    """Settings that force a re-sync between jobs, most expensive first:
+    final resolution, film transparency, then output format."""
+    settings = effective_settings(cam_obj)
+    res_x = settings.resolution_x * settings.resolution_percentage // 100
+    res_y = settings.resolution_y * settings.resolution_percentage // 100
+    if settings.output_format in VIDEO_FORMATS:
+        res_x += res_x % 2
+        res_y += res_y % 2
+    fmt = settings.output_format
+    if fmt == 'PNG':
+        fmt_detail = (settings.png_color_depth, settings.png_compression)
+    elif fmt == 'OPEN_EXR':
+        fmt_detail = (settings.exr_color_depth, settings.exr_codec)
+    elif fmt == 'JPEG':
+        fmt_detail = (settings.jpeg_quality,)
+    else:
+        fmt_detail = (settings.video_quality, settings.audio_codec)
+    return ((res_x, res_y), settings.film_transparent, (fmt, fmt_detail))
+
+
+# Cost of changing each key field between consecutive jobs
+_AFFINITY_WEIGHTS = (4, 2, 1)
+
+
+def order_queue_by_affinity(queue):
+    """Group jobs with identical render settings and order the groups so
+    each transition changes as little as possible (greedy nearest neighbour,
+    starting from the first job). Job order within a group is kept, so a
+    camera's marker ranges stay together."""
+    groups = {}
+    for job in queue:
+        groups.setdefault(_settings_affinity_key(job[0]), []).append(job)
+    if len(groups) < 2:
+        return list(queue)
+
+    def distance(a, b):
+        return sum(w for w, x, y in zip(_AFFINITY_WEIGHTS, a, b) if x != y)
+
+    remaining = list(groups)
+    current = remaining.pop(0)
+    ordered = list(groups[current])
+    while remaining:
+        nearest = min(remaining, key=lambda key: distance(current, key))
+        remaining.remove(nearest)
+        ordered.extend(groups[nearest])
+        current = nearest
+    return ordered
+
+
+def prepare_normal_queue(context, queue):
+    """Apply scene-level batch options to a normal-render queue.
+
+    With Persistent Data Batch on, the render engine keeps scene data
+    between jobs and jobs are reordered by settings affinity. Call after
+    RenderCleanupManager.store_settings so the user's flag is restored.
+    """
+    if not context.scene.cameraide_batch.use_persistent_batch:
+        return queue
+    context.scene.render.use_persistent_data = True
+    return order_queue_by_affinity(queue)
+
+
 def disable_camera_handler():
     """Suspend the active-camera handler so camera switches during the batch
     don't re-sync frame ranges or native settings mid-render."""
@@ -46,6 +123,41 @@ def restore_camera_handler():
         bpy.app.handlers.depsgraph_update_post.append(on_active_camera_changed)
 
 
+def run_preflight(operator, context, queue):
+    """Validate the queue as the batch's Pre-flight setting asks. Returns
+    False when errors block the batch; the report is kept for the render
+    box."""
+    mode = context.scene.cameraide_batch.preflight_mode
+    if mode == 'OFF':
+        return True
+    report = Preflight.run(context, queue)
+    if report.errors and mode == 'BLOCK':
+        operator.report({'ERROR'}, f"Pre-flight: {report.summary()}, batch not started")
+        return False
+    if report.issues:
+        operator.report({'WARNING'}, f"Pre-flight: {report.summary()}")
+    return True
+
+
+class CAMERAIDE_OT_preflight_check(Operator):
+    """Validate every job of the All Cameras queue without rendering"""
+    bl_idname = "cameraide.preflight_check"
+    bl_label = "Check Queue"
+
+    @classmethod
+    def poll(cls, context):
+        return any(
+            obj.type == 'CAMERA' and obj.data.cameraide_settings.use_custom_settings
+            for obj in context.scene.objects
+        )
+
+    def execute(self, context):
+        report = Preflight.run(context, build_render_queue(context))
+        level = 'ERROR' if report.errors else 'WARNING' if report.warnings else 'INFO'
+        self.report({level}, f"Pre-flight: {report.summary()}")
+        return {'FINISHED'}
+
+
 class CAMERA_OT_render_all_viewport(Operator):
     """Render all cameras with viewport render"""
     bl_idname = "camera.render_all_viewport"
@@ -64,28 +176,47 @@ class CAMERA_OT_render_all_viewport(Operator):
         if not queue:
             self.report({'WARNING'}, "No cameras with custom settings enabled")
             return {'CANCELLED'}
+        if not run_preflight(self, context, queue):
+            return {'CANCELLED'}
 
         # OpenGL renders never fire render_complete/render_write handlers,
         # so run the queue synchronously and restore in finally.
+        JobPostProcess.clear_errors()
         RenderCleanupManager.store_settings(context)
+        apply_fast_playblast(context)
         disable_camera_handler()
+        RenderTelemetry.start_batch(context, 'OPENGL', queue)
         completed = 0
         try:
             for cam_obj, start, end in queue:
-                context.scene.camera = cam_obj
-                RenderCleanupManager.apply_camera_settings(
-                    context, cam_obj, frame_range=(start, end)
-                )
-                # view_context=False renders through scene.camera, so every
-                # job uses its own camera regardless of the viewport view.
-                result = bpy.ops.render.opengl(
-                    animation=True, sequencer=False,
-                    write_still=False, view_context=False
-                )
+                RenderTelemetry.start_job(cam_obj, start, end, kind='OPENGL')
+                with profiling.span("render_job", 'render', camera=cam_obj.name,
+                                    frame_start=start, frame_end=end, kind='OPENGL'):
+                    context.scene.camera = cam_obj
+                    RenderCleanupManager.apply_camera_settings(
+                        context, cam_obj, frame_range=(start, end)
+                    )
+                    # view_context=False renders through scene.camera, so every
+                    # job uses its own camera regardless of the viewport view.
+                    result = bpy.ops.render.opengl(
+                        animation=True, sequencer=False,
+                        write_still=False, view_context=False
+                    )
                 if 'CANCELLED' in result:
+                    JobPostProcess.discard()
+                    RenderTelemetry.end_job('CANCELLED')
                     break
+                try:
+                    JobPostProcess.finish()
+                except (RuntimeError, OSError):
+                    # Kept in JobPostProcess.last_error for the render box
+                    RenderTelemetry.end_job('FAILED')
+                    continue
+                RenderTelemetry.end_job()
                 completed += 1
         finally:
+            JobPostProcess.discard()
+            RenderTelemetry.end_batch()
             RenderCleanupManager.restore_settings(context)
             restore_camera_handler()
             apply_cameraide_to_native(context.scene.camera, context.scene)
@@ -108,8 +239,11 @@ class NormalBatchRender:
         self.is_active = False
 
     def start(self, context):
+        JobPostProcess.clear_errors()
         RenderCleanupManager.store_settings(context)
+        self.queue = prepare_normal_queue(context, self.queue)
         disable_camera_handler()
+        RenderTelemetry.start_batch(context, 'NORMAL', self.queue)
 
         if normal_render_complete_handler not in bpy.app.handlers.render_complete:
             bpy.app.handlers.render_complete.append(normal_render_complete_handler)
@@ -122,18 +256,31 @@ class NormalBatchRender:
 
     def start_next_render(self):
         try:
+            # Fill held frames / encode the job that just finished. A failure
+            # is kept in JobPostProcess.last_error; the batch goes on.
+            try:
+                JobPostProcess.finish()
+            except (RuntimeError, OSError):
+                pass
             self.current_index += 1
             if self.current_index >= len(self.queue):
                 self.cleanup()
                 return None
 
             cam_obj, start, end = self.queue[self.current_index]
+            RenderTelemetry.start_job(cam_obj, start, end)
+            profiling.begin_async(self, "render_job", camera=cam_obj.name,
+                                  frame_start=start, frame_end=end, kind='NORMAL')
             context = bpy.context
             context.scene.camera = cam_obj
             RenderCleanupManager.apply_camera_settings(
                 context, cam_obj, frame_range=(start, end)
             )
 
+            if cam_obj.data.cameraide_settings.use_tiled_render:
+                BackgroundRender.start(TiledJob(context, cam_obj, start, end), self.on_tiled_done)
+                return None
+
             # Timers run without a window in context; INVOKE_DEFAULT needs one.
             window = context.window_manager.windows[0]
             with context.temp_override(window=window, screen=window.screen):
@@ -145,16 +292,43 @@ class NormalBatchRender:
         return None
 
     def on_render_complete(self):
+        RenderTelemetry.end_job()
+        profiling.end_async(self, status='FINISHED')
+        self._advance()
+
+    def _advance(self):
         if self.current_index < len(self.queue) - 1:
             bpy.app.timers.register(self.start_next_render, first_interval=0.5)
         else:
             bpy.app.timers.register(self.cleanup, first_interval=0.5)
 
+    def on_tiled_done(self, status, error=None):
+        # Tiled jobs fire no render handlers; BackgroundRender reports instead
+        # and keeps the error of a failed job for the render box
+        if status == 'FINISHED':
+            self.on_render_complete()
+        elif status == 'FAILED':
+            # A failed job doesn't stop the batch, only a cancel does
+            JobPostProcess.discard()
+            RenderTelemetry.end_job('FAILED')
+            profiling.end_async(self, status='FAILED')
+            self._advance()
+        else:
+            self.on_render_cancel()
+
     def on_render_cancel(self):
+        JobPostProcess.discard()
+        RenderTelemetry.end_job('CANCELLED')
+        profiling.end_async(self, status='CANCELLED')
         bpy.app.timers.register(self.cleanup, first_interval=0.5)
 
     def cleanup(self):
         self.is_active = False
+        try:
+            JobPostProcess.finish()
+        except Exception:
+            JobPostProcess.discard()
+        RenderTelemetry.end_batch()
 
         if normal_render_complete_handler in bpy.app.handlers.render_complete:
             bpy.app.handlers.render_complete.remove(normal_render_complete_handler)
@@ -204,6 +378,9 @@ class CAMERA_OT_render_all_normal(Operator):
         if not normal_batch.queue:
             self.report({'WARNING'}, "No cameras with custom settings enabled")
             return {'CANCELLED'}
+        if not run_preflight(self, context, normal_batch.queue):
+            normal_batch.queue = []
+            return {'CANCELLED'}
 
         normal_batch.start(context)
         self.report({'INFO'}, f"Started batch normal render: {len(normal_batch.queue)} jobs")
@@ -211,6 +388,7 @@ class CAMERA_OT_render_all_normal(Operator):
 
 
 def register():
+    bpy.utils.register_class(CAMERAIDE_OT_preflight_check)
     bpy.utils.register_class(CAMERA_OT_render_all_viewport)
     bpy.utils.register_class(CAMERA_OT_render_all_normal)
 
@@ -223,6 +401,11 @@ def unregister():
 
     normal_batch.is_active = False
     restore_camera_handler()
+    JobPostProcess.discard()
+    TransferQueue.shutdown()
+    DerivePool.shutdown()
+    MetricsExporter.shutdown()
 
     bpy.utils.unregister_class(CAMERA_OT_render_all_normal)
     bpy.utils.unregister_class(CAMERA_OT_render_all_viewport)
+    bpy.utils.unregister_class(CAMERAIDE_OT_preflight_check)
@@ -3,7 +3,12 @@ import bpy
 from bpy.types import Operator
 from ..utils.render_manager import RenderCleanupManager
 from ..utils.callbacks import apply_cameraide_to_native
+from ..utils.profiling import span
 from ..render.handlers import add_render_handlers, remove_render_handlers
+from ..render.playblast import apply_fast_playblast
+from ..render.postprocess import JobPostProcess
+from ..render.processes import BackgroundRender
+from .render_tiled import start_tiled_render
 
 
 def _get_target_camera(context):
@@ -25,19 +30,30 @@ class CAMERA_OT_render_selected_viewport(Operator):
         return cam is not None and cam.data.cameraide_settings.use_custom_settings
 
     def execute(self, context):
+        with span("render_selected_viewport", 'render'):
+            return self._execute(context)
+
+    def _execute(self, context):
         cam_obj = _get_target_camera(context)
 
         # OpenGL renders never fire render_complete/render_cancel handlers,
         # so render synchronously and always restore in finally — otherwise
         # the scene frame range and render settings stay modified.
+        JobPostProcess.clear_errors()
         RenderCleanupManager.store_settings(context)
         try:
             context.scene.camera = cam_obj
             RenderCleanupManager.apply_camera_settings(context, cam_obj)
-            bpy.ops.render.opengl(animation=True, sequencer=False,
-                                  write_still=False, view_context=True)
+            apply_fast_playblast(context)
+            result = bpy.ops.render.opengl(animation=True, sequencer=False,
+                                           write_still=False, view_context=True)
+            if 'CANCELLED' in result:
+                JobPostProcess.discard()
+            else:
+                JobPostProcess.finish()
             return {'FINISHED'}
         except Exception as e:
+            JobPostProcess.discard()
             self.report({'ERROR'}, f"Render failed: {e}")
             return {'CANCELLED'}
         finally:
@@ -57,18 +73,32 @@ class CAMERA_OT_render_selected_normal(Operator):
         return cam is not None and cam.data.cameraide_settings.use_custom_settings
 
     def execute(self, context):
+        with span("render_selected_normal", 'render'):
+            return self._execute(context)
+
+    def _execute(self, context):
         cam_obj = _get_target_camera(context)
+        tiled = cam_obj.data.cameraide_settings.use_tiled_render
+        if tiled and BackgroundRender.is_running():
+            self.report({'WARNING'}, "A background render is already running")
+            return {'CANCELLED'}
 
         try:
+            JobPostProcess.clear_errors()
             RenderCleanupManager.store_settings(context)
+            context.scene.camera = cam_obj
+            RenderCleanupManager.apply_camera_settings(context, cam_obj)
+
+            if tiled:
+                scene = context.scene
+                start_tiled_render(context, cam_obj, scene.frame_start, scene.frame_end)
+                self.report({'INFO'}, "Tiled render started")
+                return {'FINISHED'}
+
             # Normal renders do fire render_complete/render_cancel — the
             # handlers restore settings when the render window finishes.
             remove_render_handlers()
             add_render_handlers()
-
-            context.scene.camera = cam_obj
-            RenderCleanupManager.apply_camera_settings(context, cam_obj)
-
             bpy.ops.render.render('INVOKE_DEFAULT', animation=True)
             return {'FINISHED'}
 
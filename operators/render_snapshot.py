@@ -1,9 +1,18 @@
 """Snapshot render operators for Cameraide"""
 import bpy
 from bpy.types import Operator
+from bpy.props import EnumProperty, IntProperty
 from ..utils.render_manager import RenderCleanupManager
 from ..utils.callbacks import apply_cameraide_to_native
+from ..utils.profiling import span
+from ..utils.profiles import effective_settings
 from ..render.handlers import add_render_handlers, remove_render_handlers
+from ..render.processes import BackgroundRender, processes_available
+from ..render.snapshots import SnapshotAllJob
+from ..utils.snapshot_buffer import SnapshotBuffer, SnapshotCompare, save_snapshot
+from ..utils import snapshot_buffer
+from .render_tiled import start_tiled_render
+from .render_batch import disable_camera_handler, restore_camera_handler
 
 VIDEO_FORMATS = {'H264_MP4', 'H264_MKV', 'PRORES_MOV'}
 
@@ -27,8 +36,23 @@ class CAMERA_OT_render_snapshot_viewport(Operator):
         return cam is not None and cam.data.cameraide_settings.use_custom_settings
 
     def execute(self, context):
+        with span("render_snapshot_viewport", 'render'):
+            return self._execute(context)
+
+    def _execute(self, context):
         cam_obj = _get_target_camera(context)
-        settings = cam_obj.data.cameraide_settings
+        settings = effective_settings(cam_obj, context.scene)
+
+        if context.scene.cameraide_batch.snapshot_to_memory:
+            previous = SnapshotBuffer.snapshots(cam_obj.name)
+            snapshot = SnapshotBuffer.capture(context, cam_obj)
+            if snapshot is not None:
+                # Ready to compare with the one before it
+                SnapshotCompare.pick('A', previous[0].id if previous else None)
+                SnapshotCompare.pick('B', snapshot.id)
+                self.report({'INFO'}, f"Snapshot kept in memory ({snapshot.label})")
+                return {'FINISHED'}
+            # No 3D view to draw in: write it like before
 
         if settings.output_format in VIDEO_FORMATS:
             self.report({'INFO'}, f"Camera set to {settings.output_format} - temporarily using PNG for snapshot")
@@ -67,25 +91,38 @@ class CAMERA_OT_render_snapshot_normal(Operator):
         return cam is not None and cam.data.cameraide_settings.use_custom_settings
 
     def execute(self, context):
+        with span("render_snapshot_normal", 'render'):
+            return self._execute(context)
+
+    def _execute(self, context):
         cam_obj = _get_target_camera(context)
-        settings = cam_obj.data.cameraide_settings
+        settings = effective_settings(cam_obj, context.scene)
 
         if settings.output_format in VIDEO_FORMATS:
             self.report({'INFO'}, f"Camera set to {settings.output_format} - temporarily using PNG for snapshot")
 
+        if settings.use_tiled_render and BackgroundRender.is_running():
+            self.report({'WARNING'}, "A background render is already running")
+            return {'CANCELLED'}
+
         try:
             RenderCleanupManager.store_settings(context)
-            # Normal renders fire render_complete/render_cancel — the
-            # handlers restore settings when the render finishes.
-            remove_render_handlers()
-            add_render_handlers()
-
             context.scene.camera = cam_obj
             RenderCleanupManager.apply_camera_settings(
                 context, cam_obj,
                 force_image_format=True, apply_frame_range=False
             )
 
+            if settings.use_tiled_render:
+                frame = context.scene.frame_current
+                start_tiled_render(context, cam_obj, frame, frame)
+                self.report({'INFO'}, "Tiled snapshot started")
+                return {'FINISHED'}
+
+            # Normal renders fire render_complete/render_cancel — the
+            # handlers restore settings when the render finishes.
+            remove_render_handlers()
+            add_render_handlers()
             bpy.ops.render.render('INVOKE_DEFAULT', animation=False, write_still=True)
             return {'FINISHED'}
 
@@ -96,11 +133,173 @@ class CAMERA_OT_render_snapshot_normal(Operator):
             return {'CANCELLED'}
 
 
+def _snapshot_cameras(context):
+    return [obj for obj in context.scene.objects
+            if obj.type == 'CAMERA' and obj.data.cameraide_settings.use_custom_settings]
+
+
+class CAMERA_OT_render_snapshot_all(Operator):
+    """Render the current frame for every Cameraide camera"""
+    bl_idname = "camera.render_snapshot_all"
+    bl_label = "Snapshot All Cameras"
+    bl_description = ("Render the current frame for every Cameraide camera to its output path, "
+                      "in parallel background processes")
+
+    @classmethod
+    def poll(cls, context):
+        return not BackgroundRender.is_running() and bool(_snapshot_cameras(context))
+
+    def execute(self, context):
+        with span("render_snapshot_all", 'render'):
+            return self._execute(context)
+
+    def _execute(self, context):
+        cameras = _snapshot_cameras(context)
+        if not cameras:
+            self.report({'WARNING'}, "No cameras with custom settings enabled")
+            return {'CANCELLED'}
+
+        if not processes_available():
+            return self._render_in_session(context, cameras)
+
+        # Nothing to finish afterwards; a failure is kept in
+        # BackgroundRender.last_status/last_error and shown in the render box
+        try:
+            BackgroundRender.start(SnapshotAllJob(context, cameras), None)
+        except Exception as e:
+            self.report({'ERROR'}, f"Snapshot All failed: {e}")
+            return {'CANCELLED'}
+        finally:
+            apply_cameraide_to_native(context.scene.camera, context.scene)
+        self.report({'INFO'}, f"Snapshot All started: {len(cameras)} cameras")
+        return {'FINISHED'}
+
+    def _render_in_session(self, context, cameras):
+        """Fallback without a Blender binary to launch: render one camera
+        after another, blocking, inside a single store/restore."""
+        RenderCleanupManager.store_settings(context)
+        disable_camera_handler()
+        completed = 0
+        try:
+            for cam_obj in cameras:
+                context.scene.camera = cam_obj
+                RenderCleanupManager.apply_camera_settings(
+                    context, cam_obj,
+                    force_image_format=True, apply_frame_range=False
+                )
+                bpy.ops.render.render(animation=False, write_still=True)
+                completed += 1
+        except Exception as e:
+            self.report({'ERROR'}, f"Render failed: {e}")
+        finally:
+            RenderCleanupManager.restore_settings(context)
+            restore_camera_handler()
+            apply_cameraide_to_native(context.scene.camera, context.scene)
+        self.report({'INFO'}, f"Snapshot All: {completed}/{len(cameras)} cameras done")
+        return {'FINISHED'} if completed else {'CANCELLED'}
+
+
+def _snapshot_camera(context, snapshot):
+    cam_obj = context.scene.objects.get(snapshot.camera)
+    return cam_obj if cam_obj is not None and cam_obj.type == 'CAMERA' else None
+
+
+class CAMERAIDE_OT_snapshot_pick(Operator):
+    """Show a kept snapshot as A or B of the comparison"""
+    bl_idname = "cameraide.snapshot_pick"
+    bl_label = "Pick Snapshot"
+    bl_description = "Compare this snapshot as A or B"
+    bl_options = {'INTERNAL'}
+
+    slot: EnumProperty(items=[('A', "A", ""), ('B', "B", "")])
+    snapshot_id: IntProperty()
+
+    def execute(self, context):
+        SnapshotCompare.pick(self.slot, self.snapshot_id)
+        SnapshotCompare.start()
+        return {'FINISHED'}
+
+
+class CAMERAIDE_OT_snapshot_compare(Operator):
+    """Show or hide the A/B snapshot comparison over the 3D view"""
+    bl_idname = "cameraide.snapshot_compare"
+    bl_label = "Compare Snapshots"
+    bl_description = "Show or hide snapshots A and B over the 3D view"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        if SnapshotCompare.is_active():
+            SnapshotCompare.stop()
+        else:
+            SnapshotCompare.start()
+        return {'FINISHED'}
+
+
+class CAMERAIDE_OT_snapshot_save(Operator):
+    """Write a kept snapshot to its camera's output path"""
+    bl_idname = "cameraide.snapshot_save"
+    bl_label = "Save Snapshot"
+    bl_description = "Write this snapshot as a PNG to the camera's output path"
+    bl_options = {'INTERNAL'}
+
+    snapshot_id: IntProperty()
+
+    def execute(self, context):
+        snapshot = SnapshotBuffer.get(self.snapshot_id)
+        cam_obj = _snapshot_camera(context, snapshot) if snapshot else None
+        if cam_obj is None:
+            self.report({'ERROR'}, "Snapshot or camera no longer exists")
+            return {'CANCELLED'}
+        overwrite = effective_settings(cam_obj, context.scene).overwrite_existing
+        try:
+            path = save_snapshot(snapshot, cam_obj, overwrite)
+        except OSError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Saved {path}")
+        return {'FINISHED'}
+
+
+class CAMERAIDE_OT_snapshot_remove(Operator):
+    """Drop kept snapshots from memory"""
+    bl_idname = "cameraide.snapshot_remove"
+    bl_label = "Remove Snapshot"
+    bl_description = "Drop this snapshot (or, with no snapshot given, all of the camera's)"
+    bl_options = {'INTERNAL'}
+
+    snapshot_id: IntProperty(default=0)
+
+    def execute(self, context):
+        if self.snapshot_id:
+            SnapshotBuffer.remove(self.snapshot_id)
+        else:
+            cam_obj = _get_target_camera(context)
+            SnapshotBuffer.clear(cam_obj.name if cam_obj else None)
+        if SnapshotCompare.a_id is None and SnapshotCompare.b_id is None:
+            SnapshotCompare.stop()
+        return {'FINISHED'}
+
+
+_SNAPSHOT_BUFFER_CLASSES = (
+    CAMERAIDE_OT_snapshot_pick,
+    CAMERAIDE_OT_snapshot_compare,
+    CAMERAIDE_OT_snapshot_save,
+    CAMERAIDE_OT_snapshot_remove,
+)
+
+
 def register():
+    for cls in _SNAPSHOT_BUFFER_CLASSES:
+        bpy.utils.register_class(cls)
     bpy.utils.register_class(CAMERA_OT_render_snapshot_viewport)
     bpy.utils.register_class(CAMERA_OT_render_snapshot_normal)
+    bpy.utils.register_class(CAMERA_OT_render_snapshot_all)
 
 
 def unregister():
+    bpy.utils.unregister_class(CAMERA_OT_render_snapshot_all)
     bpy.utils.unregister_class(CAMERA_OT_render_snapshot_normal)
     bpy.utils.unregister_class(CAMERA_OT_render_snapshot_viewport)
+    for cls in reversed(_SNAPSHOT_BUFFER_CLASSES):
+        bpy.utils.unregister_class(cls)
+    snapshot_buffer.unregister()
@@ -0,0 +1,56 @@
+"""Tiled (region-split) render helpers and operators for Cameraide"""
+import bpy
+from bpy.types import Operator
+from ..utils.render_manager import RenderCleanupManager
+from ..utils.callbacks import apply_cameraide_to_native
+from ..render.postprocess import JobPostProcess
+from ..render.tiles import TiledJob
+from ..render.processes import BackgroundRender
+
+
+def start_tiled_render(context, cam_obj, start, end):
+    """Render the job whose settings were just applied in tiles.
+
+    Runs from a timer like a normal INVOKE_DEFAULT render; when it ends the
+    job is post-processed and the scene settings stored by the caller are
+    restored.
+    """
+    def on_done(status, error):
+        # A failure's error stays in BackgroundRender.last_error for the panel
+        try:
+            if status == 'FINISHED':
+                JobPostProcess.finish()
+            else:
+                JobPostProcess.discard()
+        except (RuntimeError, OSError):
+            pass  # kept in JobPostProcess.last_error for the panel
+        finally:
+            RenderCleanupManager.restore_settings(bpy.context)
+            scene = bpy.context.scene
+            apply_cameraide_to_native(scene.camera, scene)
+
+    BackgroundRender.start(TiledJob(context, cam_obj, start, end), on_done)
+
+
+class CAMERAIDE_OT_cancel_background_render(Operator):
+    """Stop the running background render (tiled render or Snapshot All) and its processes"""
+    bl_idname = "cameraide.cancel_background_render"
+    bl_label = "Cancel Background Render"
+
+    @classmethod
+    def poll(cls, context):
+        return BackgroundRender.is_running()
+
+    def execute(self, context):
+        BackgroundRender.cancel()
+        self.report({'INFO'}, "Background render cancelled")
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(CAMERAIDE_OT_cancel_background_render)
+
+
+def unregister():
+    BackgroundRender.cancel()
+    bpy.utils.unregister_class(CAMERAIDE_OT_cancel_background_render)
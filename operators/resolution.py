@@ -1,6 +1,7 @@
 import bpy
 from bpy.types import Operator
 from ..utils.callbacks import update_viewport_resolution
+from ..utils.profiles import effective_settings
 
 class CAMERA_OT_swap_resolution(Operator):
     bl_idname = "camera.swap_resolution"
@@ -16,7 +17,7 @@ class CAMERA_OT_swap_resolution(Operator):
             self.report({'ERROR'}, "No active camera found")
             return {'CANCELLED'}
 
-        settings = cam.cameraide_settings
+        settings = effective_settings(cam, context.scene)
         settings.resolution_x, settings.resolution_y = settings.resolution_y, settings.resolution_x
         update_viewport_resolution(context)
         return {'FINISHED'}
@@ -3,6 +3,7 @@
 import bpy
 from bpy.types import Menu, Operator
 from bpy.props import EnumProperty, StringProperty
+from ..utils.profiles import effective_settings
 
 # Resolution presets from square to widest aspect ratio
 PRESETS = [
@@ -66,7 +67,7 @@ class CAMERA_OT_resolution_preset_apply(Operator):
             return {'CANCELLED'}
 
         # Apply the preset
-        settings = cam.cameraide_settings
+        settings = effective_settings(cam, context.scene)
         settings.resolution_x = preset[3]  # Width
         settings.resolution_y = preset[4]  # Height
 
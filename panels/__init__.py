@@ -3,7 +3,12 @@ from .sidebar_panel import register as register_sidebar_panel, unregister as unr
 from .camera_list import (
     CAMERAIDE_OT_select_camera,
     CAMERAIDE_OT_add_camera,
-    CAMERAIDE_OT_remove_camera
+    CAMERAIDE_OT_remove_camera,
+    CAMERAIDE_OT_refresh_thumbnails,
+    CAMERAIDE_UL_cameraide_cameras,
+    CAMERAIDE_UL_other_cameras,
+    register_list_index,
+    unregister_list_index
 )
 import bpy
 
@@ -12,13 +17,21 @@ def register():
     bpy.utils.register_class(CAMERAIDE_OT_remove_camera)
     bpy.utils.register_class(CAMERAIDE_OT_add_camera)
     bpy.utils.register_class(CAMERAIDE_OT_select_camera)
+    bpy.utils.register_class(CAMERAIDE_OT_refresh_thumbnails)
+    bpy.utils.register_class(CAMERAIDE_UL_cameraide_cameras)
+    bpy.utils.register_class(CAMERAIDE_UL_other_cameras)
+    register_list_index()
     
     register_sidebar_panel()
 
 def unregister():
     unregister_sidebar_panel()
     
-    # Unregister camera list operators
+    # Unregister camera lists and operators
+    unregister_list_index()
+    bpy.utils.unregister_class(CAMERAIDE_UL_other_cameras)
+    bpy.utils.unregister_class(CAMERAIDE_UL_cameraide_cameras)
+    bpy.utils.unregister_class(CAMERAIDE_OT_refresh_thumbnails)
     bpy.utils.unregister_class(CAMERAIDE_OT_select_camera)
     bpy.utils.unregister_class(CAMERAIDE_OT_add_camera)
     bpy.utils.unregister_class(CAMERAIDE_OT_remove_camera)
\ No newline at end of file
@@ -1,5 +1,7 @@
 import bpy
-from bpy.types import Operator
+from bpy.types import Operator, UIList
+from ..utils import thumbnails
+from ..utils.callbacks import tag_view3d_redraw
 
 
 class CAMERAIDE_OT_remove_camera(Operator):
@@ -96,4 +98,116 @@ class CAMERAIDE_OT_select_camera(Operator):
             result = self._find_layer_collection(child, collection)
             if result:
                 return result
-        return None
\ No newline at end of file
+        return None
+
+
+class CAMERAIDE_OT_refresh_thumbnails(Operator):
+    """Delete cached camera thumbnails and draw them again"""
+    bl_idname = "cameraide.refresh_thumbnails"
+    bl_label = "Refresh Thumbnails"
+
+    def execute(self, context):
+        thumbnails.clear_cache()
+        tag_view3d_redraw()
+        return {'FINISHED'}
+
+
+class _CameraListBase:
+    """Cameras of the scene, filtered from scene.objects.
+
+    Only the rows that fit the list are drawn; filtering is one flag per
+    object, so the sidebar costs the same with ten cameras or a thousand.
+    """
+    friends = True
+    action_op = "cameraide.remove_camera"
+    action_icon = 'X'
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        is_active = context.view_layer.objects.active == item
+        icon_value = 0
+        if context.scene.cameraide_show_thumbnails:
+            icon_value = thumbnails.get_thumbnail_icon(context, item)
+        if icon_value:
+            # Thumbnail is drawn from disk cache, generated in the background
+            row.template_icon(icon_value=icon_value, scale=1.5)
+        op = row.operator(
+            "cameraide.select_camera",
+            text=item.name,
+            icon='RADIOBUT_ON' if is_active else 'RADIOBUT_OFF',
+            depress=is_active
+        )
+        op.camera_name = item.name
+        op = row.operator(self.action_op, text="", icon=self.action_icon)
+        op.camera_name = item.name
+
+    def draw_filter(self, context, layout):
+        # No invert toggle: it would list every object that isn't a camera
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="")
+        row.prop(self, "use_filter_sort_alpha", text="", icon='SORTALPHA')
+        row.prop(self, "use_filter_sort_reverse", text="",
+                 icon='SORT_DESC' if self.use_filter_sort_reverse else 'SORT_ASC')
+
+    def filter_items(self, context, data, propname):
+        objects = getattr(data, propname)
+        helpers = bpy.types.UI_UL_list
+        if self.filter_name:
+            flags = helpers.filter_items_by_name(self.filter_name, self.bitflag_filter_item,
+                                                 objects, "name")
+        else:
+            flags = [self.bitflag_filter_item] * len(objects)
+        for i, obj in enumerate(objects):
+            if flags[i] and (obj.type != 'CAMERA'
+                             or obj.data.cameraide_settings.use_custom_settings != self.friends):
+                flags[i] = 0
+        order = helpers.sort_items_by_name(objects, "name") if self.use_filter_sort_alpha else []
+        return flags, order
+
+
+class CAMERAIDE_UL_cameraide_cameras(_CameraListBase, UIList):
+    """Cameras with Cameraide enabled"""
+
+
+class CAMERAIDE_UL_other_cameras(_CameraListBase, UIList):
+    """Cameras without Cameraide"""
+    friends = False
+    action_op = "cameraide.add_camera"
+    action_icon = 'ADD'
+
+
+def _get_list_index(scene):
+    """The lists highlight the active camera"""
+    obj = bpy.context.view_layer.objects.active
+    if obj is None or obj.type != 'CAMERA':
+        return -1
+    return scene.objects.find(obj.name)
+
+
+def _set_list_index(scene, index):
+    """Clicking a row makes that camera active and the scene camera"""
+    if not 0 <= index < len(scene.objects):
+        return
+    obj = scene.objects[index]
+    if obj.type != 'CAMERA':
+        return
+    view_layer = bpy.context.view_layer
+    if obj.name in view_layer.objects:
+        for selected in view_layer.objects.selected:
+            selected.select_set(False)
+        obj.select_set(True)
+        view_layer.objects.active = obj
+    scene.camera = obj
+
+
+def register_list_index():
+    bpy.types.Scene.cameraide_camera_list_index = bpy.props.IntProperty(
+        get=_get_list_index,
+        set=_set_list_index,
+        options={'SKIP_SAVE'}
+    )
+
+
+def unregister_list_index():
+    if hasattr(bpy.types.Scene, "cameraide_camera_list_index"):
+        del bpy.types.Scene.cameraide_camera_list_index
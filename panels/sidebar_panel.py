@@ -1,6 +1,35 @@
 """Sidebar panel for Cameraide addon"""
 import bpy
 from bpy.types import Panel
+from ..utils.profiling import span
+from ..utils.benchmark import EncoderBenchmark, FormatBenchmark
+from ..render.postprocess import JobPostProcess
+from ..render.processes import BackgroundRender
+from ..render.transfer import TransferQueue
+from ..render.derive import DerivePool
+from ..utils.preflight import Preflight
+from ..utils.snapshot_buffer import SnapshotBuffer, SnapshotCompare
+from ..utils.profiles import effective_settings, setting_owner
+
+# Pre-flight issues listed in the render box
+_PREFLIGHT_LINES = 6
+# Visible rows of the camera lists; longer lists scroll
+_CAMERA_LIST_ROWS = 6
+
+
+def _error_lines(error, tail=2):
+    """First line of an error and the last lines of the log tail it carries"""
+    lines = [line.strip() for line in (error or "").splitlines() if line.strip()]
+    return lines[:1] + lines[1:][-tail:]
+
+
+def _prop(layout, settings, name, **kwargs):
+    """Draw a camera setting from the group holding it (camera or profile)"""
+    layout.prop(setting_owner(settings, name), name, **kwargs)
+
+
+def _prop_enum(layout, settings, name, value, **kwargs):
+    layout.prop_enum(setting_owner(settings, name), name, value, **kwargs)
 
 
 class CAMERAIDE_PT_sidebar_panel(Panel):
@@ -17,6 +46,10 @@ class CAMERAIDE_PT_sidebar_panel(Panel):
         return True
 
     def draw(self, context):
+        with span("sidebar_panel.draw", 'ui'):
+            self._draw(context)
+
+    def _draw(self, context):
         layout = self.layout
 
         # Get active camera
@@ -32,7 +65,7 @@ class CAMERAIDE_PT_sidebar_panel(Panel):
             layout.label(text="No active camera in the scene")
             return
 
-        settings = cam.cameraide_settings
+        settings = effective_settings(cam, context.scene)
 
         # Befriend button — normal height
         self._draw_befriend_button(layout, settings, camera_name)
@@ -42,11 +75,15 @@ class CAMERAIDE_PT_sidebar_panel(Panel):
 
         # Settings sections (no separator between them)
         if settings.use_custom_settings:
+            self._draw_profile(layout, settings, context)
             self._draw_resolution_settings(layout, settings, context)
             self._draw_frame_range_settings(layout, settings, cam_obj, context)
             self._draw_file_output_settings(layout, settings, context)
             self._draw_format_settings(layout, settings, context)
-            self._draw_render_buttons(layout)
+            self._draw_quality_settings(layout, settings, context)
+            self._draw_render_buttons(layout, context)
+            self._draw_snapshots(layout, context, cam_obj)
+            self._draw_telemetry(layout, context)
 
     def _draw_befriend_button(self, layout, settings, camera_name):
         row = layout.row()
@@ -59,17 +96,22 @@ class CAMERAIDE_PT_sidebar_panel(Panel):
                         icon='DECORATE')
 
     def _draw_camera_list(self, layout, context):
-        all_cameras = [obj for obj in context.scene.objects if obj.type == 'CAMERA']
-        if not all_cameras:
-            return
-
-        cameraide_cameras = [c for c in all_cameras if c.data.cameraide_settings.use_custom_settings]
-        other_cameras = [c for c in all_cameras if not c.data.cameraide_settings.use_custom_settings]
-
         scene = context.scene
+        # Which sections to show; stops at the first camera of each kind
+        has_friends = has_others = False
+        for obj in scene.objects:
+            if obj.type == 'CAMERA':
+                if obj.data.cameraide_settings.use_custom_settings:
+                    has_friends = True
+                else:
+                    has_others = True
+                if has_friends and has_others:
+                    break
+        if not (has_friends or has_others):
+            return
 
         # Cameraide cameras section
-        if cameraide_cameras:
+        if has_friends:
             box = layout.box()
             row = box.row(align=True)
             row.prop(scene, "cameraide_show_cameraide_list",
@@ -77,25 +119,17 @@ class CAMERAIDE_PT_sidebar_panel(Panel):
                 icon='TRIA_DOWN' if scene.cameraide_show_cameraide_list else 'TRIA_RIGHT',
                 emboss=False
             )
+            row.prop(scene, "cameraide_show_thumbnails", text="", icon='IMAGE_DATA', emboss=False)
+            if scene.cameraide_show_thumbnails:
+                row.operator("cameraide.refresh_thumbnails", text="", icon='FILE_REFRESH', emboss=False)
             row.label(text="", icon='FUND')
 
             if scene.cameraide_show_cameraide_list:
-                col = box.column(align=True)
-                for cam_item in cameraide_cameras:
-                    row = col.row(align=True)
-                    is_active = context.view_layer.objects.active == cam_item
-                    op = row.operator(
-                        "cameraide.select_camera",
-                        text=cam_item.name,
-                        icon='RADIOBUT_ON' if is_active else 'RADIOBUT_OFF',
-                        depress=is_active
-                    )
-                    op.camera_name = cam_item.name
-                    op = row.operator("cameraide.remove_camera", text="", icon='X')
-                    op.camera_name = cam_item.name
+                box.template_list("CAMERAIDE_UL_cameraide_cameras", "", scene, "objects",
+                                  scene, "cameraide_camera_list_index", rows=_CAMERA_LIST_ROWS)
 
         # Other cameras section
-        if other_cameras:
+        if has_others:
             box = layout.box()
             row = box.row(align=True)
             row.prop(scene, "cameraide_show_other_list",
@@ -106,19 +140,37 @@ class CAMERAIDE_PT_sidebar_panel(Panel):
             row.label(text="", icon='CAMERA_DATA')
 
             if scene.cameraide_show_other_list:
-                col = box.column(align=True)
-                for cam_item in other_cameras:
-                    row = col.row(align=True)
-                    is_active = context.view_layer.objects.active == cam_item
-                    op = row.operator(
-                        "cameraide.select_camera",
-                        text=cam_item.name,
-                        icon='RADIOBUT_ON' if is_active else 'RADIOBUT_OFF',
-                        depress=is_active
-                    )
-                    op.camera_name = cam_item.name
-                    op = row.operator("cameraide.add_camera", text="", icon='ADD')
-                    op.camera_name = cam_item.name
+                box.template_list("CAMERAIDE_UL_other_cameras", "", scene, "objects",
+                                  scene, "cameraide_camera_list_index", rows=_CAMERA_LIST_ROWS)
+
+        # Bulk actions on the selected cameras
+        row = layout.row(align=True)
+        op = row.operator("cameraide.bulk_befriend", text="Befriend Selected", icon='FUND')
+        op.action = 'BEFRIEND'
+        op.target = 'SELECTED'
+        op = row.operator("cameraide.bulk_befriend", text="", icon='X')
+        op.action = 'UNFRIEND'
+        op.target = 'SELECTED'
+        row.operator("cameraide.bulk_set_setting", text="", icon='PROPERTIES')
+
+    def _draw_profile(self, layout, settings, context):
+        scene = context.scene
+        row = layout.row(align=True)
+        row.prop_search(setting_owner(settings, "profile"), "profile", scene, "cameraide_profiles",
+                        text="", icon='PRESET')
+        row.operator("cameraide.profile_new", text="", icon='DUPLICATE')
+        if not settings.profile:
+            return
+        if scene.cameraide_profiles.get(settings.profile) is None:
+            layout.label(text=f"Profile '{settings.profile}' not found: using own settings", icon='ERROR')
+        row.operator("cameraide.profile_detach", text="", icon='UNLINKED')
+        row.operator("cameraide.profile_remove", text="", icon='X')
+        row.prop(scene, "cameraide_show_profile_overrides", text="", icon='MODIFIER')
+        if scene.cameraide_show_profile_overrides:
+            box = layout.box()
+            box.label(text="Own settings on this camera:")
+            box.grid_flow(columns=2, align=True).prop(
+                setting_owner(settings, "profile_overrides"), "profile_overrides", expand=True)
 
     def _draw_resolution_settings(self, layout, settings, context):
         scene = context.scene
@@ -140,12 +192,20 @@ class CAMERAIDE_PT_sidebar_panel(Panel):
 
         row = col.row(align=True)
         split = row.split(factor=0.43, align=True)
-        split.prop(settings, "resolution_x")
+        _prop(split, settings, "resolution_x")
         subsplit = split.split(factor=0.16, align=True)
         subsplit.operator("camera.swap_resolution", text="", icon='ARROW_LEFTRIGHT')
-        subsplit.prop(settings, "resolution_y")
+        _prop(subsplit, settings, "resolution_y")
+
+        _prop(col, settings, "resolution_percentage", slider=True)
 
-        col.prop(settings, "resolution_percentage", slider=True)
+        col.separator(factor=0.5)
+        row = col.row(align=True)
+        _prop(row, settings, "use_tiled_render", icon='MESH_GRID')
+        sub = row.row(align=True)
+        sub.active = settings.use_tiled_render
+        _prop(sub, settings, "tiles_x", text="X")
+        _prop(sub, settings, "tiles_y", text="Y")
 
     def _draw_frame_range_settings(self, layout, settings, cam_obj, context):
         scene = context.scene
@@ -170,7 +230,7 @@ class CAMERAIDE_PT_sidebar_panel(Panel):
         has_markers = get_marker_count(cam_obj) > 0
         current_mode = settings.frame_range_mode
 
-        col.prop(settings, "frame_range_mode", text="")
+        _prop(col, settings, "frame_range_mode", text="")
 
         if current_mode == 'PER_CAMERA' and has_markers:
             self._draw_timeline_mode_warning(col, cam_obj)
@@ -232,11 +292,12 @@ class CAMERAIDE_PT_sidebar_panel(Panel):
             col.separator(factor=0.5)
             row = col.row(align=True)
             row.enabled = False
-            row.prop(settings, "frame_start")
-            row.prop(settings, "frame_end")
+            _prop(row, settings, "frame_start")
+            _prop(row, settings, "frame_end")
             row = col.row(align=True)
             row.enabled = False
-            row.prop(settings, "frame_step")
+            _prop(row, settings, "frame_step")
+            _prop(col, settings, "hold_frames")
 
     def _draw_percamera_mode_ui(self, col, settings):
         # With sync off the render uses the timeline range, so these
@@ -244,9 +305,11 @@ class CAMERAIDE_PT_sidebar_panel(Panel):
         sub = col.column(align=True)
         sub.enabled = settings.sync_frame_range
         row = sub.row(align=True)
-        row.prop(settings, "frame_start")
-        row.prop(settings, "frame_end")
-        sub.prop(settings, "frame_step")
+        _prop(row, settings, "frame_start")
+        _prop(row, settings, "frame_end")
+        _prop(sub, settings, "frame_step")
+        # Hold applies to whatever range renders, synced or not
+        _prop(col, settings, "hold_frames")
         col.operator("camera.toggle_frame_range_sync",
             text="Sync " + ("ON" if settings.sync_frame_range else "OFF"),
             icon='PREVIEW_RANGE',
@@ -266,9 +329,9 @@ class CAMERAIDE_PT_sidebar_panel(Panel):
             return
 
         col = box.column(align=True)
-        col.prop(settings, "output_path", text="")
-        col.prop(settings, "output_subfolder", text="")
-        col.prop(settings, "output_filename", text="")
+        _prop(col, settings, "output_path", text="")
+        _prop(col, settings, "output_subfolder", text="")
+        _prop(col, settings, "output_filename", text="")
 
         # Advanced sub-group
         adv_box = col.box()
@@ -280,9 +343,12 @@ class CAMERAIDE_PT_sidebar_panel(Panel):
         )
         if scene.cameraide_show_file_output_advanced:
             adv_col = adv_box.column(align=True)
-            adv_col.prop(settings, "overwrite_existing")
-            adv_col.prop(settings, "include_camera_name")
-            adv_col.prop(settings, "burn_metadata")
+            _prop(adv_col, settings, "overwrite_existing")
+            _prop(adv_col, settings, "include_camera_name")
+            _prop(adv_col, settings, "burn_metadata")
+            _prop(adv_col, settings, "use_local_scratch")
+            if settings.use_local_scratch:
+                adv_col.prop(scene.cameraide_batch, "scratch_path", text="")
 
     def _draw_format_settings(self, layout, settings, context):
         scene = context.scene
@@ -301,15 +367,17 @@ class CAMERAIDE_PT_sidebar_panel(Panel):
 
         # Row 1: image formats
         row = col.row(align=True)
-        row.prop_enum(settings, "output_format", 'PNG',      text="PNG")
-        row.prop_enum(settings, "output_format", 'JPEG',     text="JPEG")
-        row.prop_enum(settings, "output_format", 'OPEN_EXR', text="EXR")
+        _prop_enum(row, settings, "output_format", 'PNG',      text="PNG")
+        _prop_enum(row, settings, "output_format", 'JPEG',     text="JPEG")
+        _prop_enum(row, settings, "output_format", 'OPEN_EXR', text="EXR")
 
         # Row 2: all video formats together
         row = col.row(align=True)
-        row.prop_enum(settings, "output_format", 'H264_MP4',  text="MP4")
-        row.prop_enum(settings, "output_format", 'H264_MKV',  text="MKV")
-        row.prop_enum(settings, "output_format", 'PRORES_MOV', text="MOV")
+        _prop_enum(row, settings, "output_format", 'H264_MP4',  text="MP4")
+        _prop_enum(row, settings, "output_format", 'H264_MKV',  text="MKV")
+        _prop_enum(row, settings, "output_format", 'PRORES_MOV', text="MOV")
+
+        self._draw_format_recommendation(col, settings)
 
         col.separator(factor=0.5)
 
@@ -323,7 +391,7 @@ class CAMERAIDE_PT_sidebar_panel(Panel):
         )
         if scene.cameraide_show_format_advanced:
             adv_col = adv_box.column(align=True)
-            adv_col.prop(settings, "film_transparent")
+            _prop(adv_col, settings, "film_transparent")
             if settings.output_format == 'PNG':
                 self._draw_png_settings(adv_col, settings)
             elif settings.output_format == 'JPEG':
@@ -331,41 +399,153 @@ class CAMERAIDE_PT_sidebar_panel(Panel):
             elif settings.output_format == 'OPEN_EXR':
                 self._draw_exr_settings(adv_col, settings)
             elif settings.output_format in {'H264_MP4', 'H264_MKV'}:
-                self._draw_h264_settings(adv_col, settings)
+                self._draw_h264_settings(adv_col, settings, context)
             elif settings.output_format == 'PRORES_MOV':
-                self._draw_prores_settings(adv_col, settings)
+                self._draw_prores_settings(adv_col, settings, context)
+
+        self._draw_output_targets(col, settings)
+
+    def _draw_format_recommendation(self, col, settings):
+        recommendation = FormatBenchmark.recommend(settings)
+        row = col.row(align=True)
+        if recommendation is None:
+            row.operator("cameraide.benchmark_formats", icon='TIME')
+            return
+        option = recommendation['option']
+        if option is recommendation['current']:
+            row.label(text=f"Fastest: {option['label']} (current)", icon='CHECKMARK')
+        else:
+            row.label(text=f"Fastest: {option['label']}", icon='TIME')
+            row.operator("cameraide.apply_format_recommendation", text="Use")
+        row.operator("cameraide.benchmark_formats", text="", icon='FILE_REFRESH')
+        res_x, res_y = recommendation['resolution']
+        col.label(text=f"{option['write'] * 1000:.0f} ms write, {option['read'] * 1000:.0f} ms read, "
+                       f"{option['bytes'] / 1e6:.1f} MB per frame at {res_x}x{res_y}")
+        current = recommendation['current']
+        if current and current is not option:
+            col.label(text=f"Current: {current['write'] * 1000:.0f} ms write, "
+                           f"{current['bytes'] / 1e6:.1f} MB")
+
+    def _draw_output_targets(self, col, settings):
+        row = col.row(align=True)
+        row.label(text="Proxies")
+        _prop(row, settings, "proxy_sizes")
+        if settings.proxy_sizes:
+            _prop(col, settings, "proxy_format", text="")
+
+        row = col.row(align=True)
+        row.label(text="Extra Outputs")
+        row.operator("cameraide.output_target_add", text="", icon='ADD')
+        for index, target in enumerate(settings.output_targets):
+            target_box = col.box()
+            row = target_box.row(align=True)
+            row.prop(target, "enabled", text="")
+            row.prop(target, "output_format", text="")
+            row.prop(target, "subfolder", text="")
+            op = row.operator("cameraide.output_target_remove", text="", icon='X')
+            op.index = index
+            if not target.enabled:
+                continue
+            row = target_box.row(align=True)
+            if target.output_format == 'PNG':
+                row.prop(target, "png_color_depth", text="")
+            elif target.output_format == 'JPEG':
+                row.prop(target, "jpeg_quality", slider=True)
+            elif target.output_format == 'OPEN_EXR':
+                row.prop(target, "exr_color_depth", text="")
+                row.prop(target, "exr_codec", text="")
+            elif target.output_format in {'H264_MP4', 'H264_MKV'}:
+                row.prop(target, "video_quality", text="")
+                row.prop(target, "video_bitrate")
 
     def _draw_png_settings(self, col, settings):
         row = col.row(align=True)
-        row.prop(settings, "png_color_depth", text="")
-        row.prop(settings, "png_compression", slider=True)
+        _prop(row, settings, "png_color_depth", text="")
+        _prop(row, settings, "png_compression", slider=True)
 
     def _draw_jpeg_settings(self, col, settings):
-        col.prop(settings, "jpeg_quality", slider=True)
+        _prop(col, settings, "jpeg_quality", slider=True)
 
     def _draw_exr_settings(self, col, settings):
         row = col.row(align=True)
-        row.prop(settings, "exr_color_depth", text="")
-        row.prop(settings, "exr_codec", text="")
+        _prop(row, settings, "exr_color_depth", text="")
+        _prop(row, settings, "exr_codec", text="")
 
-    def _draw_h264_settings(self, col, settings):
-        col.prop(settings, "video_quality", text="Quality")
+    def _draw_h264_settings(self, col, settings, context):
+        _prop(col, settings, "video_quality", text="Quality")
         row = col.row(align=True)
-        row.prop(settings, "video_bitrate")
-        row.prop(settings, "video_gopsize")
-        col.separator(factor=0.5)
+        _prop(row, settings, "video_bitrate")
+        _prop(row, settings, "video_gopsize")
         row = col.row(align=True)
-        row.prop(settings, "audio_codec", text="")
-        if settings.audio_codec != 'NONE':
-            row.prop(settings, "audio_bitrate")
+        _prop(row, settings, "video_encoder_speed", text="")
+        _prop(row, settings, "use_max_b_frames", text="", icon='IPO_BEZIER')
+        sub = row.row(align=True)
+        sub.active = settings.use_max_b_frames
+        _prop(sub, settings, "max_b_frames", text="B-Frames")
+        self._draw_encoder_benchmark(col)
+        col.separator(factor=0.5)
+        self._draw_audio_settings(col, settings, context)
 
-    def _draw_prores_settings(self, col, settings):
+    def _draw_audio_settings(self, col, settings, context):
         row = col.row(align=True)
-        row.prop(settings, "audio_codec", text="")
+        _prop(row, settings, "use_audio", text="", icon='SOUND')
+        sub = row.row(align=True)
+        sub.active = settings.use_audio
+        _prop(sub, settings, "audio_codec", text="")
         if settings.audio_codec != 'NONE':
-            row.prop(settings, "audio_bitrate")
+            _prop(sub, settings, "audio_bitrate")
+        if settings.use_audio and settings.audio_codec != 'NONE':
+            col.prop(context.scene.cameraide_batch, "ffmpeg_path")
+
+    def _draw_encoder_benchmark(self, col):
+        col.operator("cameraide.benchmark_encoder", icon='TIME')
+        result = EncoderBenchmark.last_result
+        if not result:
+            return
+        res_x, res_y = result['resolution']
+        col.label(text=f"{result['camera']}: {result['frames']} frames at {res_x}x{res_y}")
+        for profile in result['profiles']:
+            row = col.row(align=True)
+            row.label(text=profile['name'])
+            row.label(text=f"{profile['fps']} fps")
+            row.label(text=f"{profile['bytes'] / 1e6:.1f} MB")
 
-    def _draw_render_buttons(self, layout):
+    def _draw_prores_settings(self, col, settings, context):
+        self._draw_audio_settings(col, settings, context)
+
+    def _draw_quality_settings(self, layout, settings, context):
+        scene = context.scene
+        box = layout.box()
+        row = box.row(align=True)
+        row.prop(scene, "cameraide_show_quality",
+            text="Render Quality",
+            icon='TRIA_DOWN' if scene.cameraide_show_quality else 'TRIA_RIGHT',
+            emboss=False
+        )
+
+        if not scene.cameraide_show_quality:
+            return
+
+        col = box.column(align=True)
+        _prop(col, settings, "quality_tier", text="")
+        if settings.quality_tier == 'CUSTOM':
+            row = col.row(align=True)
+            _prop(row, settings, "quality_samples")
+            _prop(row, settings, "quality_noise_threshold", text="Noise")
+            row = col.row(align=True)
+            _prop(row, settings, "quality_max_bounces", text="Bounces")
+            _prop(row, settings, "quality_time_limit")
+            row = col.row(align=True)
+            _prop(row, settings, "quality_denoise")
+            sub = row.row(align=True)
+            sub.enabled = settings.quality_denoise
+            _prop(sub, settings, "quality_denoiser", text="")
+        elif settings.quality_tier != 'SCENE':
+            _prop(col, settings, "quality_denoiser", text="")
+        if settings.quality_tier != 'SCENE' and scene.render.engine not in {'CYCLES', 'BLENDER_EEVEE', 'BLENDER_EEVEE_NEXT'}:
+            col.label(text="Not used by the current engine", icon='INFO')
+
+    def _draw_render_buttons(self, layout, context):
         box = layout.box()
         split = box.split(factor=0.5, align=True)
 
@@ -385,17 +565,206 @@ class CAMERAIDE_PT_sidebar_panel(Panel):
         col_nr.operator("camera.render_selected_normal", text="Playblast",   icon='RENDER_ANIMATION')
         col_nr.operator("camera.render_all_normal",      text="All Cameras", icon='CAMERA_DATA')
 
+        row = box.row(align=True)
+        row.scale_y = 1.3
+        row.operator("camera.render_snapshot_all", text="Snapshot All Cameras", icon='IMAGE_REFERENCE')
+
+        batch = context.scene.cameraide_batch
+        row = box.row(align=True)
+        row.prop(batch, "use_fast_playblast")
+        row.prop(batch, "use_persistent_batch")
+        if batch.use_fast_playblast:
+            col = box.column(align=True)
+            col.prop(batch, "playblast_shading", text="")
+            row = col.row(align=True)
+            row.prop(batch, "playblast_simplify_subdivision")
+            row.prop(batch, "playblast_simplify_particles")
+            col.prop(batch, "playblast_hide_overlays")
+            col.prop(batch, "playblast_disable_compositing")
+            col.prop(batch, "playblast_disable_sequencer")
+            col.prop(batch, "playblast_standard_view")
+
+        col = box.column(align=True)
+        col.prop(batch, "max_processes")
+        row = col.row(align=True)
+        row.prop(batch, "use_memory_limit")
+        sub = row.row(align=True)
+        sub.active = batch.use_memory_limit
+        sub.prop(batch, "memory_budget_gb")
+        if BackgroundRender.is_running():
+            done, total = BackgroundRender.progress()
+            label, unit = BackgroundRender.describe()
+            row = box.row(align=True)
+            row.label(text=f"{label}: {done}/{total} {unit}", icon='MESH_GRID')
+            row.operator("cameraide.cancel_background_render", text="", icon='CANCEL')
+        elif BackgroundRender.last_status == 'FAILED':
+            col = box.column(align=True)
+            col.label(text=f"Last {BackgroundRender.last_label.lower()} failed", icon='ERROR')
+            for line in _error_lines(BackgroundRender.last_error):
+                col.label(text=line)
+        pending = TransferQueue.pending_files()
+        if pending:
+            box.label(text=f"Moving {pending} files to output", icon='EXPORT')
+        if JobPostProcess.last_error:
+            col = box.column(align=True)
+            col.label(text="Last job's post-processing failed", icon='ERROR')
+            for line in _error_lines(JobPostProcess.last_error):
+                col.label(text=line)
+        if TransferQueue.failed_files:
+            col = box.column(align=True)
+            col.label(text=f"{TransferQueue.failed_files} files could not be moved (left in scratch)",
+                      icon='ERROR')
+            col.label(text=TransferQueue.last_error)
+        deriving = DerivePool.pending_outputs()
+        if deriving:
+            box.label(text=f"Writing {deriving} extra outputs", icon='FILE_MOVIE')
+        if DerivePool.failed_outputs:
+            col = box.column(align=True)
+            col.label(text=f"{DerivePool.failed_outputs} extra outputs failed", icon='ERROR')
+            for line in _error_lines(DerivePool.last_error):
+                col.label(text=line)
+
+        self._draw_preflight(box, context.scene)
+        box.operator("cameraide.export_manifest", text="Export Manifest", icon='EXPORT')
+
+    def _draw_snapshots(self, layout, context, cam_obj):
+        batch = context.scene.cameraide_batch
+        snapshots = SnapshotBuffer.snapshots(cam_obj.name)
+        box = layout.box()
+        row = box.row(align=True)
+        row.prop(batch, "snapshot_to_memory", text="Viewport Snapshots in Memory")
+        if batch.snapshot_to_memory:
+            row = box.row(align=True)
+            row.prop(batch, "snapshot_history")
+            row.prop(batch, "snapshot_memory_mb")
+        if not snapshots:
+            return
+
+        row = box.row(align=True)
+        row.label(text=f"{len(snapshots)} kept · {SnapshotBuffer.total_bytes() / 1048576:.0f} MB total")
+        row.operator("cameraide.snapshot_compare", text="", icon='SPLIT_HORIZONTAL',
+                     depress=SnapshotCompare.is_active())
+        row.operator("cameraide.snapshot_remove", text="", icon='TRASH').snapshot_id = 0
+        if SnapshotCompare.is_active():
+            row = box.row(align=True)
+            row.prop(batch, "compare_mode", expand=True)
+            if batch.compare_mode == 'WIPE':
+                box.prop(batch, "compare_wipe", slider=True)
+
+        col = box.column(align=True)
+        for snapshot in snapshots:
+            row = col.row(align=True)
+            row.label(text=snapshot.label)
+            for slot, current in (('A', SnapshotCompare.a_id), ('B', SnapshotCompare.b_id)):
+                op = row.operator("cameraide.snapshot_pick", text=slot, depress=current == snapshot.id)
+                op.slot = slot
+                op.snapshot_id = snapshot.id
+            row.operator("cameraide.snapshot_save", text="", icon='FILE_TICK').snapshot_id = snapshot.id
+            row.operator("cameraide.snapshot_remove", text="", icon='X').snapshot_id = snapshot.id
+
+    def _draw_preflight(self, box, scene):
+        batch = scene.cameraide_batch
+        row = box.row(align=True)
+        row.prop(batch, "preflight_mode", text="")
+        row.operator("cameraide.preflight_check", text="Check Queue", icon='CHECKMARK')
+        report = Preflight.last_report
+        if report is None:
+            return
+        col = box.column(align=True)
+        if not report.issues:
+            col.label(text=f"Pre-flight: {report.jobs} jobs, no problems", icon='CHECKMARK')
+            return
+        col.label(text=f"Pre-flight: {report.summary()}",
+                  icon='ERROR' if report.errors else 'INFO')
+        shown = report.errors + report.warnings
+        expanded = scene.cameraide_show_preflight_issues
+        for issue in shown if expanded else shown[:_PREFLIGHT_LINES]:
+            prefix = f"{issue['camera']}: " if issue['camera'] else ""
+            col.label(text=prefix + issue['message'],
+                      icon='CANCEL' if issue['severity'] == 'ERROR' else 'DOT')
+        if len(shown) > _PREFLIGHT_LINES:
+            col.prop(scene, "cameraide_show_preflight_issues",
+                     text="Show fewer" if expanded else f"{len(shown) - _PREFLIGHT_LINES} more",
+                     icon='TRIA_UP' if expanded else 'TRIA_DOWN', emboss=False)
+
+
+    def _draw_telemetry(self, layout, context):
+        scene = context.scene
+        box = layout.box()
+        row = box.row(align=True)
+        row.prop(scene, "cameraide_show_telemetry",
+            text="Telemetry",
+            icon='TRIA_DOWN' if scene.cameraide_show_telemetry else 'TRIA_RIGHT',
+            emboss=False
+        )
+        row.prop(scene.cameraide_batch, "use_telemetry", text="")
+
+        if not scene.cameraide_show_telemetry:
+            return
+
+        col = box.column(align=True)
+        col.prop(scene.cameraide_batch, "telemetry_dir", text="")
+
+        from ..utils import profiling
+        recording = profiling.is_recording()
+        row = col.row(align=True)
+        row.prop(scene.cameraide_batch, "trace_path", text="")
+        row.operator("cameraide.toggle_trace", text="",
+                     icon='REC' if recording else 'RADIOBUT_OFF', depress=recording)
+
+        batch = scene.cameraide_batch
+        row = col.row(align=True)
+        row.prop(batch, "use_metrics", text="Live Metrics")
+        sub = row.row(align=True)
+        sub.active = batch.use_metrics
+        sub.prop(batch, "metrics_port", text="Port")
+        if batch.use_metrics:
+            col.prop(batch, "metrics_status_file", text="")
+            from ..utils.metrics import MetricsExporter
+            if MetricsExporter.is_serving():
+                col.label(text=f"http://127.0.0.1:{MetricsExporter.port}/metrics", icon='URL')
+            elif MetricsExporter.error:
+                col.label(text=f"Endpoint unavailable: {MetricsExporter.error}", icon='ERROR')
+
+        from ..utils.telemetry import RenderTelemetry
+        summary = RenderTelemetry.last_summary
+        if not summary:
+            col.label(text="No batch recorded yet", icon='INFO')
+            return
+
+        table = box.column(align=True)
+        table.scale_y = 0.8
+        header = table.row(align=True)
+        for text in ("Camera", "Frames", "s/frame", "MB", "RSS MB"):
+            header.label(text=text)
+        for job in summary:
+            row = table.row(align=True)
+            row.alert = job['status'] != 'FINISHED'
+            row.label(text=job['camera'])
+            row.label(text=str(job['frames']))
+            row.label(text=f"{job['mean_frame_seconds']:.2f}")
+            row.label(text=f"{job['bytes'] / 1048576:.1f}")
+            peak = job['peak_rss']
+            row.label(text=f"{peak / 1048576:.0f}" if peak else "-")
+        total_wall = sum(job['wall_seconds'] for job in summary)
+        table.label(text=f"{len(summary)} jobs · {total_wall:.1f} s total")
+
 
 # Panel open/close state — scene-level so it is shared across all cameras
 _UI_TOGGLES = {
     'cameraide_show_cameraide_list': True,
     'cameraide_show_other_list': False,
+    'cameraide_show_thumbnails': True,
+    'cameraide_show_profile_overrides': False,
     'cameraide_show_resolution': True,
     'cameraide_show_frame_range': True,
     'cameraide_show_file_output': True,
     'cameraide_show_format_settings': True,
     'cameraide_show_file_output_advanced': False,
     'cameraide_show_format_advanced': False,
+    'cameraide_show_quality': False,
+    'cameraide_show_telemetry': False,
+    'cameraide_show_preflight_issues': False,
 }
 
 
@@ -10,18 +10,124 @@ This file remains unchanged from the original.
 
 import bpy
 from bpy.props import (IntProperty, StringProperty, EnumProperty, 
-                      BoolProperty, PointerProperty, FloatProperty)
+                      BoolProperty, PointerProperty, FloatProperty,
+                      CollectionProperty)
 from bpy.types import PropertyGroup
 from .utils.callbacks import (
     update_frame_start, 
-    update_frame_end
+    update_frame_end,
+    update_profile,
+    update_redraw
 )
+from .utils.profiles import SHARED_SETTINGS
 
 def update_custom_settings(self, context):
     """Callback when use_custom_settings is toggled"""
     if self.use_custom_settings and not hasattr(self, '_frame_range_mode'):
         self.frame_range_mode = 'PER_CAMERA'
 
+
+OUTPUT_FORMAT_ITEMS = [
+    ('PNG', "PNG", "PNG Format\n• Color Depth: 8/16-bit\n• Lossless compression\n• Alpha support"),
+    ('JPEG', "JPEG", "JPEG Format\n• 8-bit color depth\n• Quality: 90%\n• Lossy compression"),
+    ('OPEN_EXR', "EXR", "OpenEXR Format\n• Color Depth: 16/32-bit float\n• Multiple compression options\n• HDR support\n• Alpha support"),
+    ('H264_MP4', "MP4 H264", "MP4 with H.264\n• Standard MP4 container\n• H.264 codec\n• Universal compatibility"),
+    ('H264_MKV', "MKV H264", "MKV with H.264\n• Matroska container\n• H.264 codec\n• Open format"),
+    ('PRORES_MOV', "MOV ProRes", "MOV with ProRes 4444\n• QuickTime container\n• ProRes 4444 codec\n• Professional editing\n• Alpha support"),
+]
+
+EXR_CODEC_ITEMS = [
+    ('NONE', "None", "No compression"),
+    ('PXR24', "Pxr24 (lossy)", "Pxr24 compression (lossy)"),
+    ('ZIP', "ZIP (lossless)", "ZIP compression (lossless)"),
+    ('PIZ', "PIZ (lossless)", "PIZ compression (lossless)"),
+    ('RLE', "RLE (lossless)", "Run-length encoding (lossless)"),
+    ('ZIPS', "ZIPS (lossless)", "ZIPS compression (lossless)"),
+    ('B44', "B44 (lossy)", "B44 compression (lossy)"),
+    ('B44A', "B44A (lossy)", "B44A compression (lossy)"),
+    ('DWAA', "DWAA (lossy)", "DWAA compression (lossy)"),
+    ('DWAB', "DWAB (lossy)", "DWAB compression (lossy)"),
+]
+
+VIDEO_QUALITY_ITEMS = [
+    ('LOSSLESS', 'Lossless', 'Lossless encoding (huge files)'),
+    ('PERC_LOSSLESS', 'Perceptually Lossless', 'High quality, nearly lossless'),
+    ('HIGH', 'High Quality', 'High quality (recommended)'),
+    ('MEDIUM', 'Medium Quality', 'Medium quality'),
+    ('LOW', 'Low Quality', 'Low quality'),
+]
+
+PROFILE_OVERRIDE_ITEMS = [
+    (name, label, f"Use this camera's own {label} instead of the profile's")
+    for name, label in SHARED_SETTINGS
+]
+
+
+class CameraideOutputTarget(PropertyGroup):
+    """An extra deliverable derived from a camera's rendered frames"""
+    enabled: BoolProperty(
+        name="Enabled",
+        description="Write this output after the camera's renders",
+        default=True
+    )
+    output_format: EnumProperty(
+        name="Format",
+        description="File format of this output",
+        items=OUTPUT_FORMAT_ITEMS,
+        default='H264_MP4'
+    )
+    subfolder: StringProperty(
+        name="Subfolder",
+        description="Folder for this output, relative to the camera's output folder",
+        default="review"
+    )
+    png_color_depth: EnumProperty(
+        name="Color Depth",
+        description="Color depth for PNG output",
+        items=[
+            ('8', "8", "8-bit"),
+            ('16', "16", "16-bit"),
+        ],
+        default='8'
+    )
+    jpeg_quality: IntProperty(
+        name="Quality",
+        description="JPEG quality level",
+        min=0,
+        max=100,
+        default=90,
+        subtype='PERCENTAGE'
+    )
+    exr_color_depth: EnumProperty(
+        name="Color Depth",
+        description="Color depth for EXR output",
+        items=[
+            ('16', "Half", "16-bit float"),
+            ('32', "Full", "32-bit float"),
+        ],
+        default='16'
+    )
+    exr_codec: EnumProperty(
+        name="Codec",
+        description="Compression method for EXR output",
+        items=EXR_CODEC_ITEMS,
+        default='ZIP'
+    )
+    video_quality: EnumProperty(
+        name="Quality",
+        description="Video encoding quality preset",
+        items=VIDEO_QUALITY_ITEMS,
+        default='MEDIUM'
+    )
+    video_bitrate: IntProperty(
+        name="Bitrate",
+        description="Video bitrate (kb/s)",
+        min=1,
+        max=100000,
+        default=6000
+    )
+
+
 class CameraideSettings(PropertyGroup):
     # Basic Settings
     use_custom_settings: BoolProperty(
@@ -93,7 +199,16 @@ class CameraideSettings(PropertyGroup):
         default=1,
         min=1
     )
-    
+
+    hold_frames: IntProperty(
+        name="Hold",
+        description="Render every Nth frame and hold it for N frames (animating on twos/threes). "
+                    "Skipped frames are filled with links to the held frame; videos keep their timing",
+        default=1,
+        min=1,
+        soft_max=8
+    )
+
     sync_frame_range: BoolProperty(
         name="Sync Frame Range",
         description="Synchronize viewport timeline with camera's frame range",
@@ -119,18 +234,18 @@ class CameraideSettings(PropertyGroup):
         description="Output file name",
         default="filename"
     )
+    use_local_scratch: BoolProperty(
+        name="Local Scratch",
+        description="Render animations to a local scratch folder and move the files to the "
+                    "output path in the background (for slow or network output paths). "
+                    "A job is complete once its files have been moved",
+        default=False
+    )
     
     output_format: EnumProperty(
         name="Format",
         description="Output file format",
-        items=[
-            ('PNG', "PNG", "PNG Format\n• Color Depth: 8/16-bit\n• Lossless compression\n• Alpha support"),
-            ('JPEG', "JPEG", "JPEG Format\n• 8-bit color depth\n• Quality: 90%\n• Lossy compression"),
-            ('OPEN_EXR', "EXR", "OpenEXR Format\n• Color Depth: 16/32-bit float\n• Multiple compression options\n• HDR support\n• Alpha support"),
-            ('H264_MP4', "MP4 H264", "MP4 with H.264\n• Standard MP4 container\n• H.264 codec\n• Universal compatibility"),
-            ('H264_MKV', "MKV H264", "MKV with H.264\n• Matroska container\n• H.264 codec\n• Open format"),
-            ('PRORES_MOV', "MOV ProRes", "MOV with ProRes 4444\n• QuickTime container\n• ProRes 4444 codec\n• Professional editing\n• Alpha support"),
-        ],
+        items=OUTPUT_FORMAT_ITEMS,
         default='PNG'
     )
 
@@ -176,18 +291,7 @@ class CameraideSettings(PropertyGroup):
     exr_codec: EnumProperty(
         name="Codec",
         description="Compression method for EXR output",
-        items=[
-            ('NONE', "None", "No compression"),
-            ('PXR24', "Pxr24 (lossy)", "Pxr24 compression (lossy)"),
-            ('ZIP', "ZIP (lossless)", "ZIP compression (lossless)"),
-            ('PIZ', "PIZ (lossless)", "PIZ compression (lossless)"),
-            ('RLE', "RLE (lossless)", "Run-length encoding (lossless)"),
-            ('ZIPS', "ZIPS (lossless)", "ZIPS compression (lossless)"),
-            ('B44', "B44 (lossy)", "B44 compression (lossy)"),
-            ('B44A', "B44A (lossy)", "B44A compression (lossy)"),
-            ('DWAA', "DWAA (lossy)", "DWAA compression (lossy)"),
-            ('DWAB', "DWAB (lossy)", "DWAB compression (lossy)"),
-        ],
+        items=EXR_CODEC_ITEMS,
         default='ZIP'
     )
     exr_preview: BoolProperty(
@@ -200,13 +304,7 @@ class CameraideSettings(PropertyGroup):
     video_quality: EnumProperty(
         name="Quality",
         description="Video encoding quality preset",
-        items=[
-            ('LOSSLESS', 'Lossless', 'Lossless encoding (huge files)'),
-            ('PERC_LOSSLESS', 'Perceptually Lossless', 'High quality, nearly lossless'),
-            ('HIGH', 'High Quality', 'High quality (recommended)'),
-            ('MEDIUM', 'Medium Quality', 'Medium quality'),
-            ('LOW', 'Low Quality', 'Low quality'),
-        ],
+        items=VIDEO_QUALITY_ITEMS,
         default='HIGH'
     )
     
@@ -228,6 +326,32 @@ class CameraideSettings(PropertyGroup):
         subtype='NONE'
     )
     
+    video_encoder_speed: EnumProperty(
+        name="Encoder Speed",
+        description="FFmpeg encoder speed preset. Faster presets encode quicker but need "
+                    "more bits for the same quality",
+        items=[
+            ('REALTIME', "Realtime", "Fastest encoding, largest files"),
+            ('GOOD', "Good", "Balance between encoding speed and file size"),
+            ('BEST', "Best", "Slowest encoding, smallest files"),
+        ],
+        default='GOOD'
+    )
+
+    use_max_b_frames: BoolProperty(
+        name="Limit B-Frames",
+        description="Limit the number of consecutive B-frames",
+        default=False
+    )
+
+    max_b_frames: IntProperty(
+        name="Max B-Frames",
+        description="Maximum consecutive B-frames (0 is fastest to encode and seek)",
+        min=0,
+        max=16,
+        default=2
+    )
+
     # Audio Settings
     use_audio: BoolProperty(
         name="Include Audio",
@@ -277,14 +401,359 @@ class CameraideSettings(PropertyGroup):
                     "Formats without an alpha channel render the background black",
         default=True
     )
+
+    # Render Quality (final-engine renders only; restored after rendering)
+    quality_tier: EnumProperty(
+        name="Quality",
+        description="Render quality for this camera",
+        items=[
+            ('SCENE', "Scene", "Use the scene's render settings"),
+            ('DRAFT', "Draft", "16 samples, noise 0.1, 4 bounces, denoised"),
+            ('PREVIEW', "Preview", "64 samples, noise 0.05, 8 bounces, denoised"),
+            ('FINAL', "Final", "512 samples, noise 0.01, 12 bounces, denoised"),
+            ('CUSTOM', "Custom", "Use the values below"),
+        ],
+        default='SCENE'
+    )
+    quality_samples: IntProperty(
+        name="Samples",
+        description="Maximum render samples (Cycles) / TAA samples (EEVEE)",
+        default=128,
+        min=1,
+        max=65536
+    )
+    quality_noise_threshold: FloatProperty(
+        name="Noise Threshold",
+        description="Adaptive sampling noise threshold (0 disables adaptive sampling)",
+        default=0.01,
+        min=0.0,
+        max=1.0,
+        precision=4
+    )
+    quality_denoise: BoolProperty(
+        name="Denoise",
+        description="Denoise the final render",
+        default=True
+    )
+    quality_denoiser: EnumProperty(
+        name="Denoiser",
+        description="Denoiser used when denoising is enabled",
+        items=[
+            ('OPENIMAGEDENOISE', "OpenImageDenoise", "Intel OpenImageDenoise"),
+            ('OPTIX', "OptiX", "NVIDIA OptiX (requires a supported GPU)"),
+        ],
+        default='OPENIMAGEDENOISE'
+    )
+    quality_max_bounces: IntProperty(
+        name="Max Bounces",
+        description="Total maximum light bounces",
+        default=12,
+        min=0,
+        max=1024
+    )
+    quality_time_limit: FloatProperty(
+        name="Time Limit",
+        description="Maximum render time per frame in seconds (0 = unlimited)",
+        default=0.0,
+        min=0.0,
+        subtype='TIME_ABSOLUTE',
+        unit='TIME_ABSOLUTE'
+    )
+
+    # Tiled rendering
+    use_tiled_render: BoolProperty(
+        name="Tiled Render",
+        description="Split each frame into regions rendered in parallel background processes "
+                    "and stitch them back together (normal renders only). For very high "
+                    "resolutions that hit memory or time limits in one process",
+        default=False
+    )
+    tiles_x: IntProperty(
+        name="Tiles X",
+        description="Number of regions across",
+        default=2,
+        min=1,
+        max=16
+    )
+    tiles_y: IntProperty(
+        name="Tiles Y",
+        description="Number of regions down",
+        default=2,
+        min=1,
+        max=16
+    )
+
+    # Extra outputs derived from the rendered frames
+    output_targets: CollectionProperty(type=CameraideOutputTarget)
+    output_targets_index: IntProperty(default=0)
+    proxy_sizes: EnumProperty(
+        name="Proxies",
+        description="Downscaled copies written next to the output (in proxy_<size> folders)",
+        items=[
+            ('75', "75%", "Three-quarter resolution proxy"),
+            ('50', "50%", "Half resolution proxy"),
+            ('25', "25%", "Quarter resolution proxy"),
+        ],
+        options={'ENUM_FLAG'},
+        default=set()
+    )
+    proxy_format: EnumProperty(
+        name="Proxy Format",
+        description="File format of the proxies",
+        items=[
+            ('MAIN', "Same as Output", "Use the camera's format and settings"),
+            ('JPEG', "JPEG", "JPEG frames"),
+            ('H264_MP4', "MP4 H264", "H.264 movie"),
+        ],
+        default='MAIN'
+    )
+
+    # Shared settings profile (see utils/profiles.py)
+    profile: StringProperty(
+        name="Profile",
+        description="Settings profile this camera takes its resolution, format and quality "
+                    "from (empty: the camera's own settings)",
+        default="",
+        update=update_profile
+    )
+    profile_overrides: EnumProperty(
+        name="Overrides",
+        description="Profile settings this camera sets for itself",
+        items=PROFILE_OVERRIDE_ITEMS,
+        options={'ENUM_FLAG'},
+        default=set(),
+        update=update_profile
+    )
+
     # NOTE: panel open/close state lives on bpy.types.Scene (see
     # panels/sidebar_panel.py) so it is shared across all cameras.
 
 
+# A profile carries the shared settings with the same definitions (ranges,
+# defaults, descriptions) as the per-camera ones
+CameraideProfile = type("CameraideProfile", (PropertyGroup,), {
+    '__doc__': "Output settings shared by the cameras that reference it by name",
+    '__annotations__': {name: CameraideSettings.__annotations__[name]
+                        for name, _ in SHARED_SETTINGS},
+})
+
+
+class CameraideBatchSettings(PropertyGroup):
+    """Scene-level Cameraide options shared by all cameras"""
+    # Telemetry
+    use_telemetry: BoolProperty(
+        name="Record Telemetry",
+        description="Log per-job and per-frame timings, file sizes and memory for batch renders",
+        default=False
+    )
+    telemetry_dir: StringProperty(
+        name="Telemetry Folder",
+        description="Folder for the per-batch telemetry logs (JSON lines)",
+        default="//cameraide_telemetry/",
+        subtype='DIR_PATH'
+    )
+    use_metrics: BoolProperty(
+        name="Live Metrics",
+        description="Serve batch progress in OpenMetrics format on localhost while batches render",
+        default=False
+    )
+    metrics_port: IntProperty(
+        name="Metrics Port",
+        description="Local port of the /metrics endpoint (0 writes only the status file)",
+        default=9464,
+        min=0,
+        max=65535
+    )
+    metrics_status_file: StringProperty(
+        name="Status File",
+        description="JSON file rewritten every few seconds with the batch progress (empty for none)",
+        default="",
+        subtype='FILE_PATH'
+    )
+
+    # In-memory viewport snapshots
+    snapshot_to_memory: BoolProperty(
+        name="Keep in Memory",
+        description="Viewport snapshots are kept in memory for A/B comparison instead of "
+                    "being written to disk (save them explicitly)",
+        default=True
+    )
+    snapshot_history: IntProperty(
+        name="History",
+        description="Snapshots kept per camera; the oldest is dropped first",
+        default=8,
+        min=1,
+        max=64
+    )
+    snapshot_memory_mb: IntProperty(
+        name="Memory (MB)",
+        description="Memory for all kept snapshots together; the oldest are dropped past it",
+        default=512,
+        min=16,
+        soft_max=4096
+    )
+    compare_mode: EnumProperty(
+        name="Compare",
+        description="How snapshots A and B are shown over the 3D view",
+        items=[
+            ('WIPE', "Wipe", "A left of the wipe line, B right of it"),
+            ('DIFF', "Difference", "Amplified per-pixel difference of A and B"),
+        ],
+        default='WIPE',
+        update=update_redraw
+    )
+    compare_wipe: FloatProperty(
+        name="Wipe",
+        description="Position of the wipe line",
+        default=0.5,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR',
+        update=update_redraw
+    )
+
+    # Persistent-data batching
+    use_persistent_batch: BoolProperty(
+        name="Persistent Data Batch",
+        description="Keep render data (BVH, textures) between batch jobs and order jobs so "
+                    "consecutive ones share resolution, transparency and format. "
+                    "The scene's own Persistent Data setting is restored afterwards",
+        default=False
+    )
+
+    # Pre-flight validation of All Cameras queues
+    preflight_mode: EnumProperty(
+        name="Pre-flight",
+        description="Validate every job of an All Cameras batch before it starts",
+        items=[
+            ('BLOCK', "Block on Errors", "Don't start a batch with pre-flight errors"),
+            ('WARN', "Warn Only", "Report pre-flight problems and start anyway"),
+            ('OFF', "Off", "Start batches without validation"),
+        ],
+        default='BLOCK'
+    )
+
+    # Parallel background processes (tiled renders, Snapshot All)
+    max_processes: IntProperty(
+        name="Parallel Processes",
+        description="Maximum number of background Blender processes rendering at once "
+                    "(0 = one per CPU core, limited by the memory budget)",
+        default=0,
+        min=0,
+        max=64
+    )
+    use_memory_limit: BoolProperty(
+        name="Memory Limit",
+        description="Start a background process only while the estimated peak memory of all "
+                    "running processes stays under the memory budget. Estimates use resolution, "
+                    "output bit depth and the measured peaks of earlier processes",
+        default=True
+    )
+    memory_budget_gb: FloatProperty(
+        name="Budget",
+        description="Memory budget for all background processes in GiB "
+                    "(0 = 75% of physical memory minus this session)",
+        default=0.0,
+        min=0.0,
+        soft_max=256.0,
+        precision=1
+    )
+
+    # Shared scene audio for video jobs
+    ffmpeg_path: StringProperty(
+        name="FFmpeg",
+        description="ffmpeg executable used to add the shared scene audio to video jobs "
+                    "(empty = find ffmpeg on the system PATH). Without one, each video job "
+                    "mixes and encodes its own audio",
+        default="",
+        subtype='FILE_PATH'
+    )
+
+    # Local scratch renders
+    scratch_path: StringProperty(
+        name="Scratch Folder",
+        description="Fast local folder that Local Scratch cameras render to before their files "
+                    "are moved to the output path (empty = system temp folder)",
+        default="",
+        subtype='DIR_PATH'
+    )
+
+    # Fast playblast profile (viewport renders)
+    use_fast_playblast: BoolProperty(
+        name="Fast Playblast",
+        description="Use a cheap, predictable profile for viewport playblasts; "
+                    "everything is restored afterwards",
+        default=False
+    )
+    playblast_shading: EnumProperty(
+        name="Shading",
+        description="Viewport shading used for playblasts",
+        items=[
+            ('KEEP', "Keep", "Use the current viewport shading"),
+            ('SOLID', "Solid", "Solid shading"),
+            ('WIREFRAME', "Wireframe", "Wireframe shading"),
+        ],
+        default='SOLID'
+    )
+    playblast_simplify_subdivision: IntProperty(
+        name="Max Subdivision",
+        description="Simplify: maximum subdivision level during playblasts",
+        default=0,
+        min=0,
+        max=6
+    )
+    playblast_simplify_particles: FloatProperty(
+        name="Child Particles",
+        description="Simplify: fraction of child particles drawn during playblasts",
+        default=0.0,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR'
+    )
+    playblast_disable_compositing: BoolProperty(
+        name="Disable Compositing",
+        description="Skip the compositor during playblasts",
+        default=True
+    )
+    playblast_disable_sequencer: BoolProperty(
+        name="Disable Sequencer",
+        description="Skip sequencer strips during playblasts",
+        default=True
+    )
+    playblast_hide_overlays: BoolProperty(
+        name="Hide Overlays",
+        description="Hide viewport overlays during playblasts",
+        default=True
+    )
+    playblast_standard_view: BoolProperty(
+        name="Standard View Transform",
+        description="Use the cheap 'Standard' view transform without a look",
+        default=True
+    )
+
+    # Developer: trace recording
+    trace_path: StringProperty(
+        name="Trace File",
+        description="Chrome/Perfetto trace JSON written when recording stops",
+        default="//cameraide_trace.json",
+        subtype='FILE_PATH'
+    )
+
+
 def register():
+    bpy.utils.register_class(CameraideOutputTarget)
     bpy.utils.register_class(CameraideSettings)
+    bpy.utils.register_class(CameraideProfile)
+    bpy.utils.register_class(CameraideBatchSettings)
     bpy.types.Camera.cameraide_settings = PointerProperty(type=CameraideSettings)
+    bpy.types.Scene.cameraide_batch = PointerProperty(type=CameraideBatchSettings)
+    bpy.types.Scene.cameraide_profiles = CollectionProperty(type=CameraideProfile)
 
 def unregister():
+    del bpy.types.Scene.cameraide_profiles
+    del bpy.types.Scene.cameraide_batch
     del bpy.types.Camera.cameraide_settings
+    bpy.utils.unregister_class(CameraideBatchSettings)
+    bpy.utils.unregister_class(CameraideProfile)
     bpy.utils.unregister_class(CameraideSettings)
+    bpy.utils.unregister_class(CameraideOutputTarget)
@@ -0,0 +1,179 @@
+"""Shared scene audio for Cameraide video jobs.
+
+Without this every video job mixes and encodes the whole soundtrack again
+inside Blender's movie writer. Instead, video jobs render without audio;
+the scene audio is mixed down and encoded once per audio codec, bitrate
+and range (cached on disk), and each job's movie gets the matching slice
+of that track muxed in by the ffmpeg command-line tool. Both streams are
+copied, so nothing is re-encoded unless the container refuses the copy.
+
+Needs an `ffmpeg` executable (Blender only bundles the libraries). Without
+one, video jobs encode their audio in Blender as before.
+"""
+import hashlib
+import os
+import shutil
+import subprocess
+import bpy
+from ..utils.storage import user_cache_dir
+
+# Cameraide audio codec -> ffmpeg encoder for the re-encode fallback
+_FFMPEG_ENCODERS = {'AAC': 'aac', 'MP3': 'libmp3lame'}
+
+
+def find_ffmpeg(batch_settings):
+    """Path of the ffmpeg executable, or None"""
+    path = batch_settings.ffmpeg_path
+    if path:
+        path = bpy.path.abspath(path)
+        return path if os.path.isfile(path) else None
+    return shutil.which("ffmpeg")
+
+
+def wants_audio(settings):
+    return settings.use_audio and settings.audio_codec != 'NONE'
+
+
+def _sound_strips(scene):
+    editor = scene.sequence_editor
+    if editor is None:
+        return []
+    strips = getattr(editor, 'strips_all', None)
+    if strips is None:
+        strips = editor.sequences_all
+    return [s for s in strips if s.type == 'SOUND' and not s.mute]
+
+
+def has_scene_audio(scene):
+    return bool(_sound_strips(scene)) or any(obj.type == 'SPEAKER' for obj in scene.objects)
+
+
+def audio_signature(scene):
+    """Changes whenever the mix would: strips, their sources and levels,
+    speakers and the scene's audio settings"""
+    parts = [scene.name, bpy.data.filepath, scene.render.fps, scene.render.fps_base,
+             scene.audio_volume, scene.render.ffmpeg.audio_mixrate, scene.render.ffmpeg.audio_channels]
+    for strip in sorted(_sound_strips(scene), key=lambda s: s.name):
+        path = bpy.path.abspath(strip.sound.filepath) if strip.sound else ""
+        mtime = os.path.getmtime(path) if path and os.path.exists(path) else 0
+        parts += [strip.name, path, mtime, strip.channel, strip.frame_start,
+                  strip.frame_final_start, strip.frame_final_end, strip.volume,
+                  getattr(strip, 'pan', 0.0)]
+    for obj in scene.objects:
+        if obj.type == 'SPEAKER' and obj.data.sound:
+            parts += [obj.name, obj.data.sound.filepath, obj.data.volume, obj.data.muted,
+                      tuple(obj.matrix_world.translation)]
+    return hashlib.sha1(repr(parts).encode()).hexdigest()[:16]
+
+
+class AudioPlan:
+    """Audio part of one video job, captured when its settings are applied"""
+
+    def __init__(self, scene, settings, start, end, ffmpeg):
+        self.scene_name = scene.name
+        self.codec = settings.audio_codec
+        self.bitrate = settings.audio_bitrate
+        self.start = start
+        self.end = end
+        self.fps = scene.render.fps / scene.render.fps_base
+        self.ffmpeg = ffmpeg
+
+
+class SceneAudio:
+    """Mixed-down scene tracks, reused by every job whose range they cover"""
+
+    # (signature, codec, bitrate) -> [(mix_start, mix_end, path)]
+    _tracks = {}
+
+    @classmethod
+    def plan(cls, scene, settings, start, end):
+        """AudioPlan for a video job, or None when Blender should keep
+        encoding the audio itself (no audio wanted, none in the scene, or
+        no ffmpeg to mux with)."""
+        if not wants_audio(settings) or not has_scene_audio(scene):
+            return None
+        ffmpeg = find_ffmpeg(scene.cameraide_batch)
+        if ffmpeg is None:
+            return None
+        return AudioPlan(scene, settings, start, end, ffmpeg)
+
+    @classmethod
+    def _mix_range(cls, scene, start, end):
+        """The soundtrack's own extent, widened to the job range, so one mix
+        serves every job of a batch"""
+        strips = _sound_strips(scene)
+        if strips:
+            start = min(start, min(s.frame_final_start for s in strips))
+            end = max(end, max(s.frame_final_end for s in strips) - 1)
+        return start, end
+
+    @classmethod
+    def track(cls, plan):
+        """(path, mix_start) of a cached track covering the plan's range,
+        mixing one down first if needed"""
+        scene = bpy.data.scenes[plan.scene_name]
+        key = (audio_signature(scene), plan.codec, plan.bitrate)
+        for mix_start, mix_end, path in cls._tracks.get(key, []):
+            if mix_start <= plan.start and plan.end <= mix_end and os.path.exists(path):
+                return path, mix_start
+
+        mix_start, mix_end = cls._mix_range(scene, plan.start, plan.end)
+        name = f"{key[0]}_{plan.codec}_{plan.bitrate}_{mix_start}_{mix_end}.mka"
+        path = os.path.join(user_cache_dir("audio"), name)
+        if not os.path.exists(path):
+            cls._mixdown(scene, path, plan.codec, plan.bitrate, mix_start, mix_end)
+        cls._tracks.setdefault(key, []).append((mix_start, mix_end, path))
+        return path, mix_start
+
+    @classmethod
+    def _mixdown(cls, scene, path, codec, bitrate, start, end):
+        partial = path + ".part.mka"
+        saved = (scene.frame_start, scene.frame_end)
+        scene.frame_start, scene.frame_end = start, end
+        try:
+            with bpy.context.temp_override(scene=scene):
+                bpy.ops.sound.mixdown(
+                    filepath=partial, check_existing=False, relative_path=False,
+                    container='MATROSKA', codec=codec, format='F32', bitrate=bitrate,
+                    mixrate=scene.render.ffmpeg.audio_mixrate,
+                )
+        finally:
+            scene.frame_start, scene.frame_end = saved
+        os.replace(partial, path)
+
+    @classmethod
+    def mux(cls, plan, movie_path):
+        """Mux the job's slice of the scene track into movie_path (in place).
+        Raises RuntimeError if ffmpeg fails."""
+        if not os.path.exists(movie_path):
+            return
+        track, mix_start = cls.track(plan)
+        mux_audio(plan.ffmpeg, movie_path, track, (plan.start - mix_start) / plan.fps,
+                  plan.codec, plan.bitrate)
+
+
+def mux_audio(ffmpeg, movie_path, track, offset, codec, bitrate):
+    """Mux `track`, starting `offset` seconds in, into movie_path (in place).
+    Needs no bpy, so background workers can call it. codec is a Cameraide
+    audio codec (AAC or MP3); others only get the stream copy, without the
+    re-encode fallback. Raises RuntimeError if ffmpeg fails."""
+    root, ext = os.path.splitext(movie_path)
+    muxed = f"{root}.mux{ext}"
+    base = [ffmpeg, '-v', 'error', '-y', '-i', movie_path,
+            '-ss', f"{offset:.6f}", '-i', track,
+            '-map', '0:v:0', '-map', '1:a:0', '-shortest']
+    attempts = [['-c', 'copy']]
+    encoder = _FFMPEG_ENCODERS.get(codec)
+    if encoder:
+        # The container refused the stream copy: encode just the audio
+        attempts.append(['-c:v', 'copy', '-c:a', encoder, '-b:a', f"{bitrate}k"])
+    error = ""
+    for codec_args in attempts:
+        proc = subprocess.run(base + codec_args + [muxed], capture_output=True, text=True)
+        if proc.returncode == 0 and os.path.exists(muxed):
+            os.replace(muxed, movie_path)
+            return
+        error = proc.stderr.strip()
+    if os.path.exists(muxed):
+        os.remove(muxed)
+    raise RuntimeError(f"Could not add audio to {movie_path}: {error}")
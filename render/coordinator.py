@@ -0,0 +1,306 @@
+"""Frame-chunk job coordinator for multi-node Cameraide renders.
+
+Standard library only (no bpy), so the coordinator, the protocol and the
+client can run and be tested outside Blender. The coordinator publishes the
+render queue split into frame chunks; worker Blender processes lease a
+chunk, render it with the camera's settings and report back.
+
+Protocol (JSON over HTTP):
+    GET  /status                                  progress and chunk states
+    POST /lease      {"worker"}                   -> {"chunk": {...} | null, "finished": bool}
+    POST /heartbeat  {"worker", "chunk_id"}       extends the lease
+    POST /complete   {"worker", "chunk_id", "result"}
+    POST /fail       {"worker", "chunk_id", "error"}
+
+A leased chunk that is not completed or heart-beaten within lease_seconds
+goes back to the pending pool, so a crashed worker never stalls the batch.
+"""
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PENDING = 'PENDING'
+LEASED = 'LEASED'
+DONE = 'DONE'
+FAILED = 'FAILED'
+
+
+def make_chunks(jobs, chunk_size):
+    """Split job dicts into frame chunks.
+
+    Each job needs 'object', 'start', 'end' and optionally 'step', 'hold'
+    and 'video'. Video jobs write a single movie file and are never split.
+    Chunks hold chunk_size rendered frames and start on a rendered frame
+    (every step * hold frames), so the union of all chunks renders exactly
+    the frames the job would and each chunk can fill its own held frames.
+    """
+    chunk_size = max(int(chunk_size), 1)
+    chunks = []
+    for job_index, job in enumerate(jobs):
+        stride = max(int(job.get('step', 1)), 1) * max(int(job.get('hold', 1)), 1)
+        start, end = job['start'], job['end']
+        spans = [(start, end)]
+        if not job.get('video'):
+            spans = []
+            s = start
+            while s <= end:
+                e = min(s + chunk_size * stride - 1, end)
+                spans.append((s, e))
+                s = e + 1
+        for s, e in spans:
+            chunk = dict(job)
+            chunk.update({
+                'chunk_id': len(chunks),
+                'job_index': job_index,
+                'start': s,
+                'end': e,
+            })
+            chunks.append(chunk)
+    return chunks
+
+
+class JobCoordinator:
+    """Thread-safe chunk state machine behind the HTTP server"""
+
+    def __init__(self, chunks, lease_seconds=600.0, max_attempts=3, info=None):
+        self.chunks = chunks
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.info = dict(info or {})
+        self._lock = threading.Lock()
+        self._state = {c['chunk_id']: {
+            'status': PENDING, 'worker': None, 'deadline': 0.0,
+            'attempts': 0, 'result': None, 'error': None,
+        } for c in chunks}
+        self._by_id = {c['chunk_id']: c for c in chunks}
+        self.started = time.time()
+
+    @property
+    def finished(self):
+        with self._lock:
+            return all(s['status'] in {DONE, FAILED} for s in self._state.values())
+
+    def _expire_leases(self, now):
+        for state in self._state.values():
+            if state['status'] == LEASED and state['deadline'] < now:
+                state['status'] = PENDING
+                state['worker'] = None
+
+    def lease(self, worker):
+        now = time.time()
+        with self._lock:
+            self._expire_leases(now)
+            for chunk_id, state in self._state.items():
+                if state['status'] == PENDING:
+                    state.update(status=LEASED, worker=worker,
+                                 deadline=now + self.lease_seconds)
+                    state['attempts'] += 1
+                    return dict(self._by_id[chunk_id])
+            return None
+
+    def heartbeat(self, worker, chunk_id):
+        with self._lock:
+            state = self._state.get(chunk_id)
+            if not state or state['status'] != LEASED or state['worker'] != worker:
+                return False
+            state['deadline'] = time.time() + self.lease_seconds
+            return True
+
+    def complete(self, worker, chunk_id, result=None):
+        with self._lock:
+            state = self._state.get(chunk_id)
+            if not state or state['status'] in {DONE, FAILED}:
+                return False
+            state.update(status=DONE, worker=worker, result=result)
+            return True
+
+    def fail(self, worker, chunk_id, error=None):
+        with self._lock:
+            state = self._state.get(chunk_id)
+            if not state or state['status'] in {DONE, FAILED}:
+                return False
+            state['error'] = error
+            state['worker'] = None
+            state['status'] = FAILED if state['attempts'] >= self.max_attempts else PENDING
+            return True
+
+    def status(self):
+        with self._lock:
+            self._expire_leases(time.time())
+            counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+            chunks = []
+            for chunk_id, state in self._state.items():
+                counts[state['status']] += 1
+                chunk = self._by_id[chunk_id]
+                chunks.append({
+                    'chunk_id': chunk_id,
+                    'camera': chunk.get('camera'),
+                    'start': chunk['start'],
+                    'end': chunk['end'],
+                    'status': state['status'],
+                    'worker': state['worker'],
+                    'attempts': state['attempts'],
+                    'error': state['error'],
+                    'result': state['result'],
+                })
+            return {
+                'info': self.info,
+                'total': len(self._state),
+                'pending': counts[PENDING],
+                'leased': counts[LEASED],
+                'done': counts[DONE],
+                'failed': counts[FAILED],
+                'finished': counts[PENDING] == 0 and counts[LEASED] == 0,
+                'elapsed': round(time.time() - self.started, 3),
+                'chunks': chunks,
+            }
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    coordinator = None  # set per server class in CoordinatorServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, payload, code=200):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length).decode('utf-8'))
+
+    def do_GET(self):
+        if self.path.rstrip('/') == '/status':
+            self._send_json(self.coordinator.status())
+        else:
+            self._send_json({'error': 'not found'}, 404)
+
+    def do_POST(self):
+        try:
+            data = self._read_json()
+        except ValueError:
+            self._send_json({'error': 'invalid JSON'}, 400)
+            return
+        coordinator = self.coordinator
+        worker = data.get('worker', self.client_address[0])
+        route = self.path.rstrip('/')
+        if route == '/lease':
+            chunk = coordinator.lease(worker)
+            self._send_json({'chunk': chunk, 'finished': chunk is None and coordinator.finished})
+        elif route == '/heartbeat':
+            self._send_json({'ok': coordinator.heartbeat(worker, data.get('chunk_id'))})
+        elif route == '/complete':
+            self._send_json({'ok': coordinator.complete(worker, data.get('chunk_id'), data.get('result'))})
+        elif route == '/fail':
+            self._send_json({'ok': coordinator.fail(worker, data.get('chunk_id'), data.get('error'))})
+        else:
+            self._send_json({'error': 'not found'}, 404)
+
+
+class CoordinatorServer:
+    """HTTP front end for a JobCoordinator, served from a daemon thread"""
+
+    def __init__(self, coordinator, host='127.0.0.1', port=0):
+        self.coordinator = coordinator
+        handler = type('CameraideRequestHandler', (_RequestHandler,), {'coordinator': coordinator})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def wait(self, poll_seconds=1.0, timeout=None):
+        """Block until every chunk is done or failed. Returns False on timeout."""
+        deadline = None if timeout is None else time.time() + timeout
+        while not self.coordinator.finished:
+            if deadline is not None and time.time() > deadline:
+                return False
+            time.sleep(poll_seconds)
+        return True
+
+
+class CoordinatorClient:
+    """Minimal worker-side client for the coordinator protocol"""
+
+    def __init__(self, url, worker, timeout=30.0):
+        self.url = url.rstrip('/')
+        self.worker = worker
+        self.timeout = timeout
+
+    def _request(self, route, payload=None):
+        data = None
+        if payload is not None:
+            payload = dict(payload, worker=self.worker)
+            data = json.dumps(payload).encode('utf-8')
+        request = urllib.request.Request(
+            self.url + route, data=data,
+            headers={'Content-Type': 'application/json'},
+            method='POST' if data is not None else 'GET',
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+    def status(self):
+        return self._request('/status')
+
+    def lease(self):
+        return self._request('/lease', {})
+
+    def heartbeat(self, chunk_id):
+        return self._request('/heartbeat', {'chunk_id': chunk_id}).get('ok', False)
+
+    def complete(self, chunk_id, result=None):
+        return self._request('/complete', {'chunk_id': chunk_id, 'result': result}).get('ok', False)
+
+    def fail(self, chunk_id, error=None):
+        return self._request('/fail', {'chunk_id': chunk_id, 'error': error}).get('ok', False)
+
+
+class Heartbeat:
+    """Keeps a chunk lease alive from a background thread while the main
+    thread is blocked rendering."""
+
+    def __init__(self, client, chunk_id, interval):
+        self.client = client
+        self.chunk_id = chunk_id
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.client.heartbeat(self.chunk_id)
+            except (urllib.error.URLError, OSError):
+                pass
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join(timeout=self.interval)
+        return False
@@ -0,0 +1,496 @@
+"""Extra outputs derived from a job's rendered frames.
+
+A camera can list output targets (format, quality, subfolder) and a ladder
+of proxy sizes next to its main format. The job renders once; when it is
+finished, every target is written from the rendered frames by its own
+background Blender process, which only loads images and encodes (no scene,
+no render), so the next job renders while the conversions run.
+
+Proxies are area-averaged down with NumPy, one vectorized pass per axis,
+in the same converter processes. Float frames (EXR) are converted with the
+scene's view transform, other frames pass through as they are, so a review
+movie of an EXR job looks like the PNG render would. Video targets get the
+scene audio muxed in when the main job would have had it.
+
+The worker side (derive()) needs no add-on state and runs in the child
+process, or in this session when there is no Blender binary to launch.
+"""
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+import bpy
+import numpy as np
+from .audio import SceneAudio, mux_audio
+from .encode import encode_image_sequence
+from .formats.image import apply_image_format
+from .formats.video import apply_video_format
+from .memory import MemoryHistory, model_estimate
+from .processes import ProcessTask, blender_command, executor_for, processes_available
+
+VIDEO_FORMATS = {'H264_MP4', 'H264_MKV', 'PRORES_MOV'}
+_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "derive_worker.py")
+
+# Settings a target sets itself; the rest of its format settings are the camera's
+_TARGET_FIELDS = ('output_format', 'png_color_depth', 'jpeg_quality', 'exr_color_depth',
+                  'exr_codec', 'video_quality', 'video_bitrate')
+_INHERITED_FIELDS = ('png_compression', 'video_gopsize', 'video_encoder_speed',
+                     'use_max_b_frames', 'max_b_frames', 'use_audio', 'audio_codec',
+                     'audio_bitrate', 'film_transparent')
+# A converter process holds Blender itself plus one image at a time
+_CONVERTER_BASE = 256 * 1024 ** 2
+_POLL_SECONDS = 0.25
+
+
+def enabled_targets(settings):
+    return [target for target in settings.output_targets if target.enabled]
+
+
+def target_settings(settings, target):
+    """Format settings of a target as a plain dict: the target's own fields
+    over the camera's"""
+    data = {name: getattr(settings, name) for name in _INHERITED_FIELDS}
+    data.update({name: getattr(target, name) for name in _TARGET_FIELDS})
+    data['exr_preview'] = False
+    return data
+
+
+def target_pattern(final_pattern, subfolder):
+    """render.filepath-style pattern of a target next to the main output"""
+    folder, name = os.path.split(final_pattern)
+    return os.path.join(folder, subfolder, name)
+
+
+def proxy_settings(settings):
+    """Format settings of the camera's proxies as a plain dict"""
+    data = {name: getattr(settings, name) for name in _INHERITED_FIELDS + _TARGET_FIELDS}
+    data['exr_preview'] = False
+    if settings.proxy_format != 'MAIN':
+        data['output_format'] = settings.proxy_format
+    return data
+
+
+def has_targets(settings):
+    """Whether a camera's jobs write anything besides the main output"""
+    return bool(settings.proxy_sizes) or bool(enabled_targets(settings))
+
+
+def _spec(scene, settings, data, pattern, start, end, resolution, scale=1.0):
+    render = scene.render
+    view = scene.view_settings
+    width, height = (max(round(v * scale), 1) for v in resolution)
+    if data['output_format'] in VIDEO_FORMATS and data['output_format'] != 'PRORES_MOV':
+        width, height = width + width % 2, height + height % 2
+    spec = {
+        'settings': data,
+        'pattern': pattern,
+        'frame_start': start,
+        'frame_end': end,
+        'resolution': [width, height],
+        'scale': scale,
+        'fps': [render.fps, render.fps_base],
+        'float_source': settings.output_format == 'OPEN_EXR',
+        'view': {
+            'display_device': scene.display_settings.display_device,
+            'view_transform': view.view_transform,
+            'look': view.look,
+            'exposure': view.exposure,
+            'gamma': view.gamma,
+        },
+        'overwrite': settings.overwrite_existing,
+        'audio': None,
+    }
+    audio = None
+    if data['output_format'] in VIDEO_FORMATS:
+        audio = SceneAudio.plan(scene, SimpleNamespace(**data), start, end)
+    return spec, audio
+
+
+def target_specs(scene, settings, final_pattern, start, end, resolution):
+    """[(spec, AudioPlan or None)] for the camera's enabled targets and
+    proxies.
+
+    Called while the job's settings are applied: the scene's view
+    transform and frame rate are the job's.
+    """
+    specs = []
+    for target in enabled_targets(settings):
+        specs.append(_spec(scene, settings, target_settings(settings, target),
+                           target_pattern(final_pattern, target.subfolder),
+                           start, end, resolution))
+    for size in sorted(settings.proxy_sizes, key=int, reverse=True):
+        specs.append(_spec(scene, settings, proxy_settings(settings),
+                           target_pattern(final_pattern, f"proxy_{size}"),
+                           start, end, resolution, scale=int(size) / 100))
+    return specs
+
+
+# --- Worker side -----------------------------------------------------------
+
+def _area_taps(src, dst):
+    """Source indices and weights, both (dst, taps), of an area-average
+    resample from src to dst samples"""
+    scale = src / dst
+    taps = int(np.ceil(scale)) + 1
+    lo = np.arange(dst) * scale
+    index = np.floor(lo).astype(np.int64)[:, None] + np.arange(taps)[None, :]
+    overlap = np.minimum(lo[:, None] + scale, index + 1) - np.maximum(lo[:, None], index)
+    weights = np.clip(overlap, 0.0, None) / scale
+    return np.minimum(index, src - 1), weights.astype(np.float32)
+
+
+def downscale(pixels, width, height):
+    """Area-average an (h, w, channels) float array down to (height, width)"""
+    rows, row_weights = _area_taps(pixels.shape[0], height)
+    pixels = np.einsum('yk,ykxc->yxc', row_weights, pixels[rows])
+    cols, col_weights = _area_taps(pixels.shape[1], width)
+    return np.einsum('xk,yxkc->yxc', col_weights, pixels[:, cols])
+
+
+def _save_scaled(image, path, scene, scale):
+    """Save `image` downscaled by `scale` through the scene's file format"""
+    w, h = image.size
+    channels = image.channels
+    pixels = np.empty(w * h * channels, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    pixels = pixels.reshape(h, w, channels)
+    if channels < 4:
+        alpha = np.ones((h, w, 4 - channels), dtype=np.float32)
+        pixels = np.concatenate([pixels, alpha], axis=2)
+    width, height = max(round(w * scale), 1), max(round(h * scale), 1)
+    # Same buffer type and color space as the source, so the values mean
+    # the same thing when the proxy is written
+    proxy = bpy.data.images.new(".cameraide_proxy", width, height,
+                                alpha=True, float_buffer=image.is_float)
+    try:
+        proxy.colorspace_settings.name = image.colorspace_settings.name
+        proxy.pixels.foreach_set(downscale(pixels, width, height).ravel())
+        proxy.save_render(path, scene=scene)
+    finally:
+        bpy.data.images.remove(proxy)
+
+def _output_scene(spec, settings):
+    """Throwaway scene carrying a target's file settings"""
+    tmp = bpy.data.scenes.new(".cameraide_derive")
+    render = tmp.render
+    render.resolution_x, render.resolution_y = spec['resolution']
+    render.resolution_percentage = 100
+    render.fps, render.fps_base = spec['fps']
+    render.film_transparent = settings.film_transparent
+    render.use_overwrite = spec['overwrite']
+    tmp.frame_start, tmp.frame_end = spec['frame_start'], spec['frame_end']
+    if settings.output_format in VIDEO_FORMATS:
+        apply_video_format(settings, SimpleNamespace(scene=tmp))
+    else:
+        render.image_settings.media_type = 'IMAGE'
+        render.image_settings.file_format = settings.output_format
+        apply_image_format(settings, SimpleNamespace(scene=tmp))
+    if spec['float_source']:
+        view = spec['view']
+        tmp.display_settings.display_device = view['display_device']
+        tmp.view_settings.view_transform = view['view_transform']
+        tmp.view_settings.look = view['look']
+        tmp.view_settings.exposure = view['exposure']
+        tmp.view_settings.gamma = view['gamma']
+    else:
+        # Frames are already display-referred
+        tmp.view_settings.view_transform = 'Standard'
+        tmp.view_settings.look = 'None'
+    return tmp
+
+
+def _convert_frames(spec, settings, frames, pattern):
+    """Save every (frame, path) image through settings' image format.
+    Hardlinked (held) sources are converted once and linked again."""
+    from .postprocess import link_or_copy
+    tmp = _output_scene(spec, settings)
+    written = []
+    converted = {}  # (device, inode) -> converted path
+    try:
+        tmp.render.filepath = pattern
+        os.makedirs(os.path.dirname(pattern), exist_ok=True)
+        for frame, src in frames:
+            out = tmp.render.frame_path(frame=frame)
+            if not spec['overwrite'] and os.path.exists(out):
+                written.append(out)
+                continue
+            stat = os.stat(src)
+            key = (stat.st_dev, stat.st_ino)
+            if key in converted:
+                link_or_copy(converted[key], out)
+            else:
+                image = bpy.data.images.load(src, check_existing=False)
+                try:
+                    if spec['scale'] < 1.0:
+                        _save_scaled(image, out, tmp, spec['scale'])
+                    else:
+                        image.save_render(out, scene=tmp)
+                finally:
+                    bpy.data.images.remove(image)
+                converted[key] = out
+            written.append(out)
+    finally:
+        bpy.data.scenes.remove(tmp)
+    return written
+
+
+def _movie_path(spec, settings):
+    tmp = _output_scene(spec, settings)
+    try:
+        tmp.render.filepath = spec['pattern']
+        return tmp.render.frame_path(frame=spec['frame_start'])
+    finally:
+        bpy.data.scenes.remove(tmp)
+
+
+def _derive_movie(spec, settings, frames):
+    movie_path = _movie_path(spec, settings)
+    if not spec['overwrite'] and os.path.exists(movie_path):
+        return [movie_path]
+    os.makedirs(os.path.dirname(movie_path), exist_ok=True)
+    scratch = None
+    try:
+        paths = [path for _, path in frames]
+        if spec['float_source'] or spec['scale'] < 1.0:
+            # The encoder expects display-referred frames at the movie's size
+            scratch = tempfile.mkdtemp(prefix="cameraide_derive_")
+            png = SimpleNamespace(output_format='PNG', png_color_depth='8', png_compression=0,
+                                  film_transparent=settings.film_transparent)
+            paths = _convert_frames(spec, png, frames, os.path.join(scratch, "frame_"))
+        written = encode_image_sequence(paths, movie_path, settings, tuple(spec['resolution']),
+                                        *spec['fps'], frame_start=frames[0][0])
+    finally:
+        if scratch:
+            shutil.rmtree(scratch, ignore_errors=True)
+    if written is None:
+        raise RuntimeError(f"Encoding {movie_path} failed")
+    audio = spec['audio']
+    if audio:
+        # A failed mux fails the target: the movie has no sound
+        mux_audio(audio['ffmpeg'], movie_path, audio['track'], audio['offset'],
+                  audio['codec'], audio['bitrate'])
+    return [movie_path]
+
+
+def derive(spec):
+    """Write one target from spec['frames'] ([frame, path] in output order).
+    Returns the written paths. Raises RuntimeError or OSError."""
+    settings = SimpleNamespace(**spec['settings'])
+    frames = [(frame, path) for frame, path in spec['frames'] if os.path.exists(path)]
+    if not frames:
+        raise RuntimeError("No rendered frames to convert")
+    if settings.output_format in VIDEO_FORMATS:
+        return _derive_movie(spec, settings, frames)
+    return _convert_frames(spec, settings, frames, spec['pattern'])
+
+
+def run_spec_file(path):
+    """Child-process entry: derive the spec in `path` and write the
+    written paths next to it"""
+    with open(path, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    outputs = derive(spec)
+    with open(path + ".out", 'w', encoding='utf-8') as f:
+        json.dump(outputs, f)
+
+
+# --- Session side ------------------------------------------------------------
+
+class DeriveJob:
+    """The targets of one finished render job.
+
+    Built on the main thread (audio mixdown and process commands need bpy);
+    its processes start once `after` (the job's TransferJob, when the frames
+    are still moving to the output path) is complete.
+    """
+
+    def __init__(self, camera_name, specs, frames, after=None, scratch_dir=None):
+        self.camera_name = camera_name
+        self.after = after
+        self.scratch_dir = scratch_dir  # rendered frames owned by this job
+        self.workdir = tempfile.mkdtemp(prefix="cameraide_derive_")
+        self.outputs = []
+        self.failed = []   # (format, error)
+        self.tasks = []
+        self.specs = []
+        self.started = False
+        self._done = threading.Event()
+
+        for index, (spec, audio) in enumerate(specs):
+            spec = dict(spec, frames=[[frame, path] for frame, path in frames])
+            if audio is not None:
+                try:
+                    track, mix_start = SceneAudio.track(audio)
+                except (RuntimeError, OSError) as e:
+                    # Like a failed mux: no movie rather than a silent one
+                    self.failed.append((spec['settings']['output_format'], f"scene audio: {e}"))
+                    continue
+                spec['audio'] = {'ffmpeg': audio.ffmpeg, 'track': track,
+                                 'offset': (audio.start - mix_start) / audio.fps,
+                                 'codec': audio.codec, 'bitrate': audio.bitrate}
+            path = os.path.join(self.workdir, f"target{index:02d}.json")
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(spec, f)
+            self.specs.append((spec, path))
+
+        if processes_available():
+            for spec, path in self.specs:
+                settings = SimpleNamespace(**spec['settings'])
+                # Converters hold full-size source frames
+                width, height = (round(v / spec['scale']) for v in spec['resolution'])
+                signature = f"derive|{settings.output_format}|{width}|{height}"
+                self.tasks.append(ProcessTask(
+                    tag=settings.output_format,
+                    command=blender_command(None, _WORKER_SCRIPT, (path,)),
+                    log_path=path + ".log",
+                    estimate=MemoryHistory.peak(signature)
+                    or model_estimate(settings, width, height, base=_CONVERTER_BASE),
+                    signature=signature,
+                ))
+
+    @property
+    def complete(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+    def run_here(self):
+        """Derive every target in this session, blocking"""
+        if self.after:
+            self.after.wait()
+        for spec, _ in self.specs:
+            try:
+                self.outputs.extend(derive(spec))
+            except (RuntimeError, OSError) as e:
+                self.failed.append((spec['settings']['output_format'], str(e)))
+        self._finish()
+
+    def _collect(self):
+        for task, (spec, path) in zip(self.tasks, self.specs):
+            try:
+                with open(path + ".out", 'r', encoding='utf-8') as f:
+                    self.outputs.extend(json.load(f))
+            except (OSError, ValueError):
+                tail = task.log_tail(5).strip() or f"exit code {task.returncode}"
+                self.failed.append((spec['settings']['output_format'], tail))
+        self._finish()
+
+    def _finish(self):
+        if self.failed:
+            DerivePool._record_failures(self)
+        shutil.rmtree(self.workdir, ignore_errors=True)
+        if self.scratch_dir:
+            shutil.rmtree(self.scratch_dir, ignore_errors=True)
+        self._done.set()
+
+
+class DerivePool:
+    """One thread feeding the processes of every DeriveJob to a
+    ProcessExecutor (the batch's process and memory limits)"""
+
+    _jobs = []
+    _executor = None
+    _cond = threading.Condition()
+    _thread = None
+    _stop = False
+    # Outputs that failed since the last clear_errors(), for the render box
+    failed_outputs = 0
+    last_error = None
+
+    @classmethod
+    def submit(cls, job, scene):
+        """Queue a DeriveJob; without a Blender binary it runs right here.
+        Returns the job."""
+        if not job.tasks:
+            job.run_here()
+            return job
+        with cls._cond:
+            if cls._executor is None or not (cls._executor.running or cls._executor.pending):
+                cls._executor = executor_for(scene)
+            cls._jobs.append(job)
+            if cls._thread is None or not cls._thread.is_alive():
+                cls._stop = False
+                cls._thread = threading.Thread(target=cls._run, name="cameraide-derive", daemon=True)
+                cls._thread.start()
+            cls._cond.notify()
+        return job
+
+    @classmethod
+    def _run(cls):
+        while True:
+            with cls._cond:
+                while not cls._jobs and not cls._stop:
+                    cls._cond.wait()
+                if cls._stop:
+                    return
+                for job in cls._jobs:
+                    if not job.started and (job.after is None or job.after.complete):
+                        job.started = True
+                        for task in job.tasks:
+                            cls._executor.submit(task)
+                cls._executor.poll()
+                done = [job for job in cls._jobs
+                        if job.started and all(t.returncode is not None for t in job.tasks)]
+                for job in done:
+                    cls._jobs.remove(job)
+            for job in done:
+                job._collect()
+            time.sleep(_POLL_SECONDS)
+
+    @classmethod
+    def _record_failures(cls, job):
+        fmt, error = job.failed[-1]
+        with cls._cond:
+            cls.failed_outputs += len(job.failed)
+            cls.last_error = f"{job.camera_name} {fmt}: {error}"
+
+    @classmethod
+    def clear_errors(cls):
+        """Forget failed outputs of earlier renders"""
+        with cls._cond:
+            cls.failed_outputs = 0
+            cls.last_error = None
+
+    @classmethod
+    def pending_outputs(cls):
+        with cls._cond:
+            return sum(len(job.tasks) for job in cls._jobs)
+
+    @classmethod
+    def is_busy(cls):
+        with cls._cond:
+            return bool(cls._jobs)
+
+    @classmethod
+    def wait_all(cls, timeout=None):
+        """Wait for every queued job. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with cls._cond:
+            jobs = list(cls._jobs)
+        for job in jobs:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            if not job.wait(remaining):
+                return False
+        return True
+
+    @classmethod
+    def shutdown(cls, timeout=30.0):
+        """Give queued conversions a chance to finish, then stop the
+        remaining processes."""
+        cls.wait_all(timeout)
+        with cls._cond:
+            cls._stop = True
+            jobs, cls._jobs = cls._jobs, []
+            if cls._executor is not None:
+                cls._executor.cancel()
+            cls._cond.notify_all()
+        if cls._thread is not None:
+            cls._thread.join(1.0)
+            cls._thread = None
+        for job in jobs:
+            job.failed.append(('', "cancelled"))
+            job._finish()
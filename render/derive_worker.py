@@ -0,0 +1,30 @@
+"""Child-process script: write one output target from rendered frames.
+
+Run by Cameraide's output targets, not imported by the add-on:
+
+    blender -b --python derive_worker.py -- <addon> <spec.json>
+
+No scene is loaded: the spec lists the frames and the target's settings,
+and the written paths are saved to <spec.json>.out.
+"""
+import importlib
+import sys
+import bpy
+
+
+def main(argv):
+    addon, spec_path = argv[0], argv[1]
+
+    import addon_utils
+    if addon not in bpy.context.preferences.addons:
+        addon_utils.enable(addon)
+    derive = importlib.import_module(f"{addon}.render.derive")
+    try:
+        derive.run_spec_file(spec_path)
+    except (RuntimeError, OSError) as e:
+        print(f"Cameraide: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:])
@@ -0,0 +1,64 @@
+"""Image-sequence to movie encoding through a temporary sequencer scene"""
+import os
+from types import SimpleNamespace
+import bpy
+from .formats.video import apply_video_format
+
+
+def _strips(sequence_editor):
+    # Blender 4.4 renamed SequenceEditor.sequences to strips
+    strips = getattr(sequence_editor, 'strips', None)
+    return strips if strips is not None else sequence_editor.sequences
+
+
+def encode_image_sequence(frame_paths, movie_path, settings, resolution, fps,
+                          fps_base=1.0, frame_start=1):
+    """Encode image files (in order, duplicates allowed) into movie_path.
+
+    The movie uses the Cameraide video settings of `settings`, the pixel
+    `resolution` (x, y) and the frame rate fps / fps_base. Frames are fed to Blender's own
+    encoder through a throwaway scene whose sequencer holds one image strip,
+    so nothing is re-rendered. All frames must live in one folder.
+    """
+    if not frame_paths:
+        return None
+    folder = os.path.dirname(frame_paths[0])
+    tmp = bpy.data.scenes.new(".cameraide_encode")
+    try:
+        render = tmp.render
+        render.resolution_x, render.resolution_y = resolution
+        render.resolution_percentage = 100
+        render.fps = fps
+        render.fps_base = fps_base
+        render.use_sequencer = True
+        render.use_compositing = False
+        render.film_transparent = settings.film_transparent
+        # Frames are already display-referred; don't apply a view transform twice
+        tmp.view_settings.view_transform = 'Standard'
+        tmp.view_settings.look = 'None'
+
+        editor = tmp.sequence_editor_create()
+        strip = _strips(editor).new_image(
+            name="frames", filepath=frame_paths[0], channel=1, frame_start=frame_start
+        )
+        for path in frame_paths[1:]:
+            strip.elements.append(os.path.relpath(path, folder))
+
+        tmp.frame_start = frame_start
+        tmp.frame_end = frame_start + len(frame_paths) - 1
+        tmp.frame_step = 1
+
+        apply_video_format(settings, SimpleNamespace(scene=tmp))
+        # The scene has no sound; audio is muxed in afterwards if wanted
+        render.ffmpeg.audio_codec = 'NONE'
+        render.filepath = os.path.join(os.path.dirname(movie_path), ".cameraide_encode_")
+        written = render.frame_path(frame=frame_start)
+
+        bpy.ops.render.render(animation=True, scene=tmp.name)
+
+        if os.path.exists(written):
+            os.replace(written, movie_path)
+            return movie_path
+        return None
+    finally:
+        bpy.data.scenes.remove(tmp)
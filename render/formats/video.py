@@ -40,8 +40,12 @@ def apply_video_format(settings, context):
         ffmpeg.minrate = 0
         ffmpeg.maxrate = settings.video_bitrate * 2
         ffmpeg.gopsize = settings.video_gopsize
+
+    ffmpeg.ffmpeg_preset = settings.video_encoder_speed
+    ffmpeg.use_max_b_frames = settings.use_max_b_frames
+    ffmpeg.max_b_frames = settings.max_b_frames
     
-    if settings.audio_codec != 'NONE':
+    if settings.use_audio and settings.audio_codec != 'NONE':
         ffmpeg.audio_codec = settings.audio_codec
         ffmpeg.audio_bitrate = settings.audio_bitrate
     else:
@@ -59,6 +63,9 @@ def store_video_settings(storage_dict, context):
         'ffmpeg_minrate': ffmpeg.minrate,
         'ffmpeg_maxrate': ffmpeg.maxrate,
         'ffmpeg_gopsize': ffmpeg.gopsize,
+        'ffmpeg_ffmpeg_preset': ffmpeg.ffmpeg_preset,
+        'ffmpeg_use_max_b_frames': ffmpeg.use_max_b_frames,
+        'ffmpeg_max_b_frames': ffmpeg.max_b_frames,
         'ffmpeg_audio_codec': ffmpeg.audio_codec,
         'ffmpeg_audio_bitrate': ffmpeg.audio_bitrate
     })
@@ -1,6 +1,7 @@
 """Render completion handlers for Cameraide"""
 import bpy
 from ..utils.render_manager import RenderCleanupManager
+from .postprocess import JobPostProcess
 
 
 def render_complete_handler(scene, depsgraph):
@@ -8,15 +9,27 @@ def render_complete_handler(scene, depsgraph):
     RenderCleanupManager.restore_settings(bpy.context)
     remove_render_handlers()
     _refresh_native_snapshot(scene)
+    # Encoding renders again, which can't start inside a render handler
+    if JobPostProcess.has_pending():
+        bpy.app.timers.register(_finish_post_process, first_interval=0.1)
 
 
 def render_cancel_handler(scene, depsgraph):
     """Handler for render cancellation"""
+    JobPostProcess.discard()
     RenderCleanupManager.restore_settings(bpy.context)
     remove_render_handlers()
     _refresh_native_snapshot(scene)
 
 
+def _finish_post_process():
+    try:
+        JobPostProcess.finish()
+    except (RuntimeError, OSError):
+        pass  # kept in JobPostProcess.last_error for the render box
+    return None
+
+
 def _refresh_native_snapshot(scene):
     """After restoring native settings, re-push cameraide values so the
     snapshot stays in sync and the native-change handler doesn't misread
@@ -0,0 +1,180 @@
+"""Render manifests: the Cameraide queue as a self-contained JSON file.
+
+A manifest holds everything a worker needs to render the queue without
+evaluating it again: the .blend path, each job's resolved frame range
+(marker ranges included), a snapshot of the camera's Cameraide settings and
+the output files the job will write. Workers open the .blend, push the
+snapshot back onto each camera and render any subset of jobs directly.
+"""
+import json
+import os
+import time
+import bpy
+from ..utils.camera_names import get_clean_camera_name, name_matches
+from ..utils.render_manager import RenderCleanupManager
+from ..utils.profiles import effective_settings
+from .postprocess import JobPostProcess
+from .runner import job_output_paths
+
+MANIFEST_FORMAT = "cameraide-manifest"
+MANIFEST_VERSION = 1
+
+# Range fields are resolved into each job; writing them back would fire
+# their update callbacks (timeline sync) for nothing.
+_RANGE_FIELDS = {
+    'use_custom_settings', 'frame_range_mode', 'frame_start', 'frame_end',
+    'stored_frame_start', 'stored_frame_end', 'sync_frame_range',
+}
+_SKIP_PROP_TYPES = {'POINTER', 'COLLECTION'}
+
+
+def settings_to_dict(settings):
+    """Plain-JSON snapshot of a CameraideSettings group, or of the effective
+    settings of a camera with a profile"""
+    data = {}
+    for prop in settings.bl_rna.properties:
+        if prop.identifier == 'rna_type' or prop.type in _SKIP_PROP_TYPES:
+            continue
+        value = getattr(settings, prop.identifier)
+        if prop.type == 'ENUM' and prop.is_enum_flag:
+            value = sorted(value)
+        elif hasattr(value, '__len__') and not isinstance(value, str):
+            value = list(value)
+        data[prop.identifier] = value
+    # The snapshot holds the resolved values; applied, it detaches the
+    # camera from its profile
+    data['profile'] = ""
+    data['profile_overrides'] = []
+    return data
+
+
+def apply_settings_dict(settings, data):
+    """Write a settings snapshot back, skipping range fields and values this
+    version of the add-on doesn't know. Returns the keys that failed."""
+    failed = []
+    for key, value in data.items():
+        if key in _RANGE_FIELDS or not hasattr(settings, key):
+            continue
+        try:
+            if settings.bl_rna.properties[key].type == 'ENUM' and isinstance(value, list):
+                value = set(value)
+            setattr(settings, key, value)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            failed.append(key)
+    return failed
+
+
+def build_manifest(context, queue):
+    """Manifest dict for (camera, start, end) jobs.
+
+    Output paths are resolved by applying each job's settings to the scene,
+    exactly as a render would, and restoring the scene afterwards.
+    """
+    from ..operators.render_batch import disable_camera_handler, restore_camera_handler
+
+    scene = context.scene
+    jobs = []
+    RenderCleanupManager.store_settings(context)
+    disable_camera_handler()
+    try:
+        for index, (cam_obj, start, end) in enumerate(queue):
+            settings = effective_settings(cam_obj, scene)
+            RenderCleanupManager.apply_camera_settings(context, cam_obj, frame_range=(start, end))
+            plan = JobPostProcess.discard()
+            outputs = plan.outputs if plan else job_output_paths(
+                scene, start, end, settings.frame_step)
+            jobs.append({
+                'id': index,
+                'camera': get_clean_camera_name(cam_obj),
+                'object': cam_obj.name,
+                'frame_start': start,
+                'frame_end': end,
+                'frame_step': settings.frame_step,
+                'hold_frames': settings.hold_frames,
+                'output_format': settings.output_format,
+                'outputs': [bpy.path.abspath(p) for p in outputs],
+                'settings': settings_to_dict(settings),
+            })
+    finally:
+        RenderCleanupManager.restore_settings(context)
+        restore_camera_handler()
+
+    from .. import bl_info
+    return {
+        'format': MANIFEST_FORMAT,
+        'version': MANIFEST_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'blender': bpy.app.version_string,
+        'cameraide': ".".join(str(v) for v in bl_info['version']),
+        'blend': bpy.data.filepath,
+        'scene': scene.name,
+        'engine': scene.render.engine,
+        'jobs': jobs,
+    }
+
+
+def export_manifest(context, queue, path):
+    """Write build_manifest() to path. Returns the manifest dict."""
+    manifest = build_manifest(context, queue)
+    path = bpy.path.abspath(path)
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def load_manifest(path):
+    """Read and validate a manifest. Raises ValueError if it isn't one this
+    version can execute."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except OSError as e:
+        raise ValueError(f"Can't read manifest: {e}") from e
+    except json.JSONDecodeError as e:
+        raise ValueError(f"{path} is not valid JSON: {e}") from e
+    if not isinstance(manifest, dict) or manifest.get('format') != MANIFEST_FORMAT:
+        raise ValueError(f"{path} is not a Cameraide manifest")
+    if manifest.get('version', 0) > MANIFEST_VERSION:
+        raise ValueError(
+            f"Manifest version {manifest['version']} is newer than supported ({MANIFEST_VERSION})"
+        )
+    return manifest
+
+
+def select_jobs(manifest, job_ids=None, camera_patterns=None, frame_ranges=None):
+    """Subset of manifest jobs by id, camera name pattern and frame ranges.
+    Jobs overlapping several frame ranges are split, like filter_queue."""
+    selected = []
+    for job in manifest['jobs']:
+        if job_ids is not None and job['id'] not in job_ids:
+            continue
+        if camera_patterns and not any(name_matches(job['camera'], p) for p in camera_patterns):
+            continue
+        if not frame_ranges:
+            selected.append(job)
+            continue
+        for lo, hi in frame_ranges:
+            s, e = max(job['frame_start'], lo), min(job['frame_end'], hi)
+            if s <= e:
+                selected.append(dict(job, frame_start=s, frame_end=e))
+    return selected
+
+
+def manifest_queue(context, jobs):
+    """Turn manifest jobs into a render queue for the open .blend.
+
+    Each camera gets its settings snapshot back before rendering. Raises
+    ValueError when a job's camera isn't in the scene.
+    """
+    scene = context.scene
+    queue = []
+    for job in jobs:
+        cam_obj = scene.objects.get(job['object'])
+        if cam_obj is None or cam_obj.type != 'CAMERA':
+            raise ValueError(f"Manifest camera '{job['object']}' is not in scene '{scene.name}'")
+        apply_settings_dict(cam_obj.data.cameraide_settings, job['settings'])
+        queue.append((cam_obj, job['frame_start'], job['frame_end']))
+    return queue
@@ -0,0 +1,147 @@
+"""Peak-memory estimates for Cameraide's parallel render processes.
+
+The process executor admits a job only while the estimated peak memory of
+everything running stays under a budget. Estimates come from the measured
+peak RSS of earlier processes with the same signature when there is one,
+and otherwise from a model: the memory the scene already takes in this
+session (a child loads the same data) plus render and output buffers
+sized by resolution and output bit depth.
+"""
+import json
+import os
+import sys
+import threading
+import bpy
+from ..utils.storage import user_cache_dir
+from ..utils.telemetry import sample_rss
+
+# Float RGBA render result, display buffer and compositor copies
+_RENDER_BYTES_PER_PIXEL = 64
+# Output buffer per pixel by (format, bit depth)
+_OUTPUT_BYTES_PER_PIXEL = {
+    ('OPEN_EXR', '32'): 16,
+    ('OPEN_EXR', '16'): 8,
+    ('PNG', '16'): 8,
+    ('PNG', '8'): 4,
+    ('JPEG', '8'): 4,
+}
+# Slack on top of the model; history is trusted as measured
+_MODEL_MARGIN = 1.25
+_FALLBACK_BASE = 512 * 1024 ** 2
+GIB = 1024 ** 3
+
+
+def total_memory():
+    """Physical memory in bytes, or None if it can't be determined"""
+    if hasattr(os, 'sysconf'):
+        try:
+            return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+        except (ValueError, OSError):
+            pass
+    if sys.platform == 'win32':
+        import ctypes
+
+        class _MemoryStatus(ctypes.Structure):
+            _fields_ = [('dwLength', ctypes.c_ulong), ('dwMemoryLoad', ctypes.c_ulong),
+                        ('ullTotalPhys', ctypes.c_ulonglong), ('ullAvailPhys', ctypes.c_ulonglong),
+                        ('ullTotalPageFile', ctypes.c_ulonglong), ('ullAvailPageFile', ctypes.c_ulonglong),
+                        ('ullTotalVirtual', ctypes.c_ulonglong), ('ullAvailVirtual', ctypes.c_ulonglong),
+                        ('ullAvailExtendedVirtual', ctypes.c_ulonglong)]
+
+        status = _MemoryStatus()
+        status.dwLength = ctypes.sizeof(status)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullTotalPhys
+    return None
+
+
+def memory_budget(batch_settings):
+    """Budget in bytes for all parallel processes together, or None for no
+    limit. 0 in the setting means 75% of physical memory minus this
+    session's own footprint."""
+    if batch_settings.memory_budget_gb > 0:
+        return int(batch_settings.memory_budget_gb * GIB)
+    total = total_memory()
+    if total is None:
+        return None
+    return max(int(total * 0.75) - (sample_rss() or 0), GIB)
+
+
+def output_bytes_per_pixel(settings):
+    """Output buffer bytes per pixel for a camera's format and bit depth"""
+    fmt = settings.output_format
+    if fmt == 'OPEN_EXR':
+        depth = settings.exr_color_depth
+    elif fmt == 'PNG':
+        depth = settings.png_color_depth
+    else:
+        depth = '8'
+    return _OUTPUT_BYTES_PER_PIXEL.get((fmt, depth), 4)
+
+
+def job_signature(scene, settings, width, height):
+    """History key: what the peak memory of a render process depends on"""
+    return "|".join(str(v) for v in (
+        os.path.basename(bpy.data.filepath), scene.name, scene.render.engine, width, height,
+        settings.output_format, output_bytes_per_pixel(settings),
+    ))
+
+
+def model_estimate(settings, width, height, base=None):
+    """Estimated peak bytes of one render process without history"""
+    if base is None:
+        base = sample_rss() or _FALLBACK_BASE
+    pixels = width * height
+    buffers = pixels * (_RENDER_BYTES_PER_PIXEL + output_bytes_per_pixel(settings))
+    return int((base + buffers) * _MODEL_MARGIN)
+
+
+class MemoryHistory:
+    """Measured peak RSS per job signature, kept across sessions"""
+
+    _peaks = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _path(cls):
+        return os.path.join(user_cache_dir("memory"), "peaks.json")
+
+    @classmethod
+    def _load(cls):
+        if cls._peaks is None:
+            try:
+                with open(cls._path(), 'r', encoding='utf-8') as f:
+                    cls._peaks = json.load(f)
+            except (OSError, ValueError):
+                cls._peaks = {}
+        return cls._peaks
+
+    @classmethod
+    def peak(cls, signature):
+        with cls._lock:
+            return cls._load().get(signature)
+
+    @classmethod
+    def record(cls, signature, peak_bytes):
+        """Keep the larger of the stored and the new peak (decaying the old
+        value a little so a one-off spike doesn't pin the estimate forever)."""
+        if not peak_bytes:
+            return
+        with cls._lock:
+            peaks = cls._load()
+            old = peaks.get(signature, 0)
+            peaks[signature] = int(max(peak_bytes, old * 0.9))
+            try:
+                with open(cls._path(), 'w', encoding='utf-8') as f:
+                    json.dump(peaks, f)
+            except OSError:
+                pass
+
+
+def estimate_job_memory(scene, settings, width, height, base=None):
+    """(signature, estimated peak bytes) for one render process"""
+    signature = job_signature(scene, settings, width, height)
+    measured = MemoryHistory.peak(signature)
+    if measured:
+        return signature, measured
+    return signature, model_estimate(settings, width, height, base)
@@ -0,0 +1,56 @@
+"""Fast playblast profile for viewport (OpenGL) renders"""
+from ..utils.render_manager import RenderCleanupManager
+
+
+def apply_fast_playblast(context):
+    """Switch the scene and 3D views to the scene's fast playblast profile.
+
+    Must be called after RenderCleanupManager.store_settings: render and
+    view settings are restored from the stored dict, 3D view state through
+    RenderCleanupManager.remember. Does nothing when the profile is off.
+    """
+    scene = context.scene
+    profile = scene.cameraide_batch
+    if not profile.use_fast_playblast:
+        return False
+
+    render = scene.render
+    render.use_simplify = True
+    render.simplify_subdivision = profile.playblast_simplify_subdivision
+    render.simplify_child_particles = profile.playblast_simplify_particles
+    if profile.playblast_disable_compositing:
+        render.use_compositing = False
+    if profile.playblast_disable_sequencer:
+        render.use_sequencer = False
+
+    if profile.playblast_standard_view:
+        scene.view_settings.view_transform = 'Standard'
+        scene.view_settings.look = 'None'
+        scene.view_settings.use_curve_mapping = False
+
+    # view_context=False renders use the scene display shading,
+    # view_context=True renders use the 3D view's own shading.
+    if profile.playblast_shading != 'KEEP':
+        RenderCleanupManager.remember(scene.display.shading, 'type')
+        scene.display.shading.type = profile.playblast_shading
+
+    for space in _view3d_spaces(context):
+        if profile.playblast_hide_overlays:
+            RenderCleanupManager.remember(space.overlay, 'show_overlays')
+            space.overlay.show_overlays = False
+        if profile.playblast_shading != 'KEEP':
+            RenderCleanupManager.remember(space.shading, 'type')
+            space.shading.type = profile.playblast_shading
+    return True
+
+
+def _view3d_spaces(context):
+    window_manager = context.window_manager
+    if not window_manager:
+        return []
+    spaces = []
+    for window in window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                spaces.extend(s for s in area.spaces if s.type == 'VIEW_3D')
+    return spaces
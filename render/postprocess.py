@@ -0,0 +1,256 @@
+"""Per-job post-processing for Cameraide renders.
+
+Some job modes can't be expressed as plain render settings and need work
+after the frames are written. The plan for that work is captured when the
+camera's settings are applied (while the scene still holds them). It runs
+once the job's render has finished, so it no longer depends on the scene
+state, which may already have been restored.
+
+- Hold frames: render every Nth frame and fill the skipped frame numbers
+  with hardlinks (or copies) of the last rendered frame. Video jobs render
+  the held frames to a scratch PNG sequence which is then encoded with the
+  camera's video settings, so the movie keeps its timing.
+- Scene audio: video jobs render without audio and get their slice of a
+  shared, once-mixed scene track muxed in afterwards (see audio.py).
+- Local scratch: the job renders to a local folder and its files are moved
+  to the real output path by the background TransferQueue. Image frames
+  are streamed while the job renders; movies and held frames move once
+  the job is finished.
+- Output targets and proxies: extra formats and downscaled copies written
+  from the job's frames by background converter processes (see
+  derive.py). Video jobs with targets render a scratch PNG sequence like
+  hold jobs, so there are frames to convert.
+"""
+import os
+import shutil
+import tempfile
+import bpy
+from .audio import SceneAudio
+from .derive import DeriveJob, DerivePool, has_targets, target_specs
+from .encode import encode_image_sequence
+from .transfer import TransferJob, TransferQueue, scratch_root
+from ..utils.profiles import effective_settings
+
+VIDEO_FORMATS = {'H264_MP4', 'H264_MKV', 'PRORES_MOV'}
+
+
+def link_or_copy(src, dst):
+    """Hardlink src to dst, falling back to a copy across devices or on
+    file systems without hardlinks. Replaces an existing dst."""
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def held_frame_sources(start, end, step, hold):
+    """Map every output frame to the rendered frame it shows.
+    Rendered frames are start, start + step*hold, ..."""
+    stride = step * hold
+    return {f: start + ((f - start) // stride) * stride for f in range(start, end + 1, step)}
+
+
+class JobPlan:
+    """Everything needed to finish one job after its render"""
+
+    def __init__(self, camera_name, start, end, step, hold):
+        self.camera_name = camera_name
+        self.start = start
+        self.end = end
+        self.step = step
+        self.hold = hold
+        self.frame_paths = {}       # output frame -> image path
+        self.movie_path = None      # final movie (video jobs)
+        self.scratch_dir = None     # temporary frames for video jobs
+        self.video_settings = None  # camera settings used to encode
+        self.resolution = None
+        self.fps = None
+        self.audio = None           # AudioPlan when audio is muxed afterwards
+        self.transfer = None        # TransferJob for local scratch jobs
+        self.last_written = None    # streamed one frame behind the render
+        self.targets = []           # [(spec, AudioPlan)] of extra outputs
+
+    @property
+    def outputs(self):
+        if self.movie_path:
+            return [self.movie_path]
+        return [self.frame_paths[f] for f in sorted(self.frame_paths)]
+
+
+def _stream_written_frame(scene, depsgraph=None):
+    """render_write: queue the previous frame for transfer. The frame just
+    written may still be read by other render_write handlers (telemetry)."""
+    plan = JobPostProcess._pending
+    if plan is None or plan.transfer is None:
+        return
+    previous = plan.last_written
+    plan.last_written = plan.frame_paths.get(scene.frame_current)
+    if previous:
+        plan.transfer.add(previous)
+
+
+def _stop_streaming():
+    if _stream_written_frame in bpy.app.handlers.render_write:
+        bpy.app.handlers.render_write.remove(_stream_written_frame)
+
+
+class JobPostProcess:
+    """Holds the plan of the job being rendered and finishes it afterwards"""
+
+    _pending = None
+    # TransferJob of the last finished or discarded job, for callers that
+    # must wait for its files to reach the output path
+    last_transfer = None
+    # DeriveJob writing the output targets of the last finished job
+    last_derive = None
+    # Why the last failed finish() failed, for the render box
+    last_error = None
+
+    @classmethod
+    def clear_errors(cls):
+        """Forget failures of earlier renders: post-processing, file
+        transfers and extra outputs. Called when a render or batch starts."""
+        cls.last_error = None
+        TransferQueue.clear_errors()
+        DerivePool.clear_errors()
+
+    @classmethod
+    def prepare(cls, context, cam_obj, base_step):
+        """Called at the end of apply_camera_settings for animation jobs.
+        May redirect the render output (local scratch, video hold jobs).
+        Returns the plan or None when the job needs no post-processing."""
+        cls.discard()
+        cls.last_transfer = None
+        cls.last_derive = None
+        scene = context.scene
+        settings = effective_settings(cam_obj, scene)
+        hold = settings.hold_frames
+        audio = None
+        if settings.output_format in VIDEO_FORMATS:
+            audio = SceneAudio.plan(scene, settings, scene.frame_start, scene.frame_end)
+        targets = has_targets(settings)
+        if hold <= 1 and not settings.use_local_scratch and audio is None and not targets:
+            return None
+
+        plan = JobPlan(cam_obj.name, scene.frame_start, scene.frame_end, base_step, hold)
+        render = scene.render
+        # Captured now: the scene may be restored before the plan runs
+        pct = render.resolution_percentage / 100
+        plan.resolution = (int(render.resolution_x * pct), int(render.resolution_y * pct))
+        plan.fps = (render.fps, render.fps_base)
+        final = bpy.path.abspath(render.filepath)
+        if targets:
+            plan.targets = target_specs(scene, settings, final, plan.start, plan.end,
+                                        plan.resolution)
+
+        if settings.use_local_scratch:
+            local_dir = tempfile.mkdtemp(prefix="job_", dir=scratch_root(scene.cameraide_batch))
+            render.filepath = os.path.join(local_dir, os.path.basename(final))
+            plan.transfer = TransferJob(cam_obj.name, local_dir, os.path.dirname(final))
+
+        if render.is_movie_format:
+            plan.movie_path = render.frame_path(frame=scene.frame_start)
+        if audio:
+            plan.audio = audio
+            render.ffmpeg.audio_codec = 'NONE'
+
+        if (hold > 1 or targets) and settings.output_format in VIDEO_FORMATS:
+            plan.video_settings = settings
+            plan.scratch_dir = tempfile.mkdtemp(prefix="cameraide_hold_")
+            render.filepath = os.path.join(plan.scratch_dir, "frame_")
+            render.image_settings.media_type = 'IMAGE'
+            render.image_settings.file_format = 'PNG'
+            render.image_settings.color_mode = 'RGBA'
+            render.image_settings.color_depth = '8'
+            render.image_settings.compression = 0
+
+        plan.frame_paths = {
+            f: render.frame_path(frame=f)
+            for f in range(plan.start, plan.end + 1, plan.step)
+        }
+        if plan.transfer and hold <= 1 and not plan.movie_path:
+            if _stream_written_frame not in bpy.app.handlers.render_write:
+                bpy.app.handlers.render_write.append(_stream_written_frame)
+        cls._pending = plan
+        return plan
+
+    @classmethod
+    def discard(cls):
+        """Drop the pending plan without running it. Returns the plan.
+        Files a scratch job already wrote still go to the output path."""
+        plan = cls._pending
+        cls._pending = None
+        _stop_streaming()
+        if plan and plan.scratch_dir:
+            shutil.rmtree(plan.scratch_dir, ignore_errors=True)
+        if plan and plan.transfer:
+            plan.transfer.seal([p for p in plan.outputs if os.path.exists(p)])
+            cls.last_transfer = plan.transfer
+        return plan
+
+    @classmethod
+    def has_pending(cls):
+        return cls._pending is not None
+
+    @classmethod
+    def _derive(cls, plan):
+        """Queue the plan's output targets. Scratch frames of video jobs
+        now belong to the DeriveJob; frames that are moving to the output
+        path are read from there once they have arrived."""
+        frames = [(f, plan.frame_paths[f]) for f in sorted(plan.frame_paths)]
+        after = None
+        if plan.transfer and not plan.scratch_dir:
+            frames = [(f, plan.transfer.destination(p)) for f, p in frames]
+            after = plan.transfer
+        job = DeriveJob(plan.camera_name, plan.targets, frames,
+                        after=after, scratch_dir=plan.scratch_dir)
+        plan.scratch_dir = None
+        return DerivePool.submit(job, bpy.context.scene)
+
+    @classmethod
+    def finish(cls):
+        """Run the pending plan. Returns the job's final output paths, or
+        None if there was nothing to do. Scratch jobs return the paths their
+        files are being moved to; wait on last_transfer for them.
+
+        Raises RuntimeError or OSError when encoding or muxing the scene
+        audio fails (kept in last_error), so the job counts as failed rather
+        than shipping a movie without its sound."""
+        plan = cls._pending
+        cls._pending = None
+        _stop_streaming()
+        if plan is None:
+            return None
+        try:
+            if plan.hold > 1:
+                sources = held_frame_sources(plan.start, plan.end, plan.step, plan.hold)
+                for frame, source in sources.items():
+                    if frame == source:
+                        continue
+                    src = plan.frame_paths.get(source)
+                    if src and os.path.exists(src):
+                        link_or_copy(src, plan.frame_paths[frame])
+
+            if plan.video_settings:
+                frames = [plan.frame_paths[f] for f in sorted(plan.frame_paths)
+                          if os.path.exists(plan.frame_paths[f])]
+                encode_image_sequence(frames, plan.movie_path, plan.video_settings,
+                                      plan.resolution, *plan.fps, frame_start=plan.start)
+            if plan.audio:
+                SceneAudio.mux(plan.audio, plan.movie_path)
+            if plan.targets:
+                cls.last_derive = cls._derive(plan)
+        except (RuntimeError, OSError) as e:
+            cls.last_error = f"{plan.camera_name}: {e}"
+            raise
+        finally:
+            if plan.scratch_dir:
+                shutil.rmtree(plan.scratch_dir, ignore_errors=True)
+            if plan.transfer:
+                plan.transfer.seal(plan.outputs)
+                cls.last_transfer = plan.transfer
+        if plan.transfer:
+            return [plan.transfer.destination(p) for p in plan.outputs]
+        return plan.outputs
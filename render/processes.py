@@ -0,0 +1,276 @@
+"""Background Blender processes for Cameraide's parallel render modes.
+
+A task is a `blender -b` command line. ProcessExecutor runs tasks with
+bounded concurrency and can be driven two ways: poll() from a timer (the UI
+stays responsive, see BackgroundRender) or wait() (headless). Child output
+goes to a log file per task so a full pipe never stalls a render.
+
+With a memory budget, a task starts only while the estimated peaks of the
+running tasks plus its own stay under the budget (a task always starts
+when nothing else runs). The measured peak RSS of each finished child is
+recorded so later estimates for the same kind of job use real numbers.
+"""
+import os
+import subprocess
+import sys
+import time
+from collections import deque
+import bpy
+from .memory import MemoryHistory, memory_budget
+from ..utils.callbacks import tag_view3d_redraw
+
+ADDON_PACKAGE = __package__.rpartition('.')[0]
+
+
+def processes_available():
+    """Whether this Blender can launch background copies of itself"""
+    return bool(bpy.app.binary_path) and os.path.isfile(bpy.app.binary_path)
+
+
+def save_scene_copy(folder, name="scene.blend"):
+    """Save the current session (unsaved edits and applied render settings
+    included) as a copy that child processes can open."""
+    path = os.path.join(folder, name)
+    bpy.ops.wm.save_as_mainfile(filepath=path, copy=True, compress=False)
+    return path
+
+
+def blender_command(blend_path, script, script_args=()):
+    """Command line that runs `script` in background Blender on blend_path.
+    The script receives script_args after `--`; the first one is always the
+    add-on module so the child can disable it (its handlers would push the
+    camera's settings over the render settings the child sets). Without a
+    blend_path the child starts from the startup file."""
+    blend = [blend_path] if blend_path else []
+    return [
+        bpy.app.binary_path, '-b', *blend, '--python', script,
+        '--', ADDON_PACKAGE, *[str(a) for a in script_args],
+    ]
+
+
+def max_processes(batch_settings):
+    """Process limit from the batch settings; 0 means one per CPU core
+    (the memory budget then decides how many actually run)."""
+    return batch_settings.max_processes or os.cpu_count() or 1
+
+
+def executor_for(scene):
+    """ProcessExecutor configured from the scene's batch settings"""
+    batch = scene.cameraide_batch
+    budget = memory_budget(batch) if batch.use_memory_limit else None
+    return ProcessExecutor(max_processes(batch), budget)
+
+
+class ProcessTask:
+    """One child process"""
+
+    def __init__(self, tag, command, log_path=None, estimate=0, signature=None):
+        self.tag = tag
+        self.command = command
+        self.log_path = log_path
+        self.estimate = estimate    # expected peak memory in bytes
+        self.signature = signature  # MemoryHistory key
+        self.process = None
+        self.returncode = None
+        self.peak_rss = None
+        self.started = None
+        self.seconds = None
+
+    @property
+    def ok(self):
+        return self.returncode == 0
+
+    def log_tail(self, lines=20):
+        if not self.log_path or not os.path.exists(self.log_path):
+            return ""
+        with open(self.log_path, 'r', encoding='utf-8', errors='replace') as f:
+            return "".join(f.readlines()[-lines:])
+
+
+def _wait_nohang(process):
+    """(finished, returncode, peak RSS bytes) without blocking. Peak RSS
+    comes from wait4 where the platform has it."""
+    if not hasattr(os, 'wait4'):
+        code = process.poll()
+        return code is not None, code, None
+    try:
+        pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+    except ChildProcessError:
+        code = process.poll()
+        return code is not None, code, None
+    if pid == 0:
+        return False, None, None
+    process.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is bytes on macOS, kilobytes on Linux/BSD
+    peak = usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+    return True, process.returncode, peak
+
+
+class ProcessExecutor:
+    """Runs ProcessTasks, at most max_workers at a time and, with a
+    memory_budget (bytes), only while their estimated peaks fit in it"""
+
+    def __init__(self, max_workers=2, memory_budget=None):
+        self.max_workers = max(int(max_workers), 1)
+        self.memory_budget = memory_budget
+        self.pending = deque()
+        self.running = []
+        self.finished = []
+
+    def submit(self, task):
+        self.pending.append(task)
+        return task
+
+    @property
+    def reserved_memory(self):
+        return sum(t.estimate for t in self.running)
+
+    def _can_start(self, task):
+        if len(self.running) >= self.max_workers:
+            return False
+        if self.memory_budget is None or not self.running:
+            return True
+        return self.reserved_memory + task.estimate <= self.memory_budget
+
+    def _start(self, task):
+        log = open(task.log_path, 'w', encoding='utf-8') if task.log_path else subprocess.DEVNULL
+        try:
+            task.process = subprocess.Popen(task.command, stdout=log, stderr=subprocess.STDOUT)
+        finally:
+            if task.log_path:
+                log.close()
+        task.started = time.perf_counter()
+        self.running.append(task)
+
+    def _reap(self):
+        still_running = []
+        for task in self.running:
+            done, code, peak = _wait_nohang(task.process)
+            if not done:
+                still_running.append(task)
+                continue
+            task.returncode = code
+            task.peak_rss = peak
+            task.seconds = time.perf_counter() - task.started
+            if task.ok and task.signature and peak:
+                MemoryHistory.record(task.signature, peak)
+            self.finished.append(task)
+        self.running = still_running
+
+    def poll(self):
+        """Reap finished tasks and start pending ones that fit (in submit
+        order, smaller later tasks may overtake a large one that doesn't fit
+        yet). True when all are done."""
+        self._reap()
+        for task in list(self.pending):
+            if len(self.running) >= self.max_workers:
+                break
+            if self._can_start(task):
+                self.pending.remove(task)
+                self._start(task)
+        return not self.pending and not self.running
+
+    def wait(self, poll_seconds=0.25):
+        while not self.poll():
+            time.sleep(poll_seconds)
+        return self.finished
+
+    def cancel(self):
+        self.pending.clear()
+        for task in self.running:
+            task.process.terminate()
+        for task in self.running:
+            try:
+                task.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                task.process.kill()
+        self.running = []
+
+    @property
+    def failed(self):
+        return [t for t in self.finished if not t.ok]
+
+    @property
+    def progress(self):
+        total = len(self.pending) + len(self.running) + len(self.finished)
+        return len(self.finished), total
+
+
+class BackgroundRender:
+    """Drives one process-backed job from a timer so the UI stays responsive.
+
+    A job has start(), poll(), finish(), cancel() and cleanup(), an
+    `executor`, and a `label`/`unit` for the progress row. Only one runs at
+    a time: they share the machine's processes and memory budget.
+    """
+
+    _job = None
+    _on_done = None
+    last_label = None
+    last_status = None
+    last_error = None
+
+    @classmethod
+    def is_running(cls):
+        return cls._job is not None
+
+    @classmethod
+    def progress(cls):
+        return cls._job.executor.progress if cls._job else (0, 0)
+
+    @classmethod
+    def describe(cls):
+        """(label, unit) of the running job"""
+        return (cls._job.label, cls._job.unit) if cls._job else (None, None)
+
+    @classmethod
+    def start(cls, job, on_done):
+        """on_done(status, error), if given, runs with 'FINISHED', 'FAILED'
+        or 'CANCELLED'."""
+        if cls._job is not None:
+            raise RuntimeError(f"{cls._job.label} is already running")
+        cls._job = job
+        cls._on_done = on_done
+        try:
+            job.start()
+        except Exception:
+            cls._job = cls._on_done = None
+            job.cleanup()
+            raise
+        bpy.app.timers.register(cls._tick, first_interval=0.5)
+
+    @classmethod
+    def _complete(cls, status, error=None):
+        on_done = cls._on_done
+        cls.last_label = cls._job.label
+        cls._job = cls._on_done = None
+        cls.last_status, cls.last_error = status, error
+        if on_done:
+            on_done(status, error)
+        tag_view3d_redraw()
+
+    @classmethod
+    def _tick(cls):
+        job = cls._job
+        if job is None:
+            return None
+        if not job.poll():
+            tag_view3d_redraw()
+            return 0.5
+        try:
+            job.finish()
+        except Exception as e:
+            cls._complete('FAILED', str(e))
+        else:
+            cls._complete('FINISHED')
+        return None
+
+    @classmethod
+    def cancel(cls):
+        job = cls._job
+        if job is None:
+            return
+        if bpy.app.timers.is_registered(cls._tick):
+            bpy.app.timers.unregister(cls._tick)
+        job.cancel()
+        cls._complete('CANCELLED')
@@ -0,0 +1,71 @@
+"""Per-camera render quality (samples, noise, bounces) for Cameraide"""
+
+# Tier presets: samples, adaptive noise threshold, denoise, max bounces, time limit (s)
+QUALITY_TIERS = {
+    'DRAFT':   {'samples': 16,  'noise_threshold': 0.1,  'denoise': True, 'max_bounces': 4,  'time_limit': 0.0},
+    'PREVIEW': {'samples': 64,  'noise_threshold': 0.05, 'denoise': True, 'max_bounces': 8,  'time_limit': 0.0},
+    'FINAL':   {'samples': 512, 'noise_threshold': 0.01, 'denoise': True, 'max_bounces': 12, 'time_limit': 0.0},
+}
+
+EEVEE_ENGINES = {'BLENDER_EEVEE', 'BLENDER_EEVEE_NEXT'}
+
+
+def resolve_quality(settings):
+    """Effective quality values for a camera, or None to keep the scene's."""
+    if settings.quality_tier == 'SCENE':
+        return None
+    if settings.quality_tier in QUALITY_TIERS:
+        return dict(QUALITY_TIERS[settings.quality_tier], denoiser=settings.quality_denoiser)
+    return {
+        'samples': settings.quality_samples,
+        'noise_threshold': settings.quality_noise_threshold,
+        'denoise': settings.quality_denoise,
+        'denoiser': settings.quality_denoiser,
+        'max_bounces': settings.quality_max_bounces,
+        'time_limit': settings.quality_time_limit,
+    }
+
+
+def apply_quality_settings(settings, context):
+    """Apply the camera's quality tier to the active render engine"""
+    quality = resolve_quality(settings)
+    if quality is None:
+        return
+    scene = context.scene
+    engine = scene.render.engine
+
+    if engine == 'CYCLES' and hasattr(scene, 'cycles'):
+        cycles = scene.cycles
+        cycles.samples = quality['samples']
+        cycles.use_adaptive_sampling = quality['noise_threshold'] > 0.0
+        if quality['noise_threshold'] > 0.0:
+            cycles.adaptive_threshold = quality['noise_threshold']
+        cycles.use_denoising = quality['denoise']
+        if quality['denoise']:
+            try:
+                cycles.denoiser = quality['denoiser']
+            except TypeError:
+                pass  # e.g. OptiX without a supported GPU
+        cycles.max_bounces = quality['max_bounces']
+        cycles.time_limit = quality['time_limit']
+
+    elif engine in EEVEE_ENGINES:
+        # EEVEE has no bounce, denoiser or time limit controls per render
+        scene.eevee.taa_render_samples = quality['samples']
+
+
+def store_quality_settings(storage_dict, context):
+    """Store engine quality settings"""
+    scene = context.scene
+    if hasattr(scene, 'cycles'):
+        cycles = scene.cycles
+        storage_dict.update({
+            'cycles_samples': cycles.samples,
+            'cycles_use_adaptive_sampling': cycles.use_adaptive_sampling,
+            'cycles_adaptive_threshold': cycles.adaptive_threshold,
+            'cycles_use_denoising': cycles.use_denoising,
+            'cycles_denoiser': cycles.denoiser,
+            'cycles_max_bounces': cycles.max_bounces,
+            'cycles_time_limit': cycles.time_limit,
+        })
+    storage_dict['eevee_taa_render_samples'] = scene.eevee.taa_render_samples
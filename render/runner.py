@@ -0,0 +1,142 @@
+"""Synchronous job runner for Cameraide.
+
+Renders queue jobs in the foreground (blocking), which is what background
+mode (`blender -b`) needs: there is no window, no timer loop and no
+render_complete round trip to advance a queue.
+"""
+import os
+import time
+import bpy
+from ..utils.render_manager import RenderCleanupManager
+from ..utils.camera_names import get_clean_camera_name
+from ..utils.profiles import effective_settings
+from ..utils.telemetry import RenderTelemetry
+from ..utils import profiling
+from .postprocess import JobPostProcess
+from .tiles import TiledJob
+
+
+def job_output_paths(scene, start, end, step=1):
+    """Files a job writes with the current render settings: one movie file,
+    or one image per rendered frame."""
+    if scene.render.is_movie_format:
+        return [scene.render.frame_path(frame=start)]
+    return [scene.render.frame_path(frame=f) for f in range(start, end + 1, max(step, 1))]
+
+
+def render_job(context, cam_obj, start, end):
+    """Apply a camera's settings and render one (camera, start, end) job.
+
+    Returns a result dict (timings, frames, outputs). Does not store or
+    restore scene settings; run_queue wraps that around the whole queue.
+    """
+    scene = context.scene
+    settings = effective_settings(cam_obj, scene)
+    result = {
+        'camera': get_clean_camera_name(cam_obj),
+        'object': cam_obj.name,
+        'frame_start': start,
+        'frame_end': end,
+        'frame_step': settings.frame_step,
+        'hold_frames': settings.hold_frames,
+        'format': settings.output_format,
+        'status': 'FINISHED',
+    }
+
+    RenderTelemetry.start_job(cam_obj, start, end)
+    t0 = time.perf_counter()
+    scene.camera = cam_obj
+    RenderCleanupManager.apply_camera_settings(context, cam_obj, frame_range=(start, end))
+    t1 = time.perf_counter()
+
+    try:
+        with profiling.span("render_job", 'render', camera=cam_obj.name,
+                            frame_start=start, frame_end=end, kind='HEADLESS'):
+            if settings.use_tiled_render:
+                TiledJob(context, cam_obj, start, end).run()
+            else:
+                bpy.ops.render.render(animation=True)
+    except Exception as e:
+        result['status'] = 'FAILED'
+        result['error'] = str(e)
+    outputs = None
+    if result['status'] == 'FINISHED':
+        try:
+            outputs = JobPostProcess.finish()
+        except (RuntimeError, OSError) as e:
+            result['status'] = 'FAILED'
+            result['error'] = str(e)
+    else:
+        JobPostProcess.discard()
+    # Local scratch jobs are complete once their files reach the output path
+    transfer = JobPostProcess.last_transfer
+    if transfer:
+        transfer.wait()
+        if transfer.failed and result['status'] == 'FINISHED':
+            result['status'] = 'FAILED'
+            result['error'] = (f"{len(transfer.failed)} files could not be moved to "
+                               f"{transfer.final_dir} (left in {transfer.local_dir})")
+    t2 = time.perf_counter()
+    RenderTelemetry.end_job(result['status'])
+
+    outputs = outputs or job_output_paths(scene, start, end, settings.frame_step)
+    frames = len(range(start, end + 1, max(settings.frame_step, 1)))
+    written = [p for p in outputs if os.path.exists(p)]
+    if result['status'] == 'FINISHED' and not written:
+        result['status'] = 'FAILED'
+        result['error'] = "No output files were written"
+
+    result.update({
+        'frames': frames,
+        'apply_seconds': round(t1 - t0, 4),
+        'render_seconds': round(t2 - t1, 4),
+        'seconds_per_frame': round((t2 - t1) / frames, 4) if frames else 0.0,
+        'outputs': outputs,
+        'bytes_written': sum(os.path.getsize(p) for p in written),
+    })
+    return result
+
+
+def collect_derived(result, job):
+    """Wait for a job's output targets (JobPostProcess.last_derive after
+    render_job) and add them to its result; a failed target fails the job"""
+    if job is None:
+        return
+    job.wait()
+    result['derived_outputs'] = job.outputs
+    result['bytes_written'] += sum(os.path.getsize(p) for p in job.outputs if os.path.exists(p))
+    if job.failed and result['status'] == 'FINISHED':
+        result['status'] = 'FAILED'
+        result['error'] = "; ".join(f"{fmt} output: {error}" for fmt, error in job.failed)
+
+
+def run_queue(context, queue, on_job_done=None):
+    """Render every (camera, start, end) job in order, blocking.
+
+    Scene settings are stored once before the queue and restored after it,
+    like the viewport batch. Returns the list of per-job result dicts.
+    """
+    from ..operators.render_batch import (disable_camera_handler, restore_camera_handler,
+                                          prepare_normal_queue)
+
+    results = []
+    derives = []
+    RenderCleanupManager.store_settings(context)
+    queue = prepare_normal_queue(context, queue)
+    disable_camera_handler()
+    RenderTelemetry.start_batch(context, 'HEADLESS', queue)
+    try:
+        for cam_obj, start, end in queue:
+            result = render_job(context, cam_obj, start, end)
+            results.append(result)
+            derives.append(JobPostProcess.last_derive)
+            if on_job_done:
+                on_job_done(result)
+    finally:
+        RenderTelemetry.end_batch()
+        RenderCleanupManager.restore_settings(context)
+        restore_camera_handler()
+    # Output targets convert in the background while later jobs render
+    for result, job in zip(results, derives):
+        collect_derived(result, job)
+    return results
@@ -0,0 +1,42 @@
+"""Child-process script: render one camera's snapshot from a saved scene.
+
+Run by Cameraide's Snapshot All, not imported by the add-on:
+
+    blender -b copy.blend --python snapshot_worker.py -- <addon> <camera> <frame>
+
+Unlike the tile worker this keeps the add-on enabled: it applies the
+camera's settings the same way the Snapshot button does (movie formats
+forced to PNG) and writes the still to the camera's output path.
+"""
+import importlib
+import sys
+import bpy
+
+
+def main(argv):
+    addon, camera_name, frame = argv[0], argv[1], int(argv[2])
+
+    import addon_utils
+    if addon not in bpy.context.preferences.addons:
+        addon_utils.enable(addon)
+    render_manager = importlib.import_module(f"{addon}.utils.render_manager")
+    render_batch = importlib.import_module(f"{addon}.operators.render_batch")
+    # Switching scene.camera must not re-sync the timeline or native settings
+    render_batch.disable_camera_handler()
+
+    scene = bpy.context.scene
+    cam_obj = scene.objects.get(camera_name)
+    if cam_obj is None or cam_obj.type != 'CAMERA':
+        print(f"Cameraide: camera '{camera_name}' not found")
+        sys.exit(1)
+
+    scene.frame_set(frame)
+    scene.camera = cam_obj
+    render_manager.RenderCleanupManager.apply_camera_settings(
+        bpy.context, cam_obj, force_image_format=True, apply_frame_range=False
+    )
+    bpy.ops.render.render(animation=False, write_still=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:])
@@ -0,0 +1,95 @@
+"""Snapshot All: one still per Cameraide camera, rendered in parallel.
+
+The session is saved once and every camera renders the current frame in
+its own background Blender process, within the batch's process and memory
+limits. Each process applies its camera's settings like the Snapshot
+button (movie formats become PNG) and writes to the camera's output path.
+"""
+import os
+import shutil
+import tempfile
+from ..utils.render_manager import RenderCleanupManager
+from ..utils.profiles import effective_settings
+from .memory import estimate_job_memory
+from .processes import ProcessTask, blender_command, executor_for, save_scene_copy
+
+_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "snapshot_worker.py")
+
+
+class SnapshotAllJob:
+    """Snapshots of several cameras at one frame, one process per camera.
+
+    Output paths and resolutions are resolved up front by applying each
+    camera's settings between a single store/restore, so the scene is left
+    as it was before the processes start.
+    """
+
+    label = "Snapshot All"
+    unit = "cameras"
+
+    def __init__(self, context, cameras, frame=None):
+        scene = context.scene
+        self.frame = scene.frame_current if frame is None else frame
+        self.executor = executor_for(scene)
+        self.shots = []  # (camera name, output path, (signature, estimate))
+        self.workdir = None
+
+        RenderCleanupManager.store_settings(context)
+        try:
+            for cam_obj in cameras:
+                settings = effective_settings(cam_obj, scene)
+                RenderCleanupManager.apply_camera_settings(
+                    context, cam_obj, force_image_format=True, apply_frame_range=False
+                )
+                render = scene.render
+                pct = render.resolution_percentage / 100
+                width = int(render.resolution_x * pct)
+                height = int(render.resolution_y * pct)
+                self.shots.append((
+                    cam_obj.name,
+                    render.frame_path(frame=self.frame),
+                    estimate_job_memory(scene, settings, width, height),
+                ))
+        finally:
+            RenderCleanupManager.restore_settings(context)
+
+    @property
+    def outputs(self):
+        return [path for _, path, _ in self.shots]
+
+    def start(self):
+        self.workdir = tempfile.mkdtemp(prefix="cameraide_snapshots_")
+        blend = save_scene_copy(self.workdir)
+        for index, (camera_name, _, (signature, estimate)) in enumerate(self.shots):
+            self.executor.submit(ProcessTask(
+                tag=camera_name,
+                command=blender_command(blend, _WORKER_SCRIPT, (camera_name, self.frame)),
+                log_path=os.path.join(self.workdir, f"snapshot{index:03d}.log"),
+                estimate=estimate,
+                signature=signature,
+            ))
+        return self
+
+    def poll(self):
+        return self.executor.poll()
+
+    def cancel(self):
+        self.executor.cancel()
+        self.cleanup()
+
+    def cleanup(self):
+        if self.workdir:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+            self.workdir = None
+
+    def finish(self):
+        """Returns the written stills. Raises RuntimeError naming the cameras
+        whose process failed (the other stills are kept)."""
+        try:
+            failed = self.executor.failed
+            if failed:
+                names = ", ".join(task.tag for task in failed)
+                raise RuntimeError(f"Snapshot failed for {names}:\n{failed[0].log_tail()}")
+            return [path for path in self.outputs if os.path.exists(path)]
+        finally:
+            self.cleanup()
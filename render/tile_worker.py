@@ -0,0 +1,52 @@
+"""Child-process script: render one border region of a saved scene.
+
+Run by Cameraide's tiled renders, not imported by the add-on:
+
+    blender -b copy.blend --python tile_worker.py -- <addon> \\
+        <min_x> <max_x> <min_y> <max_y> <start> <end> <step> <output_prefix>
+
+The scene copy already carries the camera's applied render settings; this
+only restricts rendering to the region and writes float EXR tiles named
+<output_prefix>######.exr.
+"""
+import sys
+import bpy
+
+
+def main(argv):
+    addon = argv[0]
+    min_x, max_x, min_y, max_y = (float(v) for v in argv[1:5])
+    start, end, step = (int(v) for v in argv[5:8])
+    output_prefix = argv[8]
+
+    # The add-on's handlers would push the camera's format over ours
+    import addon_utils
+    if addon in bpy.context.preferences.addons:
+        addon_utils.disable(addon)
+
+    scene = bpy.context.scene
+    render = scene.render
+    render.use_border = True
+    render.use_crop_to_border = True
+    render.border_min_x, render.border_max_x = min_x, max_x
+    render.border_min_y, render.border_max_y = min_y, max_y
+    render.use_stamp = False
+
+    image = render.image_settings
+    if hasattr(image, 'media_type'):
+        image.media_type = 'IMAGE'
+    image.file_format = 'OPEN_EXR'
+    image.color_mode = 'RGBA'
+    image.color_depth = '32'
+    image.exr_codec = 'ZIP'
+    render.use_file_extension = True
+    render.filepath = output_prefix + "######"
+
+    scene.frame_start = start
+    scene.frame_end = end
+    scene.frame_step = step
+    bpy.ops.render.render(animation=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:])
@@ -0,0 +1,187 @@
+"""Region-split (tiled) rendering for very high resolutions.
+
+A tiled job saves a copy of the session with the camera's settings applied,
+renders each border region of the frame in its own background Blender
+process (in parallel, within the batch's process and memory limits), and stitches the
+float EXR tiles back together with NumPy. The stitched frame is saved with
+the scene's output format and colour management, so the result matches a
+normal render; movie formats are stitched to PNGs and encoded afterwards.
+"""
+import os
+import shutil
+import tempfile
+import numpy as np
+import bpy
+from .encode import encode_image_sequence
+from .memory import estimate_job_memory
+from .processes import ProcessTask, blender_command, executor_for, save_scene_copy
+from ..utils.profiles import effective_settings
+
+_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tile_worker.py")
+
+
+def tile_grid(width, height, tiles_x, tiles_y):
+    """Pixel rectangles (x0, x1, y0, y1) covering width x height, y from the
+    bottom like Blender's border. Edges are integers so tiles never overlap."""
+    xs = [(i * width) // tiles_x for i in range(tiles_x + 1)]
+    ys = [(j * height) // tiles_y for j in range(tiles_y + 1)]
+    return [(xs[i], xs[i + 1], ys[j], ys[j + 1])
+            for j in range(tiles_y) for i in range(tiles_x)
+            if xs[i + 1] > xs[i] and ys[j + 1] > ys[j]]
+
+
+class _ImageFormat:
+    """Temporarily switch the scene's output to a still image format"""
+
+    def __init__(self, scene, file_format):
+        self.image = scene.render.image_settings
+        self.file_format = file_format
+
+    def __enter__(self):
+        self.saved = (self.image.media_type, self.image.file_format, self.image.color_mode)
+        self.image.media_type = 'IMAGE'
+        self.image.file_format = self.file_format
+        self.image.color_mode = 'RGBA'
+
+    def __exit__(self, *exc):
+        media_type, file_format, color_mode = self.saved
+        self.image.media_type = media_type
+        self.image.file_format = file_format
+        self.image.color_mode = color_mode
+
+
+class TiledJob:
+    """One camera job (a still or a frame range) rendered in tiles.
+
+    Create it after RenderCleanupManager.apply_camera_settings: it reads
+    resolution, frame step, output paths and format from the scene.
+    """
+
+    label = "Tiled render"
+    unit = "regions"
+
+    def __init__(self, context, cam_obj, start, end, max_workers=None):
+        scene = context.scene
+        settings = effective_settings(cam_obj, scene)
+        render = scene.render
+        self.scene_name = scene.name
+        self.settings = settings
+        self.camera_name = cam_obj.name
+        pct = render.resolution_percentage / 100
+        self.width = int(render.resolution_x * pct)
+        self.height = int(render.resolution_y * pct)
+        self.fps = (render.fps, render.fps_base)
+        self.frames = list(range(start, end + 1, max(scene.frame_step, 1)))
+        self.tiles = tile_grid(self.width, self.height, settings.tiles_x, settings.tiles_y)
+        self.movie_path = render.frame_path(frame=start) if render.is_movie_format else None
+        self.targets = {} if self.movie_path else {f: render.frame_path(frame=f) for f in self.frames}
+        self.executor = executor_for(scene)
+        if max_workers:
+            self.executor.max_workers = max_workers
+        # Every tile process loads the whole scene; only its buffers shrink
+        self.estimates = [estimate_job_memory(scene, settings, x1 - x0, y1 - y0)
+                          for x0, x1, y0, y1 in self.tiles]
+        self.workdir = None
+
+    def _tile_prefix(self, index):
+        return os.path.join(self.workdir, f"tile{index:03d}_")
+
+    def start(self):
+        self.workdir = tempfile.mkdtemp(prefix="cameraide_tiles_")
+        blend = save_scene_copy(self.workdir)
+        step = self.frames[1] - self.frames[0] if len(self.frames) > 1 else 1
+        # Blender truncates border * size to pixels; aim at pixel centres so
+        # float error can't shift an edge by one
+        def edge(px, size):
+            return min((px + 0.5) / size, 1.0)
+
+        for index, (x0, x1, y0, y1) in enumerate(self.tiles):
+            args = (edge(x0, self.width), edge(x1, self.width),
+                    edge(y0, self.height), edge(y1, self.height),
+                    self.frames[0], self.frames[-1], step, self._tile_prefix(index))
+            signature, estimate = self.estimates[index]
+            self.executor.submit(ProcessTask(
+                tag=index,
+                command=blender_command(blend, _WORKER_SCRIPT, args),
+                log_path=os.path.join(self.workdir, f"tile{index:03d}.log"),
+                estimate=estimate,
+                signature=signature,
+            ))
+        return self
+
+    def poll(self):
+        return self.executor.poll()
+
+    def cancel(self):
+        self.executor.cancel()
+        self.cleanup()
+
+    def cleanup(self):
+        if self.workdir:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+            self.workdir = None
+
+    def _load_tile(self, path):
+        image = bpy.data.images.load(path, check_existing=False)
+        try:
+            w, h = image.size
+            pixels = np.empty(w * h * 4, dtype=np.float32)
+            image.pixels.foreach_get(pixels)
+        finally:
+            bpy.data.images.remove(image)
+        return pixels.reshape(h, w, 4)
+
+    def _stitch_frame(self, frame):
+        canvas = np.zeros((self.height, self.width, 4), dtype=np.float32)
+        for index, (x0, x1, y0, y1) in enumerate(self.tiles):
+            path = f"{self._tile_prefix(index)}{frame:06d}.exr"
+            if not os.path.exists(path):
+                raise RuntimeError(f"Tile {index} of frame {frame} is missing")
+            tile = self._load_tile(path)
+            h = min(tile.shape[0], self.height - y0)
+            w = min(tile.shape[1], self.width - x0)
+            canvas[y0:y0 + h, x0:x0 + w] = tile[:h, :w]
+        return canvas
+
+    def finish(self):
+        """Stitch and save every frame (encode for movies). Returns the
+        output paths. Raises RuntimeError if a tile process failed."""
+        failed = self.executor.failed
+        if failed:
+            error = f"{self.camera_name}: tile {failed[0].tag} failed:\n{failed[0].log_tail()}"
+            self.cleanup()
+            raise RuntimeError(error)
+
+        scene = bpy.data.scenes[self.scene_name]
+        targets = self.targets
+        if self.movie_path:
+            frames_dir = os.path.join(self.workdir, "frames")
+            os.makedirs(frames_dir, exist_ok=True)
+            targets = {f: os.path.join(frames_dir, f"frame_{f:06d}.png") for f in self.frames}
+
+        stitched = bpy.data.images.new(".cameraide_stitch", self.width, self.height,
+                                       alpha=True, float_buffer=True)
+        try:
+            for frame in self.frames:
+                stitched.pixels.foreach_set(self._stitch_frame(frame).ravel())
+                os.makedirs(os.path.dirname(targets[frame]) or ".", exist_ok=True)
+                if self.movie_path:
+                    with _ImageFormat(scene, 'PNG'):
+                        stitched.save_render(targets[frame], scene=scene)
+                else:
+                    stitched.save_render(targets[frame], scene=scene)
+            if self.movie_path:
+                encode_image_sequence([targets[f] for f in self.frames], self.movie_path,
+                                      self.settings, (self.width, self.height), *self.fps,
+                                      frame_start=self.frames[0])
+                return [self.movie_path]
+            return [targets[f] for f in self.frames]
+        finally:
+            bpy.data.images.remove(stitched)
+            self.cleanup()
+
+    def run(self, poll_seconds=0.5):
+        """Blocking: start, wait for every tile, stitch."""
+        self.start()
+        self.executor.wait(poll_seconds)
+        return self.finish()
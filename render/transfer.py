@@ -0,0 +1,245 @@
+"""Background transfer of rendered files from local scratch to their output.
+
+Cameras with Local Scratch render to a fast local folder; their files are
+moved to the real output path (often a network share) by a worker thread,
+so the render loop never waits on slow writes. Files are moved in batches
+grouped by destination folder, each file is copied to a temporary name and
+renamed into place (no half-written outputs), and failed moves are retried
+with backoff. Files that still can't be moved stay in the scratch folder.
+
+A TransferJob belongs to one render job: files are added while it renders,
+it is sealed when the render is finished, and the render job counts as
+complete only once its transfer is complete.
+"""
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import defaultdict
+import bpy
+
+BATCH_SIZE = 64
+MAX_ATTEMPTS = 5
+_BACKOFF_SECONDS = 0.5
+_BACKOFF_MAX = 8.0
+
+
+def scratch_root(batch_settings):
+    """Base folder for local scratch renders"""
+    path = batch_settings.scratch_path
+    if path:
+        path = bpy.path.abspath(path)
+    else:
+        path = os.path.join(tempfile.gettempdir(), "cameraide_scratch")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def move_file(src, dst):
+    """Move src to dst: a rename on the same file system, otherwise a copy
+    to a temporary name next to dst renamed into place. Raises OSError."""
+    part = f"{dst}.part"
+    try:
+        os.replace(src, dst)  # same file system: a rename is enough
+        return
+    except OSError:
+        pass
+    shutil.copyfile(src, part)
+    os.replace(part, dst)
+    os.remove(src)
+
+
+class TransferJob:
+    """The files of one render job moving from local_dir to final_dir"""
+
+    def __init__(self, camera_name, local_dir, final_dir):
+        self.camera_name = camera_name
+        self.local_dir = local_dir
+        self.final_dir = final_dir
+        self.added = set()
+        self.moved = []
+        self.failed = []   # (src, error)
+        self.sealed = False
+        self._outstanding = 0
+        self._done = threading.Event()
+
+    def destination(self, path):
+        """Final path for a file written under local_dir"""
+        return os.path.join(self.final_dir, os.path.relpath(path, self.local_dir))
+
+    def add(self, path):
+        """Queue one written file (ignored if missing or already queued)"""
+        if path in self.added or not os.path.exists(path):
+            return
+        self.added.add(path)
+        TransferQueue._put(self, path)
+
+    def seal(self, paths=()):
+        """Queue the job's remaining files; no more files follow."""
+        for path in paths:
+            self.add(path)
+        self.sealed = True
+        TransferQueue._check_done(self)
+
+    @property
+    def complete(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+
+class TransferQueue:
+    """One worker thread moving the files of every TransferJob"""
+
+    _items = []           # (job, src, attempts, not_before)
+    _cond = threading.Condition()
+    _thread = None
+    _stop = False
+    _jobs = []
+    # Files that stayed in scratch since the last clear_errors(), for the
+    # render box
+    failed_files = 0
+    last_error = None
+
+    @classmethod
+    def _ensure_thread(cls):
+        if cls._thread is None or not cls._thread.is_alive():
+            cls._stop = False
+            cls._thread = threading.Thread(target=cls._run, name="cameraide-transfer", daemon=True)
+            cls._thread.start()
+
+    @classmethod
+    def _put(cls, job, path):
+        with cls._cond:
+            if job not in cls._jobs:
+                cls._jobs.append(job)
+            job._outstanding += 1
+            cls._items.append((job, path, 0, 0.0))
+            cls._ensure_thread()
+            cls._cond.notify()
+
+    @classmethod
+    def _check_done(cls, job):
+        with cls._cond:
+            if job._done.is_set() or not job.sealed or job._outstanding:
+                return
+            if job in cls._jobs:
+                cls._jobs.remove(job)
+        _remove_empty_dirs(job.local_dir)
+        job._done.set()
+
+    @classmethod
+    def _take_batch(cls):
+        """Up to BATCH_SIZE items that are due, or None to stop"""
+        with cls._cond:
+            while True:
+                if cls._stop:
+                    return None
+                now = time.monotonic()
+                due = [item for item in cls._items if item[3] <= now][:BATCH_SIZE]
+                if due:
+                    for item in due:
+                        cls._items.remove(item)
+                    return due
+                waits = [item[3] - now for item in cls._items]
+                cls._cond.wait(min(waits) if waits else None)
+
+    @classmethod
+    def _run(cls):
+        while True:
+            batch = cls._take_batch()
+            if batch is None:
+                return
+            by_folder = defaultdict(list)
+            for job, src, attempts, _ in batch:
+                dst = job.destination(src)
+                by_folder[os.path.dirname(dst)].append((job, src, dst, attempts))
+            for folder, items in by_folder.items():
+                try:
+                    os.makedirs(folder, exist_ok=True)
+                    folder_error = None
+                except OSError as e:
+                    folder_error = e
+                for job, src, dst, attempts in items:
+                    try:
+                        if folder_error:
+                            raise folder_error
+                        move_file(src, dst)
+                    except OSError as e:
+                        cls._retry(job, src, attempts + 1, e)
+                    else:
+                        cls._finish_item(job, dst)
+
+    @classmethod
+    def _retry(cls, job, src, attempts, error):
+        if attempts >= MAX_ATTEMPTS:
+            job.failed.append((src, str(error)))
+            with cls._cond:
+                cls.failed_files += 1
+                cls.last_error = f"{job.destination(src)}: {error}"
+            cls._finish_item(job, None)
+            return
+        delay = min(_BACKOFF_SECONDS * 2 ** (attempts - 1), _BACKOFF_MAX)
+        with cls._cond:
+            cls._items.append((job, src, attempts, time.monotonic() + delay))
+            cls._cond.notify()
+
+    @classmethod
+    def _finish_item(cls, job, dst):
+        with cls._cond:
+            if dst:
+                job.moved.append(dst)
+            job._outstanding -= 1
+        cls._check_done(job)
+
+    @classmethod
+    def clear_errors(cls):
+        """Forget failed moves of earlier renders"""
+        with cls._cond:
+            cls.failed_files = 0
+            cls.last_error = None
+
+    @classmethod
+    def pending_files(cls):
+        with cls._cond:
+            return sum(job._outstanding for job in cls._jobs)
+
+    @classmethod
+    def is_busy(cls):
+        with cls._cond:
+            return bool(cls._jobs)
+
+    @classmethod
+    def wait_all(cls, timeout=None):
+        """Wait for every sealed job. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with cls._cond:
+            jobs = [job for job in cls._jobs if job.sealed]
+        for job in jobs:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            if not job.wait(remaining):
+                return False
+        return True
+
+    @classmethod
+    def shutdown(cls, timeout=30.0):
+        """Give queued transfers a chance to finish, then stop the worker.
+        Unmoved files stay in the scratch folder."""
+        cls.wait_all(timeout)
+        with cls._cond:
+            cls._stop = True
+            cls._cond.notify_all()
+        if cls._thread is not None:
+            cls._thread.join(1.0)
+            cls._thread = None
+
+
+def _remove_empty_dirs(root):
+    """Remove root and its subfolders if nothing is left in them"""
+    for folder, _, _ in sorted(os.walk(root), key=lambda entry: -len(entry[0])):
+        try:
+            os.rmdir(folder)
+        except OSError:
+            pass
@@ -0,0 +1,64 @@
+"""Worker loop for coordinator-distributed Cameraide renders"""
+import time
+import urllib.error
+from ..utils.render_manager import RenderCleanupManager
+from .coordinator import Heartbeat
+from .runner import render_job, collect_derived
+from .postprocess import JobPostProcess
+from .manifest import apply_settings_dict
+
+
+def run_worker(context, client, poll_seconds=2.0, heartbeat_seconds=None):
+    """Lease chunks from the coordinator and render them until the queue is
+    finished or the coordinator goes away. Returns the per-chunk results."""
+    from ..operators.render_batch import disable_camera_handler, restore_camera_handler
+
+    heartbeat_seconds = heartbeat_seconds or max(poll_seconds * 5, 10.0)
+    scene = context.scene
+    results = []
+
+    RenderCleanupManager.store_settings(context)
+    if scene.cameraide_batch.use_persistent_batch:
+        scene.render.use_persistent_data = True
+    disable_camera_handler()
+    try:
+        while True:
+            try:
+                reply = client.lease()
+            except (urllib.error.URLError, OSError):
+                break
+            if reply.get('finished'):
+                break
+            chunk = reply.get('chunk')
+            if chunk is None:
+                time.sleep(poll_seconds)
+                continue
+
+            cam_obj = scene.objects.get(chunk['object'])
+            if not cam_obj or cam_obj.type != 'CAMERA':
+                try:
+                    client.fail(chunk['chunk_id'], f"Camera '{chunk['object']}' not found")
+                except (urllib.error.URLError, OSError):
+                    break
+                continue
+            # The coordinator's settings win over the worker's copy of the .blend
+            if chunk.get('settings'):
+                apply_settings_dict(cam_obj.data.cameraide_settings, chunk['settings'])
+
+            with Heartbeat(client, chunk['chunk_id'], heartbeat_seconds):
+                result = render_job(context, cam_obj, chunk['start'], chunk['end'])
+                collect_derived(result, JobPostProcess.last_derive)
+            result['chunk_id'] = chunk['chunk_id']
+            results.append(result)
+
+            try:
+                if result['status'] == 'FINISHED':
+                    client.complete(chunk['chunk_id'], result)
+                else:
+                    client.fail(chunk['chunk_id'], result.get('error'))
+            except (urllib.error.URLError, OSError):
+                break
+    finally:
+        RenderCleanupManager.restore_settings(context)
+        restore_camera_handler()
+    return results
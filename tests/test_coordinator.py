@@ -0,0 +1,110 @@
+"""End-to-end check of the coordinator protocol on one machine.
+
+render/coordinator.py is standard library only, so it is loaded straight
+from its file (the add-on package itself needs bpy). Two CoordinatorClient
+instances play the workers against a real CoordinatorServer on localhost.
+
+    python tests/test_coordinator.py
+    python -m unittest discover -s tests
+"""
+import importlib.util
+import os
+import time
+import unittest
+
+_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                     "render", "coordinator.py")
+_spec = importlib.util.spec_from_file_location("cameraide_coordinator", _PATH)
+coordinator = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(coordinator)
+
+# Short enough to expire within a test, long enough for a request round trip
+_LEASE = 0.5
+
+
+def _jobs():
+    return [
+        {'object': "CAM_A", 'camera': "CAM_A", 'start': 1, 'end': 10},
+        {'object': "CAM_B", 'camera': "CAM_B", 'start': 1, 'end': 48, 'video': True},
+    ]
+
+
+class MakeChunksTest(unittest.TestCase):
+
+    def test_image_jobs_split_video_jobs_kept(self):
+        chunks = coordinator.make_chunks(_jobs(), 4)
+        spans = [(c['object'], c['start'], c['end']) for c in chunks]
+        self.assertEqual(spans, [("CAM_A", 1, 4), ("CAM_A", 5, 8), ("CAM_A", 9, 10),
+                                 ("CAM_B", 1, 48)])
+        self.assertEqual([c['chunk_id'] for c in chunks], [0, 1, 2, 3])
+
+    def test_chunks_start_on_rendered_frames(self):
+        chunks = coordinator.make_chunks(
+            [{'object': "CAM", 'start': 1, 'end': 20, 'step': 2, 'hold': 2}], 2)
+        self.assertEqual([(c['start'], c['end']) for c in chunks],
+                         [(1, 8), (9, 16), (17, 20)])
+
+
+class ProtocolTest(unittest.TestCase):
+
+    def setUp(self):
+        chunks = coordinator.make_chunks(_jobs(), 5)
+        self.coordinator = coordinator.JobCoordinator(chunks, lease_seconds=_LEASE, max_attempts=2)
+        self.server = coordinator.CoordinatorServer(self.coordinator, port=0).start()
+        self.a = coordinator.CoordinatorClient(self.server.url, "worker-a", timeout=5)
+        self.b = coordinator.CoordinatorClient(self.server.url, "worker-b", timeout=5)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _states(self):
+        return {c['chunk_id']: c['status'] for c in self.a.status()['chunks']}
+
+    def test_lease_heartbeat_requeue_complete(self):
+        first = self.a.lease()['chunk']
+        second = self.b.lease()['chunk']
+        self.assertNotEqual(first['chunk_id'], second['chunk_id'])
+
+        # A keeps its lease alive, B goes silent and loses its chunk
+        deadline = time.time() + _LEASE * 2.5
+        while time.time() < deadline:
+            self.assertTrue(self.a.heartbeat(first['chunk_id']))
+            time.sleep(_LEASE / 4)
+        states = self._states()
+        self.assertEqual(states[first['chunk_id']], coordinator.LEASED)
+        self.assertEqual(states[second['chunk_id']], coordinator.PENDING)
+        self.assertFalse(self.b.heartbeat(second['chunk_id']))
+
+        self.assertTrue(self.a.complete(first['chunk_id'], {'frames': 5}))
+        # The requeued chunk goes to whoever asks next
+        requeued = self.a.lease()['chunk']
+        self.assertEqual(requeued['chunk_id'], second['chunk_id'])
+        self.assertTrue(self.a.complete(requeued['chunk_id']))
+
+        while True:
+            reply = self.b.lease()
+            if reply['finished']:
+                break
+            self.assertTrue(self.b.complete(reply['chunk']['chunk_id']))
+        self.assertTrue(self.server.wait(poll_seconds=0.05, timeout=5))
+        self.assertEqual(set(self._states().values()), {coordinator.DONE})
+        # Finished chunks can't be reported twice
+        self.assertFalse(self.b.complete(first['chunk_id']))
+
+    def test_failures_retry_until_max_attempts(self):
+        chunk = self.a.lease()['chunk']
+        self.assertTrue(self.a.fail(chunk['chunk_id'], "first try"))
+        self.assertEqual(self._states()[chunk['chunk_id']], coordinator.PENDING)
+
+        retry = self.b.lease()['chunk']
+        self.assertEqual(retry['chunk_id'], chunk['chunk_id'])
+        self.assertTrue(self.b.fail(retry['chunk_id'], "second try"))
+        status = self.a.status()
+        failed = next(c for c in status['chunks'] if c['chunk_id'] == chunk['chunk_id'])
+        self.assertEqual(failed['status'], coordinator.FAILED)
+        self.assertEqual(failed['error'], "second try")
+        self.assertEqual(failed['attempts'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,9 +5,10 @@ from .callbacks import (
     update_frame_end,
     on_active_camera_changed,
     on_befriend_toggle,
+    befriend_cameras,
     on_sync_toggle,
-    register,
-    unregister
+    register as _register_callbacks,
+    unregister as _unregister_callbacks
 )
 
 # Import utility modules
@@ -15,6 +16,18 @@ from . import marker_detection
 from . import frame_manager
 from . import camera_names
 from . import render_manager
+from . import thumbnails
+
+
+def register():
+    _register_callbacks()
+    thumbnails.register()
+
+
+def unregister():
+    thumbnails.unregister()
+    _unregister_callbacks()
+
 
 __all__ = [
     'update_viewport_resolution',
@@ -22,9 +35,11 @@ __all__ = [
     'update_frame_end',
     'on_active_camera_changed',
     'on_befriend_toggle',
+    'befriend_cameras',
     'on_sync_toggle',
     'marker_detection',
     'frame_manager',
     'camera_names',
-    'render_manager'
+    'render_manager',
+    'thumbnails'
 ]
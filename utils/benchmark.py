@@ -0,0 +1,390 @@
+"""Encoder and file format benchmarks for Cameraide outputs.
+
+EncoderBenchmark renders a short clip of the camera once (viewport renderer
+when a window is available, so the benchmark measures encoding rather than
+rendering), then encodes the same frames with every encoder speed profile
+and reports frames per second and file size for each.
+
+FormatBenchmark renders one frame and writes it with every PNG compression
+level, JPEG quality, EXR codec and H.264 quality preset, timing the write
+and a read back and measuring the file. Results are kept per machine and
+output size, and the File Format panel recommends the fastest option that
+doesn't lose quality against the camera's current setting.
+"""
+import json
+import os
+import platform
+import shutil
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+import bpy
+from .render_manager import RenderCleanupManager
+from .profiles import effective_settings
+from .storage import user_cache_dir
+from ..properties import EXR_CODEC_ITEMS, VIDEO_QUALITY_ITEMS
+from ..render.formats.image import apply_image_format
+
+# Acceptable options may be this much larger than the smallest one
+_SIZE_SLACK = 1.5
+# Writes per image option; the fastest counts
+_REPEATS = 2
+# Copies of the frame in each H.264 test clip
+_VIDEO_FRAMES = 12
+_PNG_LEVELS = (0, 15, 50, 90)
+_JPEG_QUALITIES = (75, 90, 95)
+_LOSSLESS_EXR = {'NONE', 'ZIP', 'PIZ', 'RLE', 'ZIPS'}
+# Higher is better quality
+_VIDEO_RANK = {'LOW': 0, 'MEDIUM': 1, 'HIGH': 2, 'PERC_LOSSLESS': 3, 'LOSSLESS': 4}
+# Settings an option must share with the camera to be compared
+_MATCH_KEYS = ('png_color_depth', 'exr_color_depth')
+
+
+class EncoderBenchmark:
+    """Runs the benchmark and keeps the last result for the panel"""
+
+    # {'camera': name, 'frames': n, 'resolution': (x, y), 'profiles': [...]}
+    last_result = None
+
+    @classmethod
+    def run(cls, context, cam_obj, frame_count=24):
+        from ..render.encode import encode_image_sequence
+        from ..render.manifest import settings_to_dict
+        from ..operators.render_batch import disable_camera_handler, restore_camera_handler
+
+        scene = context.scene
+        settings = effective_settings(cam_obj, scene)
+        start = scene.frame_current
+        end = start + max(frame_count, 2) - 1
+        scratch = tempfile.mkdtemp(prefix="cameraide_bench_")
+        speed_items = settings.bl_rna.properties['video_encoder_speed'].enum_items
+
+        try:
+            frames, resolution = cls._render_frames(context, cam_obj, start, end, scratch,
+                                                    disable_camera_handler, restore_camera_handler)
+            if not frames:
+                return None
+
+            profiles = []
+            base = settings_to_dict(settings)
+            for item in speed_items:
+                proxy = SimpleNamespace(**dict(base, video_encoder_speed=item.identifier))
+                movie = os.path.join(scratch, f"bench_{item.identifier.lower()}")
+                t0 = time.perf_counter()
+                written = encode_image_sequence(frames, movie, proxy, resolution,
+                                                scene.render.fps, scene.render.fps_base,
+                                                frame_start=start)
+                seconds = time.perf_counter() - t0
+                profiles.append({
+                    'profile': item.identifier,
+                    'name': item.name,
+                    'seconds': round(seconds, 3),
+                    'fps': round(len(frames) / seconds, 1) if seconds else 0.0,
+                    'bytes': os.path.getsize(written) if written else 0,
+                })
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+        cls.last_result = {
+            'camera': cam_obj.name,
+            'format': settings.output_format,
+            'frames': len(frames),
+            'resolution': resolution,
+            'profiles': profiles,
+        }
+        return cls.last_result
+
+    @staticmethod
+    def _render_frames(context, cam_obj, start, end, folder,
+                       disable_camera_handler, restore_camera_handler):
+        """Render start..end of cam_obj as PNGs into folder with the camera's
+        resolution. Returns (paths, (res_x, res_y))."""
+        scene = context.scene
+        settings = effective_settings(cam_obj, scene)
+        RenderCleanupManager.store_settings(context)
+        disable_camera_handler()
+        try:
+            scene.camera = cam_obj
+            RenderCleanupManager.apply_camera_settings(
+                context, cam_obj, frame_range=(start, end), force_image_format=True
+            )
+            scene.frame_step = 1
+            scene.render.filepath = os.path.join(folder, "frame_")
+            scene.render.image_settings.compression = 0
+
+            pct = scene.render.resolution_percentage / 100
+            res_x = int(settings.resolution_x * pct)
+            res_y = int(settings.resolution_y * pct)
+            resolution = (res_x + res_x % 2, res_y + res_y % 2)
+            scene.render.resolution_x, scene.render.resolution_y = resolution
+            scene.render.resolution_percentage = 100
+
+            if bpy.app.background:
+                bpy.ops.render.render(animation=True)
+            else:
+                bpy.ops.render.opengl(animation=True, sequencer=False,
+                                      write_still=False, view_context=False)
+            paths = [scene.render.frame_path(frame=f) for f in range(start, end + 1)]
+        finally:
+            RenderCleanupManager.restore_settings(context)
+            restore_camera_handler()
+        return [p for p in paths if os.path.exists(p)], resolution
+
+
+def output_resolution(settings):
+    """Pixel size of a camera's output"""
+    pct = settings.resolution_percentage / 100
+    return max(int(settings.resolution_x * pct), 1), max(int(settings.resolution_y * pct), 1)
+
+
+def format_family(output_format):
+    """Group of benchmark options a camera format chooses from (None: no choice)"""
+    if output_format in {'H264_MP4', 'H264_MKV'}:
+        return 'H264'
+    if output_format in {'PNG', 'JPEG', 'OPEN_EXR'}:
+        return output_format
+    return None
+
+
+def _rank(family, get):
+    """Quality rank of an option; get(name) reads its settings"""
+    if family == 'JPEG':
+        return get('jpeg_quality')
+    if family == 'OPEN_EXR':
+        return int(get('exr_codec') in _LOSSLESS_EXR)
+    if family == 'H264':
+        return _VIDEO_RANK.get(get('video_quality'), 0)
+    return 0
+
+
+def _format_options(settings):
+    """(family, label, settings dict) of every option to benchmark, at the
+    camera's bit depths"""
+    options = []
+    png_depth = settings.png_color_depth
+    for level in sorted(set(_PNG_LEVELS) | {settings.png_compression}):
+        options.append(('PNG', f"PNG {png_depth}-bit, {level}% compression", {
+            'output_format': 'PNG', 'png_color_depth': png_depth, 'png_compression': level}))
+    for quality in sorted(set(_JPEG_QUALITIES) | {settings.jpeg_quality}):
+        options.append(('JPEG', f"JPEG {quality}%", {
+            'output_format': 'JPEG', 'jpeg_quality': quality}))
+    exr_depth = settings.exr_color_depth
+    for codec, name, _ in EXR_CODEC_ITEMS:
+        options.append(('OPEN_EXR', f"EXR {'Half' if exr_depth == '16' else 'Full'} {name}", {
+            'output_format': 'OPEN_EXR', 'exr_color_depth': exr_depth, 'exr_codec': codec}))
+    for quality, name, _ in VIDEO_QUALITY_ITEMS:
+        options.append(('H264', f"H.264 {name}", {'video_quality': quality}))
+    return options
+
+
+def _read_seconds(path):
+    """Time to load and decode an image (or a movie's first frame)"""
+    t0 = time.perf_counter()
+    image = bpy.data.images.load(path, check_existing=False)
+    try:
+        image.pixels[0]
+        return time.perf_counter() - t0
+    finally:
+        bpy.data.images.remove(image)
+
+
+class FormatBenchmark:
+    """Write/read time and size of every format option, kept per machine"""
+
+    # {'camera': name, 'resolution': (x, y), 'options': [...]}
+    last_result = None
+    _cache = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def machine_key():
+        return f"{platform.node()}|{platform.machine()}|{os.cpu_count()}|{bpy.app.version_string}"
+
+    @classmethod
+    def _path(cls):
+        return os.path.join(user_cache_dir("benchmark"), "formats.json")
+
+    @classmethod
+    def _load(cls):
+        if cls._cache is None:
+            try:
+                with open(cls._path(), 'r', encoding='utf-8') as f:
+                    cls._cache = json.load(f)
+            except (OSError, ValueError):
+                cls._cache = {}
+        return cls._cache
+
+    @classmethod
+    def _store(cls, resolution, options):
+        with cls._lock:
+            cache = cls._load()
+            sizes = cache.setdefault(cls.machine_key(), {})
+            entry = sizes.setdefault(f"{resolution[0]}x{resolution[1]}", {'options': []})
+            labels = {option['label'] for option in options}
+            entry['options'] = [o for o in entry['options'] if o['label'] not in labels] + options
+            entry['time'] = time.time()
+            try:
+                with open(cls._path(), 'w', encoding='utf-8') as f:
+                    json.dump(cache, f)
+            except OSError:
+                pass
+
+    @classmethod
+    def results(cls, resolution):
+        """(benchmarked resolution, options) on this machine closest in
+        pixel count to resolution, or (None, [])"""
+        with cls._lock:
+            sizes = cls._load().get(cls.machine_key(), {})
+        if not sizes:
+            return None, []
+        pixels = resolution[0] * resolution[1]
+
+        def distance(key):
+            w, h = (int(v) for v in key.split('x'))
+            return abs(w * h - pixels)
+        key = min(sizes, key=distance)
+        return tuple(int(v) for v in key.split('x')), sizes[key]['options']
+
+    @classmethod
+    def recommend(cls, settings):
+        """Fastest-writing option at least as good as the camera's current
+        one and within _SIZE_SLACK of the smallest such option. Returns
+        {'option', 'current', 'resolution'} or None without results."""
+        family = format_family(settings.output_format)
+        if family is None:
+            return None
+        resolution, options = cls.results(output_resolution(settings))
+        current_rank = _rank(family, lambda name: getattr(settings, name))
+        candidates = []
+        current = None
+        for option in options:
+            values = option['settings']
+            if option['family'] != family or any(
+                    k in values and values[k] != getattr(settings, k) for k in _MATCH_KEYS):
+                continue
+            if all(getattr(settings, k) == v for k, v in values.items()):
+                current = option
+            if _rank(family, values.get) >= current_rank:
+                candidates.append(option)
+        if not candidates:
+            return None
+        smallest = min(option['bytes'] for option in candidates)
+        best = min((o for o in candidates if o['bytes'] <= smallest * _SIZE_SLACK),
+                   key=lambda o: o['write'])
+        return {'option': best, 'current': current, 'resolution': resolution}
+
+    @classmethod
+    def run(cls, context, cam_obj):
+        from ..render.encode import encode_image_sequence
+        from ..render.manifest import settings_to_dict
+
+        scene = context.scene
+        settings = effective_settings(cam_obj, scene)
+        scratch = tempfile.mkdtemp(prefix="cameraide_formats_")
+        results = []
+        try:
+            source_path = cls._render_source(context, cam_obj, os.path.join(scratch, "source_"))
+            if source_path is None:
+                return None
+            source = bpy.data.images.load(source_path, check_existing=False)
+            try:
+                resolution = tuple(source.size)
+                frame_path = None
+                for family, label, values in _format_options(settings):
+                    if family == 'H264':
+                        continue
+                    path = os.path.join(scratch, f"option_{len(results)}")
+                    write, written = cls._write_image(scene, source, values, path)
+                    results.append(cls._entry(family, label, values, write, written))
+                    if frame_path is None and values.get('png_compression') == 0:
+                        frame_path = written
+            finally:
+                bpy.data.images.remove(source)
+
+            if frame_path and bpy.app.build_options.codec_ffmpeg:
+                base = settings_to_dict(settings)
+                even = (resolution[0] + resolution[0] % 2, resolution[1] + resolution[1] % 2)
+                for family, label, values in _format_options(settings):
+                    if family != 'H264':
+                        continue
+                    proxy = SimpleNamespace(**dict(base, output_format='H264_MP4', **values))
+                    movie = os.path.join(scratch, f"option_{len(results)}.mp4")
+                    t0 = time.perf_counter()
+                    written = encode_image_sequence([frame_path] * _VIDEO_FRAMES, movie, proxy, even,
+                                                    scene.render.fps, scene.render.fps_base)
+                    write = (time.perf_counter() - t0) / _VIDEO_FRAMES
+                    if written:
+                        entry = cls._entry(family, label, values, write, written)
+                        entry['bytes'] //= _VIDEO_FRAMES
+                        results.append(entry)
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+        cls._store(resolution, results)
+        cls.last_result = {'camera': cam_obj.name, 'resolution': resolution, 'options': results}
+        return cls.last_result
+
+    @staticmethod
+    def _entry(family, label, values, write, path):
+        return {
+            'family': family,
+            'label': label,
+            'settings': values,
+            'write': round(write, 4),
+            'read': round(_read_seconds(path), 4),
+            'bytes': os.path.getsize(path),
+        }
+
+    @staticmethod
+    def _write_image(scene, source, values, path):
+        """Save source with one option's settings. Returns (seconds, path)."""
+        tmp = bpy.data.scenes.new(".cameraide_bench")
+        try:
+            image_settings = tmp.render.image_settings
+            image_settings.media_type = 'IMAGE'
+            image_settings.file_format = values['output_format']
+            apply_image_format(SimpleNamespace(exr_preview=False, **values), SimpleNamespace(scene=tmp))
+            # Same display transform as the camera's own output
+            tmp.display_settings.display_device = scene.display_settings.display_device
+            for attr in ('view_transform', 'look', 'exposure', 'gamma'):
+                setattr(tmp.view_settings, attr, getattr(scene.view_settings, attr))
+            path = path + tmp.render.file_extension
+            best = None
+            for _ in range(_REPEATS):
+                t0 = time.perf_counter()
+                source.save_render(path, scene=tmp)
+                seconds = time.perf_counter() - t0
+                best = seconds if best is None else min(best, seconds)
+        finally:
+            bpy.data.scenes.remove(tmp)
+        return best, path
+
+    @staticmethod
+    def _render_source(context, cam_obj, filepath):
+        """Render the current frame of cam_obj as a float EXR. Returns the
+        file's path, or None if nothing was written."""
+        from ..operators.render_batch import disable_camera_handler, restore_camera_handler
+
+        scene = context.scene
+        RenderCleanupManager.store_settings(context)
+        disable_camera_handler()
+        try:
+            RenderCleanupManager.apply_camera_settings(
+                context, cam_obj, force_image_format=True, apply_frame_range=False
+            )
+            image_settings = scene.render.image_settings
+            image_settings.file_format = 'OPEN_EXR'
+            image_settings.color_mode = 'RGBA'
+            image_settings.color_depth = '32'
+            image_settings.exr_codec = 'ZIP'
+            scene.render.filepath = filepath
+            path = scene.render.frame_path(frame=scene.frame_current)
+            if bpy.app.background:
+                bpy.ops.render.render(write_still=True)
+            else:
+                bpy.ops.render.opengl(write_still=True, view_context=False)
+        finally:
+            RenderCleanupManager.restore_settings(context)
+            restore_camera_handler()
+        return path if os.path.exists(path) else None
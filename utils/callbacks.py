@@ -2,6 +2,8 @@
 import bpy
 from .frame_manager import frame_manager, prevent_recursive_update
 from .camera_names import update_camera_name
+from .profiles import effective_settings
+from .profiling import span, traced
 
 # Set True while cameraide is writing to native Blender settings so the
 # msgbus listener ignores those writes (they're not user edits).
@@ -15,6 +17,7 @@ _msgbus_owner = object()
 # Cameraide → Native  (push cameraide settings into Blender's render panel)
 # ---------------------------------------------------------------------------
 
+@traced("apply_cameraide_to_native", count_writes=True)
 def apply_cameraide_to_native(cam, scene):
     """Push this camera's cameraide settings into Blender's native render panel.
     Called on camera switch so the native panel always reflects the active camera.
@@ -26,7 +29,7 @@ def apply_cameraide_to_native(cam, scene):
     if not cam or not cam.data.cameraide_settings.use_custom_settings:
         return
 
-    settings = cam.data.cameraide_settings
+    settings = effective_settings(cam, scene)
     _syncing_native = True
     try:
         render = scene.render
@@ -81,8 +84,9 @@ def apply_cameraide_to_native(cam, scene):
                 ffmpeg.video_bitrate = settings.video_bitrate
                 ffmpeg.gopsize = settings.video_gopsize
 
-            ffmpeg.audio_codec = settings.audio_codec if settings.audio_codec != 'NONE' else 'NONE'
-            if settings.audio_codec != 'NONE':
+            use_audio = settings.use_audio and settings.audio_codec != 'NONE'
+            ffmpeg.audio_codec = settings.audio_codec if use_audio else 'NONE'
+            if use_audio:
                 ffmpeg.audio_bitrate = settings.audio_bitrate
 
     finally:
@@ -94,8 +98,9 @@ def apply_cameraide_to_native(cam, scene):
 # ---------------------------------------------------------------------------
 
 def _sync_native_to_cameraide(cam, scene):
-    """Read current native render settings into the camera's cameraide properties."""
-    settings = cam.data.cameraide_settings
+    """Read current native render settings into the camera's cameraide properties
+    (into its profile for the shared settings it doesn't override)."""
+    settings = effective_settings(cam, scene)
     render = scene.render
     img = render.image_settings
     native_fmt = img.file_format
@@ -141,7 +146,7 @@ def _sync_native_to_cameraide(cam, scene):
 
 def _sync_native_resolution_to_cameraide(cam, scene):
     """Sync only resolution from native → cameraide."""
-    settings = cam.data.cameraide_settings
+    settings = effective_settings(cam, scene)
     render = scene.render
     settings.resolution_x = render.resolution_x
     settings.resolution_y = render.resolution_y
@@ -150,7 +155,7 @@ def _sync_native_resolution_to_cameraide(cam, scene):
 
 def _sync_native_film_transparent_to_cameraide(cam, scene):
     """Sync only film_transparent from native → cameraide."""
-    cam.data.cameraide_settings.film_transparent = scene.render.film_transparent
+    effective_settings(cam, scene).film_transparent = scene.render.film_transparent
 
 
 # ---------------------------------------------------------------------------
@@ -176,6 +181,7 @@ def _guard_check():
     return cam, scene
 
 
+@traced("_on_native_format_changed", count_writes=True)
 def _on_native_format_changed():
     """Fired by ImageFormatSettings and FFmpegSettings msgbus.
     Syncs format/codec/quality/audio — never touches resolution."""
@@ -191,6 +197,7 @@ def _on_native_format_changed():
         _syncing_native = False
 
 
+@traced("_on_native_resolution_changed", count_writes=True)
 def _on_native_resolution_changed():
     """Fired by RenderSettings.resolution_* and film_transparent msgbus.
     Syncs only those values — never touches output_format."""
@@ -218,7 +225,7 @@ def update_viewport_resolution(context):
     if not cam or not cam.data.cameraide_settings.use_custom_settings:
         return
 
-    settings = cam.data.cameraide_settings
+    settings = effective_settings(cam, context.scene)
     _syncing_native = True  # suppress msgbus from treating this as a user edit
     try:
         context.scene.render.resolution_x = settings.resolution_x
@@ -228,11 +235,54 @@ def update_viewport_resolution(context):
         _syncing_native = False
 
 
+def update_profile(self, context):
+    """A camera switched profiles or overrides: show its new effective
+    settings in the native render panel if it's the scene camera"""
+    with span("update_profile", count_writes=True):
+        _update_profile(self, context)
+
+
+def _update_profile(self, context):
+    if frame_manager.is_updating:
+        return
+    camera = context.scene.camera
+    if not camera or camera.type != 'CAMERA' or camera.data.cameraide_settings != self:
+        return
+    update_viewport_resolution(context)
+    apply_cameraide_to_native(camera, context.scene)
+
+
+# ---------------------------------------------------------------------------
+# Redraw (sidebar, overlays and progress rows all live in the 3D view)
+# ---------------------------------------------------------------------------
+
+def tag_view3d_redraw():
+    """Tag the 3D views of every window for redraw. Works from timers and
+    background-job callbacks too, where the context has no screen."""
+    wm = bpy.context.window_manager
+    if wm is None:
+        return
+    for window in wm.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+
+def update_redraw(self, context):
+    """Property update for settings only the 3D view draws"""
+    tag_view3d_redraw()
+
+
 # ---------------------------------------------------------------------------
 # Frame range update callbacks (hooked from properties.py)
 # ---------------------------------------------------------------------------
 
 def update_frame_start(self, context):
+    with span("update_frame_start", count_writes=True):
+        _update_frame_start(self, context)
+
+
+def _update_frame_start(self, context):
     if frame_manager.is_updating:
         return
     # Clamp start to at most end - 1
@@ -249,6 +299,11 @@ def update_frame_start(self, context):
 
 
 def update_frame_end(self, context):
+    with span("update_frame_end", count_writes=True):
+        _update_frame_end(self, context)
+
+
+def _update_frame_end(self, context):
     if frame_manager.is_updating:
         return
     # Clamp end to at least start + 1
@@ -269,6 +324,7 @@ def update_frame_end(self, context):
 # ---------------------------------------------------------------------------
 
 @bpy.app.handlers.persistent
+@traced("on_active_camera_changed", count_writes=True)
 def on_active_camera_changed(scene):
     if frame_manager.is_updating:
         return
@@ -315,6 +371,7 @@ def on_active_camera_changed(scene):
 # Befriend / sync-toggle helpers
 # ---------------------------------------------------------------------------
 
+@traced("on_befriend_toggle", count_writes=True)
 def on_befriend_toggle(camera_obj):
     if frame_manager.is_updating or not camera_obj:
         return
@@ -344,6 +401,62 @@ def on_befriend_toggle(camera_obj):
         frame_manager.store_range(camera_obj)
 
 
+@traced("befriend_cameras")
+def befriend_cameras(cameras, enable=True):
+    """Befriend (or unfriend) many cameras in one pass.
+
+    Batched counterpart of on_befriend_toggle: markers are scanned once for
+    the whole set, renames run in a single loop and native settings are only
+    pushed for the scene camera, followed by one depsgraph update.
+    Returns the number of cameras that changed state.
+    """
+    context = bpy.context
+    scene = context.scene
+    changed = [
+        cam for cam in cameras
+        if cam and cam.type == 'CAMERA'
+        and cam.data.cameraide_settings.use_custom_settings != enable
+    ]
+    if not changed:
+        return 0
+
+    marker_counts = {}
+    if enable:
+        from .marker_detection import get_marker_counts
+        marker_counts = get_marker_counts(scene)
+
+    with prevent_recursive_update():
+        for cam in changed:
+            settings = cam.data.cameraide_settings
+            settings.use_custom_settings = enable
+            if enable:
+                settings.frame_range_mode = (
+                    'TIMELINE_MARKERS' if marker_counts.get(cam) else 'PER_CAMERA'
+                )
+                stored = frame_manager.get_range(cam)
+                if stored:
+                    settings.frame_start = stored['start']
+                    settings.frame_end = stored['end']
+            else:
+                frame_manager.store_range(cam)
+
+        for cam in changed:
+            update_camera_name(cam, enable)
+
+        for cam in changed:
+            frame_manager.store_range(cam)
+
+        if enable and scene.camera in changed:
+            settings = scene.camera.data.cameraide_settings
+            if settings.sync_frame_range and settings.frame_range_mode == 'PER_CAMERA':
+                from .frame_manager import apply_frame_range_to_scene
+                apply_frame_range_to_scene(scene.camera, scene)
+            apply_cameraide_to_native(scene.camera, scene)
+
+    context.view_layer.update()
+    return len(changed)
+
+
 def on_sync_toggle(camera_obj):
     if frame_manager.is_updating or not camera_obj:
         return
@@ -365,6 +478,7 @@ def on_sync_toggle(camera_obj):
 # Scene frame range → Cameraide  (timeline edits feed back into camera)
 # ---------------------------------------------------------------------------
 
+@traced("_on_scene_frame_range_changed", count_writes=True)
 def _on_scene_frame_range_changed():
     """Fired when scene.frame_start or scene.frame_end changes via the timeline.
     Writes the new values back into the active camera's Cameraide settings so
@@ -456,8 +570,10 @@ __all__ = [
     'update_viewport_resolution',
     'update_frame_start',
     'update_frame_end',
+    'update_profile',
     'on_active_camera_changed',
     'on_befriend_toggle',
+    'befriend_cameras',
     'on_sync_toggle',
     'apply_cameraide_to_native',
 ]
@@ -1,4 +1,5 @@
 """Camera naming utilities for Cameraide"""
+import fnmatch
 
 HEART_PREFIX = "❤️ "
 
@@ -25,3 +26,17 @@ def update_camera_name(camera_obj, add_heart=True):
         
     if new_name != current_name:
         camera_obj.name = new_name
+
+
+def name_matches(name, pattern):
+    """Case-insensitive wildcard match of a name.
+    A pattern without wildcards matches as a substring."""
+    pattern = pattern.lower()
+    if not any(ch in pattern for ch in '*?['):
+        pattern = f"*{pattern}*"
+    return fnmatch.fnmatchcase(name.lower(), pattern)
+
+
+def camera_name_matches(camera_obj, pattern):
+    """name_matches on the clean camera name"""
+    return name_matches(get_clean_camera_name(camera_obj), pattern)
@@ -97,4 +97,16 @@ def get_all_marker_ranges(camera_obj):
             return ranges
     
     # Fallback to single custom range
-    return [(settings.frame_start, settings.frame_end)]
\ No newline at end of file
+    return [(settings.frame_start, settings.frame_end)]
+
+def get_marker_counts(scene):
+    """
+    Count timeline markers per bound camera in a single pass.
+    Returns {camera_obj: count} so bulk operations scan the markers once
+    instead of once per camera.
+    """
+    counts = {}
+    for marker in scene.timeline_markers:
+        if marker.camera is not None:
+            counts[marker.camera] = counts.get(marker.camera, 0) + 1
+    return counts
@@ -0,0 +1,329 @@
+"""Live batch progress in OpenMetrics text format for Cameraide.
+
+While a batch runs, BatchMetrics holds a few counters that the render
+handlers bump (an integer add and a timestamp per frame, nothing else in
+the render loop). A background thread serves them on localhost at
+/metrics for Prometheus or a wall dashboard, and rewrites an optional JSON
+status file every couple of seconds for tools that poll files instead.
+Formatting and file I/O happen only on that thread.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import bpy
+from .camera_names import get_clean_camera_name
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+STATUS_INTERVAL = 2.0
+# Frames used for the rolling frames-per-second rate
+_RATE_WINDOW = 20
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class BatchMetrics:
+    """Progress of the running (or last) batch"""
+
+    _lock = threading.Lock()
+    running = False
+    kind = ""
+    jobs_total = 0
+    jobs_done = 0
+    jobs_failed = 0
+    frames_planned = 0
+    frames_done = 0
+    bytes_written = 0
+    camera = ""
+    started = 0.0
+    _frame_times = deque(maxlen=_RATE_WINDOW)
+    _in_frame = False  # OpenGL jobs: a frame step is open
+
+    @classmethod
+    def start_batch(cls, kind, queue):
+        frames = 0
+        for cam_obj, start, end in queue:
+            settings = cam_obj.data.cameraide_settings
+            stride = max(settings.frame_step, 1) * max(settings.hold_frames, 1)
+            frames += len(range(start, end + 1, stride))
+        with cls._lock:
+            cls.running = True
+            cls.kind = kind
+            cls.jobs_total = len(queue)
+            cls.jobs_done = cls.jobs_failed = 0
+            cls.frames_planned = frames
+            cls.frames_done = 0
+            cls.bytes_written = 0
+            cls.camera = ""
+            cls.started = time.time()
+            cls._frame_times.clear()
+        _install_handlers()
+        MetricsExporter.ensure_running()
+
+    @classmethod
+    def start_job(cls, cam_obj):
+        if cls.running:
+            cls.camera = get_clean_camera_name(cam_obj)
+            cls._in_frame = False
+
+    @classmethod
+    def frame_done(cls):
+        if cls.running:
+            cls.frames_done += 1
+            cls._frame_times.append(time.perf_counter())
+
+    @classmethod
+    def end_job(cls, status):
+        if not cls.running:
+            return
+        if cls._in_frame:
+            cls.frame_done()
+            cls._in_frame = False
+        bytes_written = _job_bytes(bpy.context.scene)
+        with cls._lock:
+            cls.jobs_done += 1
+            if status != 'FINISHED':
+                cls.jobs_failed += 1
+            cls.bytes_written += bytes_written
+
+    @classmethod
+    def end_batch(cls):
+        if not cls.running:
+            return
+        _remove_handlers()
+        with cls._lock:
+            cls.running = False
+            cls.camera = ""
+        MetricsExporter.write_status()
+
+    @classmethod
+    def frames_per_second(cls):
+        times = list(cls._frame_times)
+        if len(times) < 2 or times[-1] <= times[0]:
+            return 0.0
+        return (len(times) - 1) / (times[-1] - times[0])
+
+    @classmethod
+    def snapshot(cls):
+        with cls._lock:
+            fps = cls.frames_per_second()
+            remaining = max(cls.frames_planned - cls.frames_done, 0)
+            return {
+                'running': cls.running,
+                'kind': cls.kind,
+                'camera': cls.camera,
+                'jobs_total': cls.jobs_total,
+                'jobs_done': cls.jobs_done,
+                'jobs_failed': cls.jobs_failed,
+                'frames_planned': cls.frames_planned,
+                'frames_done': cls.frames_done,
+                'frames_per_second': round(fps, 4),
+                'eta_seconds': round(remaining / fps, 1) if fps > 0 and cls.running else None,
+                'bytes_written': cls.bytes_written,
+                'started': cls.started,
+                'time': time.time(),
+            }
+
+
+def _job_bytes(scene):
+    """Size of the files the finished job left at its output pattern
+    (measured once per job, outside the render loop)"""
+    render = scene.render
+    if render.is_movie_format:
+        paths = [render.frame_path(frame=scene.frame_start)]
+    else:
+        paths = [render.frame_path(frame=f)
+                 for f in range(scene.frame_start, scene.frame_end + 1, max(scene.frame_step, 1))]
+    total = 0
+    for path in paths:
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+    return total
+
+
+def openmetrics_text(snap):
+    """OpenMetrics exposition of a BatchMetrics snapshot"""
+    lines = []
+
+    def metric(name, kind, help_text, value, unit=None, suffix=""):
+        lines.append(f"# TYPE {name} {kind}")
+        if unit:
+            lines.append(f"# UNIT {name} {unit}")
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"{name}{suffix} {value}")
+
+    metric("cameraide_batch_running", "gauge", "1 while a batch renders", int(snap['running']))
+    metric("cameraide_jobs", "gauge", "Jobs in the batch", snap['jobs_total'])
+    metric("cameraide_jobs_done", "counter", "Jobs finished or failed", snap['jobs_done'], suffix="_total")
+    metric("cameraide_jobs_failed", "counter", "Jobs that failed or were cancelled",
+           snap['jobs_failed'], suffix="_total")
+    metric("cameraide_frames", "gauge", "Frames the batch renders", snap['frames_planned'])
+    metric("cameraide_frames_rendered", "counter", "Frames rendered so far",
+           snap['frames_done'], suffix="_total")
+    metric("cameraide_frames_per_second", "gauge", "Recent render rate", snap['frames_per_second'])
+    if snap['eta_seconds'] is not None:
+        metric("cameraide_eta_seconds", "gauge", "Estimated time to the end of the batch",
+               snap['eta_seconds'], unit="seconds")
+    metric("cameraide_written_bytes", "counter", "Bytes written by finished jobs",
+           snap['bytes_written'], unit="bytes", suffix="_total")
+    metric("cameraide_batch_start_timestamp_seconds", "gauge", "When the batch started",
+           round(snap['started'], 3), unit="seconds")
+    if snap['running']:
+        labels = f'camera="{_escape(snap["camera"])}",kind="{_escape(snap["kind"])}"'
+        metric("cameraide_current_job", "info", "Job being rendered", 1, suffix=f"_info{{{labels}}}")
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        body = openmetrics_text(BatchMetrics.snapshot()).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MetricsExporter:
+    """Localhost HTTP endpoint and status-file writer.
+
+    Configured from the scene's batch settings when a batch starts; keeps
+    serving the last batch after it ends.
+    """
+
+    port = 0
+    status_path = ""
+    # Why the endpoint isn't serving (port taken), for the panel
+    error = None
+    _server = None
+    _threads = []
+    _stop = threading.Event()
+
+    @classmethod
+    def configure(cls, port=0, status_path=""):
+        """port 0 disables the endpoint, an empty status_path the file"""
+        if port != cls.port or not port:
+            cls._stop_server()
+            cls.error = None
+        cls.port = port
+        cls.status_path = status_path
+
+    @classmethod
+    def configure_from_scene(cls, scene):
+        """Apply the scene's metrics settings. Returns True if enabled."""
+        batch = scene.cameraide_batch
+        if not batch.use_metrics:
+            cls.configure()
+            return False
+        status = bpy.path.abspath(batch.metrics_status_file) if batch.metrics_status_file else ""
+        cls.configure(batch.metrics_port, status)
+        return True
+
+    @classmethod
+    def ensure_running(cls):
+        if cls.port and cls._server is None:
+            try:
+                cls._server = ThreadingHTTPServer(('127.0.0.1', cls.port), _MetricsHandler)
+            except OSError as e:
+                cls.error = str(e)
+                cls._server = None
+            else:
+                cls.error = None
+                cls._server.daemon_threads = True
+                thread = threading.Thread(target=cls._server.serve_forever,
+                                          name="cameraide-metrics", daemon=True)
+                thread.start()
+                cls._threads.append(thread)
+        if cls.status_path and not any(t.name == "cameraide-status" and t.is_alive()
+                                       for t in cls._threads):
+            cls._stop.clear()
+            thread = threading.Thread(target=cls._status_loop, name="cameraide-status", daemon=True)
+            thread.start()
+            cls._threads.append(thread)
+
+    @classmethod
+    def is_serving(cls):
+        return cls._server is not None
+
+    @classmethod
+    def _status_loop(cls):
+        while not cls._stop.wait(STATUS_INTERVAL):
+            if not cls.status_path:
+                return
+            cls.write_status()
+            if not BatchMetrics.running:
+                return
+
+    @classmethod
+    def write_status(cls):
+        path = cls.status_path
+        if not path:
+            return
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            partial = path + ".part"
+            with open(partial, 'w', encoding='utf-8') as f:
+                json.dump(BatchMetrics.snapshot(), f, indent=1)
+            os.replace(partial, path)
+        except OSError:
+            pass
+
+    @classmethod
+    def _stop_server(cls):
+        if cls._server is not None:
+            cls._server.shutdown()
+            cls._server.server_close()
+            cls._server = None
+
+    @classmethod
+    def shutdown(cls):
+        cls._stop.set()
+        cls._stop_server()
+        cls._threads = []
+
+
+def metrics_render_write(scene, depsgraph=None):
+    BatchMetrics.frame_done()
+
+
+def metrics_frame_change(scene, depsgraph=None):
+    """OpenGL jobs fire no render_write; a frame is done when the next one
+    starts (the last one when the job ends)"""
+    if BatchMetrics.kind != 'OPENGL':
+        return
+    if BatchMetrics._in_frame:
+        BatchMetrics.frame_done()
+    BatchMetrics._in_frame = True
+
+
+def _handler_table():
+    handlers = bpy.app.handlers
+    return (
+        (handlers.render_write, metrics_render_write),
+        (handlers.frame_change_post, metrics_frame_change),
+    )
+
+
+def _install_handlers():
+    for handlers, func in _handler_table():
+        if func not in handlers:
+            handlers.append(func)
+
+
+def _remove_handlers():
+    for handlers, func in _handler_table():
+        if func in handlers:
+            handlers.remove(func)
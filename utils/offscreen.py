@@ -0,0 +1,79 @@
+"""GPU offscreen drawing of a camera's view.
+
+Draws the scene through a camera into a GPUOffScreen, using the shading of
+an open 3D view, and reads the pixels back. Much cheaper than a render, but
+needs a window: returns None in background mode or without a 3D view.
+"""
+import struct
+import zlib
+import bpy
+
+
+def find_view3d(context):
+    """First (area, region, space) of a 3D view in any open window"""
+    wm = context.window_manager
+    if wm is None:
+        return None
+    for window in wm.windows:
+        for area in window.screen.areas:
+            if area.type != 'VIEW_3D':
+                continue
+            region = next((r for r in area.regions if r.type == 'WINDOW'), None)
+            if region is not None:
+                return area, region, area.spaces.active
+    return None
+
+
+def camera_pixels(context, cam_obj, width, height):
+    """Draw cam_obj's view at width x height.
+
+    Returns RGBA bytes, rows top to bottom, or None when drawing isn't
+    possible here.
+    """
+    if bpy.app.background:
+        return None
+    view = find_view3d(context)
+    if view is None:
+        return None
+    import gpu
+
+    _area, region, space = view
+    scene = context.scene
+    depsgraph = context.evaluated_depsgraph_get()
+    view_matrix = cam_obj.matrix_world.inverted()
+    projection_matrix = cam_obj.calc_matrix_camera(depsgraph, x=width, y=height)
+
+    offscreen = gpu.types.GPUOffScreen(width, height)
+    try:
+        offscreen.draw_view3d(
+            scene, context.view_layer, space, region,
+            view_matrix, projection_matrix, do_color_management=True,
+        )
+        with offscreen.bind():
+            framebuffer = gpu.state.active_framebuffer_get()
+            buffer = framebuffer.read_color(0, 0, width, height, 4, 0, 'UBYTE')
+    finally:
+        offscreen.free()
+
+    buffer.dimensions = width * height * 4
+    data = bytes(buffer.to_list())
+    # GPU rows are bottom-up
+    stride = width * 4
+    return b''.join(data[y * stride:(y + 1) * stride] for y in range(height - 1, -1, -1))
+
+
+def write_png(path, width, height, rgba):
+    """Write top-down RGBA bytes as an 8-bit PNG (no image data-block needed)"""
+    stride = width * 4
+    raw = b''.join(b'\x00' + rgba[y * stride:(y + 1) * stride] for y in range(height))
+
+    def chunk(tag, payload):
+        body = tag + payload
+        return struct.pack('>I', len(payload)) + body + struct.pack('>I', zlib.crc32(body) & 0xffffffff)
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', header))
+        f.write(chunk(b'IDAT', zlib.compress(raw, 6)))
+        f.write(chunk(b'IEND', b''))
@@ -0,0 +1,254 @@
+"""Pre-flight validation of a render queue.
+
+Checks every (camera, start, end) job in one pass before anything renders,
+so a batch doesn't fail hours in on a problem that was visible up front:
+inverted ranges, unwritable or relative-but-unsaved output folders, missing
+format support in this Blender build, H.264 size limits, output jobs that
+overwrite each other, extra output targets this build can't write, tiled
+renders without a Blender binary to launch, and not enough free disk
+space. Nothing in the scene is changed.
+"""
+import os
+import shutil
+from types import SimpleNamespace
+import bpy
+from .camera_names import get_clean_camera_name
+from .marker_detection import get_camera_markers
+from .render_manager import camera_output_filepath
+from .profiles import effective_settings
+from ..render.memory import output_bytes_per_pixel
+from ..render.processes import processes_available
+from ..render.audio import find_ffmpeg, wants_audio
+from ..render.transfer import scratch_root
+from ..render.derive import enabled_targets, proxy_settings, target_pattern, target_settings
+
+ERROR = 'ERROR'
+WARNING = 'WARNING'
+
+VIDEO_FORMATS = {'H264_MP4', 'H264_MKV', 'PRORES_MOV'}
+_VIDEO_CODECS = {'H264_MP4': 'H264', 'H264_MKV': 'H264', 'PRORES_MOV': 'PRORES'}
+# Wider or taller H.264 streams exceed level 5.2 and won't play on most decoders
+_H264_MAX_SIDE = 4096
+# Rough compression ratio of written images against raw output buffers
+_IMAGE_COMPRESSION = 0.5
+
+
+class PreflightReport:
+    """Errors and warnings found in a queue"""
+
+    def __init__(self, jobs=0):
+        self.jobs = jobs
+        self.issues = []  # dicts: severity, camera, message
+
+    def add(self, severity, camera, message):
+        self.issues.append({'severity': severity, 'camera': camera, 'message': message})
+
+    @property
+    def errors(self):
+        return [i for i in self.issues if i['severity'] == ERROR]
+
+    @property
+    def warnings(self):
+        return [i for i in self.issues if i['severity'] == WARNING]
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def summary(self):
+        return (f"{self.jobs} jobs: {len(self.errors)} errors, "
+                f"{len(self.warnings)} warnings")
+
+    def to_dict(self):
+        return {'jobs': self.jobs, 'ok': self.ok, 'issues': list(self.issues)}
+
+
+def _output_size(settings):
+    """Pixel size of a camera's output, as apply_camera_settings computes it
+    (before the even-size padding of video formats)"""
+    pct = settings.resolution_percentage
+    return int(settings.resolution_x * pct / 100), int(settings.resolution_y * pct / 100)
+
+
+def _existing_parent(folder):
+    """folder, or its nearest ancestor that exists"""
+    while folder and not os.path.exists(folder):
+        parent = os.path.dirname(folder)
+        if parent == folder:
+            break
+        folder = parent
+    return folder
+
+
+def _writable_folder(folder):
+    """None if files can be created in folder (or in the folders that would
+    be created for it), otherwise the reason they can't"""
+    probe = _existing_parent(folder)
+    if not probe or not os.path.exists(probe):
+        return f"no existing parent folder for {folder}"
+    if not os.path.isdir(probe):
+        return f"{probe} is a file, not a folder"
+    if not os.access(probe, os.W_OK | os.X_OK):
+        return f"{probe} is not writable"
+    return None
+
+
+def _enum_ids(struct, prop):
+    return {item.identifier for item in struct.bl_rna.properties[prop].enum_items}
+
+
+def _estimated_bytes(scene, settings, width, height, frames):
+    if settings.output_format in VIDEO_FORMATS:
+        seconds = frames * scene.render.fps_base / scene.render.fps
+        return int(settings.video_bitrate * 1000 / 8 * seconds)
+    per_frame = width * height * output_bytes_per_pixel(settings) * _IMAGE_COMPRESSION
+    return int(per_frame * frames)
+
+
+def _check_target(report, name, settings, target, filepath, folders):
+    """Checks for one extra output target of a camera"""
+    fmt = target.output_format
+    label = f"{fmt} in '{target.subfolder}'" if target.subfolder else fmt
+    if fmt in VIDEO_FORMATS:
+        if not bpy.app.build_options.codec_ffmpeg:
+            report.add(ERROR, name, f"Output {label}: this Blender build has no FFmpeg video support")
+    elif fmt == 'OPEN_EXR' and not bpy.app.build_options.image_openexr:
+        report.add(ERROR, name, f"Output {label}: this Blender build has no OpenEXR support")
+    if fmt == settings.output_format and not target.subfolder.strip():
+        report.add(WARNING, name, f"Output {label} overwrites the main output")
+    folder = os.path.dirname(target_pattern(filepath, target.subfolder))
+    if folder not in folders:
+        folders[folder] = _writable_folder(folder)
+    if folders[folder]:
+        report.add(ERROR, name, f"Output {label}: {folders[folder]}")
+    if not processes_available():
+        report.add(WARNING, name, f"Output {label} is converted in this session after each job")
+
+
+def validate_queue(context, queue):
+    """Validate every job of a render queue. Returns a PreflightReport."""
+    scene = context.scene
+    report = PreflightReport(len(queue))
+    ffmpeg_settings = scene.render.ffmpeg
+    folders = {}        # folder -> problem or None
+    space = {}          # existing parent folder -> estimated bytes
+    outputs = {}        # output pattern -> [(camera, start, end)]
+    checked = set()     # cameras whose per-camera checks already ran
+
+    for cam_obj, start, end in queue:
+        settings = effective_settings(cam_obj, scene)
+        name = get_clean_camera_name(cam_obj)
+        fmt = settings.output_format
+        width, height = _output_size(settings)
+
+        if start > end:
+            report.add(ERROR, name, f"Frame range {start}-{end} is inverted")
+            continue
+
+        filepath = camera_output_filepath(cam_obj)
+        folder = os.path.dirname(filepath)
+        if cam_obj.name not in checked:
+            checked.add(cam_obj.name)
+
+            if settings.frame_range_mode == 'TIMELINE_MARKERS' and not get_camera_markers(cam_obj):
+                report.add(WARNING, name, "Marker mode without markers: renders the timeline range")
+
+            if width < 1 or height < 1:
+                report.add(ERROR, name, f"Output size {width}x{height} is empty")
+
+            if fmt in VIDEO_FORMATS:
+                if not bpy.app.build_options.codec_ffmpeg:
+                    report.add(ERROR, name, "This Blender build has no FFmpeg video support")
+                elif _VIDEO_CODECS[fmt] not in _enum_ids(ffmpeg_settings, 'codec'):
+                    report.add(ERROR, name, f"This Blender build can't encode {_VIDEO_CODECS[fmt]}")
+                if fmt != 'PRORES_MOV':
+                    if width % 2 or height % 2:
+                        report.add(WARNING, name, f"H.264 needs even sizes: {width}x{height} is padded "
+                                                  f"to {width + width % 2}x{height + height % 2}")
+                    if max(width, height) > _H264_MAX_SIDE:
+                        report.add(WARNING, name, f"{width}x{height} is larger than most H.264 decoders "
+                                                  f"play ({_H264_MAX_SIDE} px)")
+                if wants_audio(settings) and scene.cameraide_batch.ffmpeg_path \
+                        and find_ffmpeg(scene.cameraide_batch) is None:
+                    report.add(WARNING, name, "FFmpeg executable not found: audio is encoded per job")
+            elif fmt == 'OPEN_EXR' and not bpy.app.build_options.image_openexr:
+                report.add(ERROR, name, "This Blender build has no OpenEXR support")
+
+            if settings.use_tiled_render:
+                if not processes_available():
+                    report.add(ERROR, name, "Tiled render needs a Blender executable to launch")
+                if settings.tiles_x > width or settings.tiles_y > height:
+                    report.add(WARNING, name, "More tiles than pixels: some tiles are dropped")
+
+            if settings.output_path.startswith('//') and not bpy.data.filepath:
+                report.add(ERROR, name, "Relative output path in an unsaved file")
+            if folder not in folders:
+                folders[folder] = _writable_folder(folder)
+            if folders[folder]:
+                report.add(ERROR, name, f"Output folder: {folders[folder]}")
+
+            for target in enabled_targets(settings):
+                _check_target(report, name, settings, target, filepath, folders)
+
+            if settings.use_local_scratch:
+                try:
+                    scratch = scratch_root(scene.cameraide_batch)
+                except OSError as e:
+                    report.add(ERROR, name, f"Scratch folder: {e}")
+                else:
+                    problem = _writable_folder(scratch)
+                    if problem:
+                        report.add(ERROR, name, f"Scratch folder: {problem}")
+
+        frames = len(range(start, end + 1, max(settings.frame_step, 1)))
+        parent = _existing_parent(folder)
+        if parent and os.path.isdir(parent):
+            space[parent] = space.get(parent, 0) + _estimated_bytes(scene, settings, width, height, frames)
+
+        for target in enabled_targets(settings):
+            target_folder = os.path.dirname(target_pattern(filepath, target.subfolder))
+            parent = _existing_parent(target_folder)
+            if parent and os.path.isdir(parent):
+                estimate = _estimated_bytes(scene, SimpleNamespace(**target_settings(settings, target)),
+                                            width, height, frames)
+                space[parent] = space.get(parent, 0) + estimate
+        proxy_parent = _existing_parent(os.path.join(folder, "proxy"))
+        if settings.proxy_sizes and proxy_parent and os.path.isdir(proxy_parent):
+            proxy = SimpleNamespace(**proxy_settings(settings))
+            for size in settings.proxy_sizes:
+                scale = int(size) / 100
+                space[proxy_parent] = space.get(proxy_parent, 0) + _estimated_bytes(
+                    scene, proxy, int(width * scale), int(height * scale), frames)
+
+        # Image jobs collide on overlapping frames, movies on the same range
+        key = (filepath, fmt) if fmt not in VIDEO_FORMATS else (filepath, fmt, start, end)
+        outputs.setdefault(key, []).append((name, start, end))
+
+    for jobs in outputs.values():
+        for i, (name, start, end) in enumerate(jobs):
+            for other, o_start, o_end in jobs[i + 1:]:
+                if start <= o_end and o_start <= end:
+                    report.add(WARNING, name, f"Writes the same files as {other} "
+                                              f"(frames {max(start, o_start)}-{min(end, o_end)})")
+
+    for parent, needed in space.items():
+        try:
+            free = shutil.disk_usage(parent).free
+        except OSError:
+            continue
+        if needed > free:
+            report.add(WARNING, None, f"About {needed / 1e9:.1f} GB of output for {parent}, "
+                                      f"{free / 1e9:.1f} GB free")
+
+    return report
+
+
+class Preflight:
+    """Last report, for the render box"""
+
+    last_report = None
+
+    @classmethod
+    def run(cls, context, queue):
+        cls.last_report = validate_queue(context, queue)
+        return cls.last_report
@@ -0,0 +1,148 @@
+"""Shared settings profiles for Cameraide cameras.
+
+A profile holds the output settings (resolution, format, codec, quality)
+once, in the scene's cameraide_profiles collection. Cameras reference a
+profile by name and may override any of its settings for themselves. A
+camera without a profile keeps using its own CameraideSettings, as before.
+
+effective_settings() is what a camera renders with. For cameras with a
+profile it is a thin view over the camera's settings: shared settings are
+read from the profile unless the camera overrides them, and writes go to
+whichever group holds the value. Editing a shared setting through one
+camera edits the profile, so every camera using it changes with one write.
+"""
+import bpy
+
+# Settings a profile carries: (identifier, label shown in the overrides list)
+SHARED_SETTINGS = (
+    ('resolution_x', "Resolution X"),
+    ('resolution_y', "Resolution Y"),
+    ('resolution_percentage', "Resolution Scale"),
+    ('film_transparent', "Alpha Transparency"),
+    ('burn_metadata', "Burn Metadata"),
+    ('overwrite_existing', "Overwrite"),
+    ('output_format', "Format"),
+    ('png_color_depth', "PNG Color Depth"),
+    ('png_compression', "PNG Compression"),
+    ('jpeg_quality', "JPEG Quality"),
+    ('exr_color_depth', "EXR Color Depth"),
+    ('exr_codec', "EXR Codec"),
+    ('exr_preview', "EXR Preview"),
+    ('video_quality', "Video Quality"),
+    ('video_bitrate', "Video Bitrate"),
+    ('video_gopsize', "GOP Size"),
+    ('video_encoder_speed', "Encoder Speed"),
+    ('use_max_b_frames', "Limit B-Frames"),
+    ('max_b_frames', "Max B-Frames"),
+    ('use_audio', "Include Audio"),
+    ('audio_codec', "Audio Codec"),
+    ('audio_bitrate', "Audio Bitrate"),
+    ('quality_tier', "Render Quality"),
+    ('quality_samples', "Samples"),
+    ('quality_noise_threshold', "Noise Threshold"),
+    ('quality_denoise', "Denoise"),
+    ('quality_denoiser', "Denoiser"),
+    ('quality_max_bounces', "Max Bounces"),
+    ('quality_time_limit', "Time Limit"),
+)
+SHARED_NAMES = frozenset(name for name, _ in SHARED_SETTINGS)
+
+
+class EffectiveSettings:
+    """A camera's CameraideSettings with its profile applied.
+
+    Reads and writes like the settings group itself; anything that isn't a
+    shared setting (frame range, output path, extra outputs) is the camera's.
+    """
+
+    __slots__ = ('settings', 'profile', '_from_profile')
+
+    def __init__(self, settings, profile):
+        object.__setattr__(self, 'settings', settings)
+        object.__setattr__(self, 'profile', profile)
+        # Resolved once: the overrides don't change while the view is in use
+        object.__setattr__(self, '_from_profile', SHARED_NAMES - settings.profile_overrides)
+
+    def owner(self, name):
+        """The group holding name's value for this camera"""
+        return self.profile if name in self._from_profile else self.settings
+
+    def __getattr__(self, name):
+        return getattr(self.profile if name in self._from_profile else self.settings, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.profile if name in self._from_profile else self.settings, name, value)
+
+
+def _camera_data(camera):
+    """Camera datablock of a camera object, or camera data as is"""
+    return camera.data if isinstance(camera, bpy.types.Object) else camera
+
+
+def camera_profile(settings, scene=None):
+    """The profile a CameraideSettings group references, or None when it
+    has none or the name isn't in the scene's profiles"""
+    if not settings.profile:
+        return None
+    scene = scene or bpy.context.scene
+    if scene is None:
+        return None
+    return scene.cameraide_profiles.get(settings.profile)
+
+
+def effective_settings(camera, scene=None):
+    """Settings a camera renders with. camera is a camera object or its
+    data. Cameras without a profile get their CameraideSettings directly."""
+    settings = _camera_data(camera).cameraide_settings
+    profile = camera_profile(settings, scene)
+    if profile is None:
+        return settings
+    return EffectiveSettings(settings, profile)
+
+
+def setting_owner(settings, name):
+    """The group holding setting name's value, for drawing and editing:
+    the profile for shared settings the camera doesn't override, otherwise
+    the camera's own settings"""
+    if isinstance(settings, EffectiveSettings):
+        return settings.owner(name)
+    return settings
+
+
+def copy_shared(source, target, names=SHARED_NAMES):
+    """Copy shared settings between settings groups, profiles or views"""
+    for name in names:
+        setattr(target, name, getattr(source, name))
+
+
+def detach_profile(settings, scene=None):
+    """Give a camera its profile's values and drop the reference, so its
+    output doesn't change. Returns True if it had a profile."""
+    profile = camera_profile(settings, scene)
+    if profile is not None:
+        copy_shared(profile, settings, SHARED_NAMES - settings.profile_overrides)
+    had_profile = bool(settings.profile)
+    settings.profile = ""
+    settings.profile_overrides = set()
+    return had_profile
+
+
+def profile_users(scene, name):
+    """Camera datablocks in the scene referencing profile name"""
+    users = []
+    for obj in scene.objects:
+        if obj.type == 'CAMERA' and obj.data.cameraide_settings.profile == name \
+                and obj.data not in users:
+            users.append(obj.data)
+    return users
+
+
+def unique_profile_name(scene, name):
+    """name, or name with a .001 style suffix if a profile already has it"""
+    profiles = scene.cameraide_profiles
+    if name not in profiles:
+        return name
+    index = 1
+    while f"{name}.{index:03d}" in profiles:
+        index += 1
+    return f"{name}.{index:03d}"
@@ -0,0 +1,186 @@
+"""Chrome / Perfetto trace recording for Cameraide entry points.
+
+Developer tool: while recording, every traced entry point emits a complete
+("X") trace event with its nesting depth and parent. Spans that write
+render settings also report how many native / Cameraide properties changed
+value, found by diffing the affected structs before and after the call.
+When recording is off the decorators cost one boolean check.
+
+Load the written JSON in chrome://tracing or https://ui.perfetto.dev.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+import bpy
+
+_recording = False
+_events = []
+_async_spans = {}
+_local = threading.local()
+_lock = threading.Lock()
+_t0 = 0.0
+_pid = os.getpid()
+
+_SKIP_PROP_TYPES = {'POINTER', 'COLLECTION'}
+
+
+def is_recording():
+    return _recording
+
+
+def start_recording():
+    global _recording, _t0
+    with _lock:
+        _events.clear()
+        _async_spans.clear()
+        _t0 = time.perf_counter()
+        _recording = True
+    _events.append({'name': 'process_name', 'ph': 'M', 'pid': _pid, 'tid': 0,
+                    'args': {'name': 'Blender (Cameraide)'}})
+
+
+def stop_recording(path=None):
+    """Stop recording and optionally write the trace. Returns the event count."""
+    global _recording
+    with _lock:
+        _recording = False
+        events = list(_events)
+        _events.clear()
+    if path:
+        path = bpy.path.abspath(path)
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+    return len(events)
+
+
+def _now_us():
+    return (time.perf_counter() - _t0) * 1e6
+
+
+def _stack():
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+# ---------------------------------------------------------------------------
+# Property-change counting (only while recording)
+# ---------------------------------------------------------------------------
+
+def _watched_structs():
+    scene = getattr(bpy.context, 'scene', None)
+    if scene is None:
+        return {}
+    render = scene.render
+    structs = {
+        'scene': scene,
+        'render': render,
+        'image_settings': render.image_settings,
+        'ffmpeg': render.ffmpeg,
+        'view_settings': scene.view_settings,
+    }
+    if scene.camera and scene.camera.type == 'CAMERA':
+        structs['cameraide'] = scene.camera.data.cameraide_settings
+    return structs
+
+
+def _snapshot():
+    values = {}
+    for label, struct in _watched_structs().items():
+        for prop in struct.bl_rna.properties:
+            if prop.type in _SKIP_PROP_TYPES or prop.is_readonly:
+                continue
+            try:
+                value = getattr(struct, prop.identifier)
+            except (AttributeError, RuntimeError):
+                continue
+            if hasattr(value, '__len__') and not isinstance(value, str):
+                value = tuple(value)
+            values[(label, prop.identifier)] = value
+    return values
+
+
+def _count_changes(before, after):
+    return sum(1 for key, value in after.items() if before.get(key, value) != value)
+
+
+# ---------------------------------------------------------------------------
+# Spans
+# ---------------------------------------------------------------------------
+
+@contextmanager
+def span(name, category='cameraide', count_writes=False, **args):
+    """Record the enclosed block as one trace event."""
+    if not _recording:
+        yield
+        return
+
+    stack = _stack()
+    parent = stack[-1] if stack else None
+    stack.append(name)
+    before = _snapshot() if count_writes else None
+    start = _now_us()
+    try:
+        yield
+    finally:
+        duration = _now_us() - start
+        stack.pop()
+        event_args = dict(args, depth=len(stack), parent=parent)
+        if before is not None:
+            event_args['props_changed'] = _count_changes(before, _snapshot())
+        event = {
+            'name': name, 'cat': category, 'ph': 'X',
+            'ts': start, 'dur': duration,
+            'pid': _pid, 'tid': threading.get_ident(),
+            'args': event_args,
+        }
+        with _lock:
+            if _recording:
+                _events.append(event)
+
+
+def traced(name=None, category='cameraide', count_writes=False):
+    """Decorator form of span() for plain Python helpers, app handlers and
+    msgbus callbacks. The wrapper takes *args, so don't use it on anything
+    Blender checks the signature of (property update callbacks, Operator
+    and Panel methods): open a span() inside those instead."""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _recording:
+                return func(*args, **kwargs)
+            with span(label, category, count_writes):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def begin_async(key, name, category='render', **args):
+    """Start a span that ends in another callback (e.g. a render job that
+    finishes in render_complete)."""
+    if _recording:
+        _async_spans[key] = (name, category, _now_us(), threading.get_ident(), args)
+
+
+def end_async(key, **args):
+    span_info = _async_spans.pop(key, None)
+    if not _recording or span_info is None:
+        return
+    name, category, start, tid, start_args = span_info
+    event = {
+        'name': name, 'cat': category, 'ph': 'X',
+        'ts': start, 'dur': _now_us() - start,
+        'pid': _pid, 'tid': tid,
+        'args': dict(start_args, **args),
+    }
+    with _lock:
+        _events.append(event)
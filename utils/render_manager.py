@@ -1,9 +1,28 @@
 """Render settings manager for Cameraide"""
 import bpy
 import os
+import time
 from ..render.formats.image import apply_image_format, store_image_settings
 from ..render.formats.video import apply_video_format, store_video_settings
+from ..render.quality import apply_quality_settings, store_quality_settings
+from ..render.postprocess import JobPostProcess
 from .camera_names import get_clean_camera_name
+from .telemetry import RenderTelemetry
+from .profiling import traced
+from .profiles import effective_settings
+
+
+def camera_output_filepath(cam_obj):
+    """Absolute render.filepath (folder + filename prefix) for a camera"""
+    settings = cam_obj.data.cameraide_settings
+    base_path = bpy.path.abspath(settings.output_path)
+    subfolder = settings.output_subfolder
+    if settings.include_camera_name:
+        clean_name = get_clean_camera_name(cam_obj)
+        filename = f"{clean_name}_{settings.output_filename}"
+    else:
+        filename = settings.output_filename
+    return os.path.join(base_path, subfolder, filename)
 
 
 class RenderCleanupManager:
@@ -11,8 +30,12 @@ class RenderCleanupManager:
     
     _original_settings = None
     _current_camera = None
+    # (struct, attribute, value) for state outside scene.render, e.g. 3D
+    # view overlays; restored after _original_settings
+    _extra_restores = []
     
     @classmethod
+    @traced("store_settings")
     def store_settings(cls, context):
         """Store original render settings"""
         scene = context.scene
@@ -25,6 +48,12 @@ class RenderCleanupManager:
             'resolution_y': scene.render.resolution_y,
             'resolution_percentage': scene.render.resolution_percentage,
             'film_transparent': scene.render.film_transparent,
+            'use_persistent_data': scene.render.use_persistent_data,
+            'use_simplify': scene.render.use_simplify,
+            'simplify_subdivision': scene.render.simplify_subdivision,
+            'simplify_child_particles': scene.render.simplify_child_particles,
+            'use_compositing': scene.render.use_compositing,
+            'use_sequencer': scene.render.use_sequencer,
             'use_stamp': scene.render.use_stamp,
             'frame_step': scene.frame_step,
             'media_type': scene.render.image_settings.media_type,  # Store first
@@ -37,6 +66,9 @@ class RenderCleanupManager:
             'use_curve_mapping': scene.view_settings.use_curve_mapping
         }
         
+        cls._extra_restores = []
+        store_quality_settings(cls._original_settings, context)
+
         current_format = scene.render.image_settings.file_format
         if current_format in {'PNG', 'JPEG', 'OPEN_EXR'}:
             store_image_settings(cls._original_settings, context)
@@ -44,6 +76,15 @@ class RenderCleanupManager:
             store_video_settings(cls._original_settings, context)
 
     @classmethod
+    def remember(cls, struct, attr):
+        """Record struct.attr so restore_settings puts it back. For state the
+        settings dict can't address (3D view spaces, display shading)."""
+        if cls._original_settings is None:
+            return
+        cls._extra_restores.append((struct, attr, getattr(struct, attr)))
+
+    @classmethod
+    @traced("restore_settings", count_writes=True)
     def restore_settings(cls, context):
         """Restore original render settings"""
         scene = context.scene
@@ -70,12 +111,18 @@ class RenderCleanupManager:
                 
             if key.startswith('ffmpeg_'):
                 if scene.render.image_settings.file_format == 'FFMPEG':
-                    clean_key = key.replace('ffmpeg_', '')
+                    clean_key = key.replace('ffmpeg_', '', 1)
                     if hasattr(scene.render.ffmpeg, clean_key):
                         try:
                             setattr(scene.render.ffmpeg, clean_key, value)
                         except:
                             pass
+            elif key.startswith('cycles_') or key.startswith('eevee_'):
+                engine_settings = scene.cycles if key.startswith('cycles_') else scene.eevee
+                try:
+                    setattr(engine_settings, key.split('_', 1)[1], value)
+                except:
+                    pass
             elif key in ['view_transform', 'look', 'exposure', 'gamma', 'use_curve_mapping']:
                 try:
                     setattr(scene.view_settings, key, value)
@@ -96,10 +143,19 @@ class RenderCleanupManager:
                     setattr(scene, key, value)
                 except:
                     pass
-        
+
+        # Reverse order so a struct remembered twice ends at its first value
+        for struct, attr, value in reversed(cls._extra_restores):
+            try:
+                setattr(struct, attr, value)
+            except (AttributeError, ReferenceError, TypeError, ValueError):
+                pass
+        cls._extra_restores = []
+
         cls._original_settings = None
     
     @classmethod
+    @traced("apply_camera_settings", count_writes=True)
     def apply_camera_settings(cls, context, cam_obj, frame_range=None,
                               force_image_format=False, apply_frame_range=True):
         """Apply camera settings to render
@@ -109,8 +165,9 @@ class RenderCleanupManager:
             apply_frame_range: If False, leave scene frame range/step untouched
                 (snapshots render a single frame and must not move the timeline)
         """
+        t0 = time.perf_counter()
         scene = context.scene
-        settings = cam_obj.data.cameraide_settings
+        settings = effective_settings(cam_obj, scene)
         cls._current_camera = cam_obj
         
         # Resolution
@@ -164,16 +221,7 @@ class RenderCleanupManager:
         scene.render.use_stamp = settings.burn_metadata
 
         # Output path
-        base_path = bpy.path.abspath(settings.output_path)
-        subfolder = settings.output_subfolder
-        if settings.include_camera_name:
-            clean_name = get_clean_camera_name(cam_obj)
-            filename = f"{clean_name}_{settings.output_filename}"
-        else:
-            filename = settings.output_filename
-            
-        filepath = os.path.join(base_path, subfolder, filename)
-        scene.render.filepath = filepath
+        scene.render.filepath = camera_output_filepath(cam_obj)
         
         # Format settings
         if forced_format:
@@ -188,4 +236,17 @@ class RenderCleanupManager:
             scene.render.image_settings.file_format = settings.output_format
             apply_image_format(settings, context)
         else:
-            apply_video_format(settings, context)
\ No newline at end of file
+            apply_video_format(settings, context)
+
+        apply_quality_settings(settings, context)
+
+        # Hold frames: render every Nth frame of the step, fill the rest afterwards
+        if apply_frame_range and not forced_format:
+            base_step = scene.frame_step
+            if settings.hold_frames > 1:
+                scene.frame_step = base_step * settings.hold_frames
+            JobPostProcess.prepare(context, cam_obj, base_step)
+        else:
+            JobPostProcess.discard()
+
+        RenderTelemetry.record_apply(time.perf_counter() - t0)
\ No newline at end of file
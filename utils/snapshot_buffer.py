@@ -0,0 +1,282 @@
+"""In-memory viewport snapshots with an A/B compare overlay.
+
+A viewport snapshot kept in memory is just the camera's offscreen view
+(see offscreen.py) as RGBA bytes: no render settings are stored, applied
+or restored and nothing touches the disk until the snapshot is saved.
+SnapshotBuffer keeps the last few per camera and drops the oldest ones
+once all of them together pass the memory limit. SnapshotCompare draws
+two of them over the 3D view, as a wipe or as their difference.
+"""
+import itertools
+import os
+import re
+import time
+from collections import deque
+import bpy
+import numpy as np
+from .callbacks import tag_view3d_redraw
+from .offscreen import camera_pixels, write_png
+from .profiles import effective_settings
+
+# Longest side of a kept snapshot; enough to judge lighting on screen
+MAX_SIDE = 2048
+# Difference view gain, so small changes are visible
+_DIFF_GAIN = 4.0
+# The run of '#' Blender replaces with the frame number
+_HASHES = re.compile(r'#+(?=[^#]*$)')
+
+
+class Snapshot:
+    """One kept snapshot: top-down RGBA bytes"""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, camera, frame, width, height, rgba):
+        self.id = next(self._ids)
+        self.camera = camera
+        self.frame = frame
+        self.width = width
+        self.height = height
+        self.rgba = rgba
+        self.time = time.time()
+
+    @property
+    def nbytes(self):
+        return len(self.rgba)
+
+    @property
+    def label(self):
+        return f"Frame {self.frame} · {time.strftime('%H:%M:%S', time.localtime(self.time))}"
+
+    def array(self):
+        """(height, width, 4) float array, rows bottom to top (GPU order)"""
+        pixels = np.frombuffer(self.rgba, dtype=np.uint8).reshape(self.height, self.width, 4)
+        return pixels[::-1].astype(np.float32) / 255.0
+
+
+def snapshot_size(settings):
+    """Output size of a camera scaled down to fit MAX_SIDE"""
+    pct = settings.resolution_percentage / 100
+    width = max(int(settings.resolution_x * pct), 1)
+    height = max(int(settings.resolution_y * pct), 1)
+    fit = min(MAX_SIDE / max(width, height), 1.0)
+    return max(int(width * fit), 1), max(int(height * fit), 1)
+
+
+class SnapshotBuffer:
+    """Bounded per-camera history of snapshots, evicted oldest first"""
+
+    _history = {}  # camera object name -> deque of Snapshot, oldest first
+
+    @classmethod
+    def capture(cls, context, cam_obj):
+        """Draw cam_obj's view into a new snapshot. Returns it, or None
+        when drawing isn't possible (no 3D view)."""
+        width, height = snapshot_size(effective_settings(cam_obj, context.scene))
+        rgba = camera_pixels(context, cam_obj, width, height)
+        if rgba is None:
+            return None
+        snapshot = Snapshot(cam_obj.name, context.scene.frame_current, width, height, rgba)
+        batch = context.scene.cameraide_batch
+        cls.add(snapshot, batch.snapshot_history, batch.snapshot_memory_mb * 1024 ** 2)
+        return snapshot
+
+    @classmethod
+    def add(cls, snapshot, keep, budget):
+        history = cls._history.setdefault(snapshot.camera, deque())
+        history.append(snapshot)
+        while len(history) > keep:
+            cls._evicted(history.popleft())
+        # Over budget: drop the oldest snapshot of any camera, never the new one
+        while cls.total_bytes() > budget:
+            oldest = min((h[0] for h in cls._history.values() if h and h[0] is not snapshot),
+                         key=lambda s: s.time, default=None)
+            if oldest is None:
+                break
+            cls._history[oldest.camera].popleft()
+            cls._evicted(oldest)
+
+    @classmethod
+    def _evicted(cls, snapshot):
+        SnapshotCompare.forget(snapshot.id)
+
+    @classmethod
+    def snapshots(cls, camera_name):
+        """Snapshots of a camera, newest first"""
+        return list(reversed(cls._history.get(camera_name, ())))
+
+    @classmethod
+    def get(cls, snapshot_id):
+        for history in cls._history.values():
+            for snapshot in history:
+                if snapshot.id == snapshot_id:
+                    return snapshot
+        return None
+
+    @classmethod
+    def remove(cls, snapshot_id):
+        for history in cls._history.values():
+            for snapshot in history:
+                if snapshot.id == snapshot_id:
+                    history.remove(snapshot)
+                    cls._evicted(snapshot)
+                    return
+
+    @classmethod
+    def clear(cls, camera_name=None):
+        names = [camera_name] if camera_name else list(cls._history)
+        for name in names:
+            for snapshot in cls._history.pop(name, ()):
+                cls._evicted(snapshot)
+
+    @classmethod
+    def total_bytes(cls):
+        return sum(s.nbytes for history in cls._history.values() for s in history)
+
+
+def snapshot_output_path(cam_obj, frame):
+    """Where the Snapshot button would have written this frame as a PNG"""
+    from .render_manager import camera_output_filepath
+    folder, name = os.path.split(camera_output_filepath(cam_obj))
+    match = _HASHES.search(name)
+    if match:
+        name = f"{name[:match.start()]}{frame:0{len(match.group())}d}{name[match.end():]}"
+    else:
+        name = f"{name}{frame:04d}"
+    return os.path.join(folder, f"{name}.png")
+
+
+def save_snapshot(snapshot, cam_obj, overwrite=True):
+    """Write a kept snapshot as a PNG to the camera's output path.
+    Returns the path. Raises FileExistsError or OSError."""
+    path = snapshot_output_path(cam_obj, snapshot.frame)
+    if os.path.exists(path) and not overwrite:
+        raise FileExistsError(f"{path} exists and Overwrite is off")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    partial = path + ".part"
+    write_png(partial, snapshot.width, snapshot.height, snapshot.rgba)
+    os.replace(partial, path)
+    return path
+
+
+def _fit(region_width, region_height, width, height):
+    """(x, y, w, h) of an image fitted and centred in the region"""
+    scale = min(region_width / width, region_height / height)
+    w, h = width * scale, height * scale
+    return (region_width - w) / 2, (region_height - h) / 2, w, h
+
+
+class SnapshotCompare:
+    """A/B overlay over every 3D view"""
+
+    a_id = None
+    b_id = None
+    _handle = None
+    _textures = {}  # key -> GPUTexture
+
+    @classmethod
+    def is_active(cls):
+        return cls._handle is not None
+
+    @classmethod
+    def pick(cls, slot, snapshot_id):
+        if slot == 'A':
+            cls.a_id = snapshot_id
+        else:
+            cls.b_id = snapshot_id
+        cls._textures.pop('DIFF', None)
+        tag_view3d_redraw()
+
+    @classmethod
+    def forget(cls, snapshot_id):
+        """A snapshot was dropped from the buffer"""
+        cls._textures.pop(snapshot_id, None)
+        if snapshot_id in (cls.a_id, cls.b_id):
+            cls._textures.pop('DIFF', None)
+            if cls.a_id == snapshot_id:
+                cls.a_id = None
+            if cls.b_id == snapshot_id:
+                cls.b_id = None
+
+    @classmethod
+    def start(cls):
+        if cls._handle is None:
+            cls._handle = bpy.types.SpaceView3D.draw_handler_add(cls._draw, (), 'WINDOW', 'POST_PIXEL')
+        tag_view3d_redraw()
+
+    @classmethod
+    def stop(cls):
+        if cls._handle is not None:
+            bpy.types.SpaceView3D.draw_handler_remove(cls._handle, 'WINDOW')
+            cls._handle = None
+        cls._textures.clear()
+        tag_view3d_redraw()
+
+    @classmethod
+    def _texture(cls, key, make_pixels):
+        """GPU texture of the (h, w, 4) float array make_pixels() returns,
+        cached under key"""
+        import gpu
+        texture = cls._textures.get(key)
+        if texture is None:
+            pixels = make_pixels()
+            height, width = pixels.shape[:2]
+            buffer = gpu.types.Buffer('FLOAT', width * height * 4, pixels.ravel())
+            texture = gpu.types.GPUTexture((width, height), format='RGBA16F', data=buffer)
+            cls._textures[key] = texture
+        return texture
+
+    @classmethod
+    def _diff_texture(cls, a, b):
+        def difference():
+            diff = np.abs(a.array() - b.array()) * _DIFF_GAIN
+            diff[..., 3] = 1.0
+            return np.clip(diff, 0.0, 1.0)
+        return cls._texture('DIFF', difference)
+
+    @classmethod
+    def _draw(cls):
+        import gpu
+        from gpu_extras.batch import batch_for_shader
+
+        a = SnapshotBuffer.get(cls.a_id) if cls.a_id else None
+        b = SnapshotBuffer.get(cls.b_id) if cls.b_id else None
+        if a is None and b is None:
+            return
+        region = bpy.context.region
+        batch_settings = bpy.context.scene.cameraide_batch
+        shader = gpu.shader.from_builtin('IMAGE')
+        gpu.state.blend_set('ALPHA')
+
+        def draw(texture, x0, y0, x1, y1, u0=0.0, u1=1.0):
+            batch = batch_for_shader(shader, 'TRI_FAN', {
+                'pos': ((x0, y0), (x1, y0), (x1, y1), (x0, y1)),
+                'texCoord': ((u0, 0), (u1, 0), (u1, 1), (u0, 1)),
+            })
+            shader.uniform_sampler("image", texture)
+            batch.draw(shader)
+
+        shown = a or b
+        x, y, w, h = _fit(region.width, region.height, shown.width, shown.height)
+        if a and b and batch_settings.compare_mode == 'DIFF':
+            if (a.width, a.height) == (b.width, b.height):
+                draw(cls._diff_texture(a, b), x, y, x + w, y + h)
+            gpu.state.blend_set('NONE')
+            return
+        wipe = batch_settings.compare_wipe if a and b else 1.0
+        split = x + w * wipe
+        if a:
+            draw(cls._texture(a.id, a.array), x, y, split, y + h, 0.0, wipe)
+        if b:
+            draw(cls._texture(b.id, b.array), split if a else x, y, x + w, y + h,
+                 wipe if a else 0.0, 1.0)
+        if a and b:
+            line = gpu.shader.from_builtin('UNIFORM_COLOR')
+            line.uniform_float("color", (1.0, 1.0, 1.0, 0.8))
+            batch_for_shader(line, 'LINES', {'pos': ((split, y), (split, y + h))}).draw(line)
+        gpu.state.blend_set('NONE')
+
+
+def unregister():
+    SnapshotCompare.stop()
+    SnapshotBuffer.clear()
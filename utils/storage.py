@@ -0,0 +1,17 @@
+"""Per-user storage folders for Cameraide caches"""
+import os
+import tempfile
+import bpy
+
+_PACKAGE = __package__.rpartition('.')[0]
+
+
+def user_cache_dir(name):
+    """Folder `name` in the extension's user directory (created on demand),
+    or in the system temp folder when not installed as an extension."""
+    try:
+        return bpy.utils.extension_path_user(_PACKAGE, path=name, create=True)
+    except (AttributeError, ValueError, KeyError):
+        path = os.path.join(tempfile.gettempdir(), f"cameraide_{name}")
+        os.makedirs(path, exist_ok=True)
+        return path
@@ -0,0 +1,251 @@
+"""Per-job and per-frame render telemetry for Cameraide batches"""
+import json
+import os
+import sys
+import time
+import bpy
+from .camera_names import get_clean_camera_name
+from .metrics import BatchMetrics, MetricsExporter
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def sample_rss():
+    """Current resident set size in bytes (peak RSS where current is not
+    available), or None."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS, kilobytes on Linux/BSD
+        return peak if sys.platform == 'darwin' else peak * 1024
+    return None
+
+
+class RenderTelemetry:
+    """Collects timings for the running batch and writes them as JSON lines.
+
+    Normal renders are timed through render_pre / render_post / render_write
+    (render_post fires before the file is written, render_write after).
+    OpenGL renders fire none of those, so viewport jobs are split into frames
+    with frame_change_post instead.
+    """
+
+    active = False
+    last_summary = []
+    last_log_path = ""
+
+    _log = None
+    _batch_id = ""
+    _job = None
+    _frames = []
+    _frame = None
+    _frame_scene = None
+
+    # -- batch -------------------------------------------------------------
+
+    @classmethod
+    def start_batch(cls, context, kind, queue=()):
+        """Open a log for this batch if telemetry is enabled on the scene,
+        and publish live metrics for the queue if those are enabled."""
+        cls.end_batch()
+        scene = context.scene
+        if hasattr(scene, 'cameraide_batch') and MetricsExporter.configure_from_scene(scene):
+            BatchMetrics.start_batch(kind, queue)
+        batch_settings = getattr(scene, 'cameraide_batch', None)
+        if not batch_settings or not batch_settings.use_telemetry:
+            return False
+
+        folder = bpy.path.abspath(batch_settings.telemetry_dir)
+        cls._batch_id = time.strftime('%Y%m%d-%H%M%S')
+        try:
+            os.makedirs(folder, exist_ok=True)
+            cls.last_log_path = os.path.join(folder, f"{cls._batch_id}_{kind.lower()}.jsonl")
+            cls._log = open(cls.last_log_path, 'w', encoding='utf-8')
+        except OSError:
+            cls._log = None
+            cls.last_log_path = ""
+
+        cls.active = True
+        cls.last_summary = []
+        cls._write({'type': 'batch', 'batch': cls._batch_id, 'kind': kind,
+                    'blend': bpy.data.filepath, 'engine': scene.render.engine,
+                    'time': time.time()})
+        for handlers, func in cls._handler_table():
+            if func not in handlers:
+                handlers.append(func)
+        return True
+
+    @classmethod
+    def end_batch(cls):
+        BatchMetrics.end_batch()
+        if not cls.active:
+            return
+        if cls._job:
+            cls.end_job('CANCELLED')
+        for handlers, func in cls._handler_table():
+            if func in handlers:
+                handlers.remove(func)
+        if cls._log:
+            cls._log.close()
+            cls._log = None
+        cls.active = False
+
+    # -- jobs --------------------------------------------------------------
+
+    @classmethod
+    def start_job(cls, cam_obj, start, end, kind='NORMAL'):
+        BatchMetrics.start_job(cam_obj)
+        if not cls.active:
+            return
+        cls._job = {
+            'type': 'job',
+            'batch': cls._batch_id,
+            'camera': get_clean_camera_name(cam_obj),
+            'frame_start': start,
+            'frame_end': end,
+            'kind': kind,
+            'apply_seconds': 0.0,
+            'movie': None,
+            't0': time.perf_counter(),
+            'cpu0': time.process_time(),
+        }
+        cls._frames = []
+        cls._frame = None
+
+    @classmethod
+    def record_apply(cls, seconds):
+        """Time spent in RenderCleanupManager.apply_camera_settings for the
+        current job (jobs are started before their settings are applied)."""
+        if cls._job:
+            cls._job['apply_seconds'] += seconds
+
+    @classmethod
+    def end_job(cls, status='FINISHED'):
+        BatchMetrics.end_job(status)
+        if not cls.active or not cls._job:
+            return
+        if cls._frame is not None:
+            cls._finish_frame(cls._frame_scene)
+        job = cls._job
+        wall = time.perf_counter() - job.pop('t0')
+        cpu = time.process_time() - job.pop('cpu0')
+        frames = cls._frames
+        rss = [f['rss'] for f in frames if f.get('rss')]
+        movie = job.pop('movie')
+        if movie:
+            try:
+                total_bytes = os.path.getsize(movie)
+            except OSError:
+                total_bytes = 0
+        else:
+            total_bytes = sum(f['bytes'] or 0 for f in frames)
+        job.update({
+            'status': status,
+            'frames': len(frames),
+            'wall_seconds': round(wall, 4),
+            'cpu_percent': round(100.0 * cpu / wall, 1) if wall > 0 else 0.0,
+            'mean_frame_seconds': round(sum(f['wall'] for f in frames) / len(frames), 4) if frames else 0.0,
+            'mean_write_seconds': round(sum(f['write'] or 0.0 for f in frames) / len(frames), 4) if frames else 0.0,
+            'bytes': total_bytes,
+            'peak_rss': max(rss) if rss else None,
+        })
+        job['apply_seconds'] = round(job['apply_seconds'], 4)
+        cls._write(job)
+        cls.last_summary.append(job)
+        cls._job = None
+
+    # -- frames ------------------------------------------------------------
+
+    @classmethod
+    def _start_frame(cls, scene):
+        cls._frame_scene = scene
+        cls._frame = {
+            'frame': scene.frame_current,
+            't0': time.perf_counter(),
+            'cpu0': time.process_time(),
+            'rendered': None,
+        }
+
+    @classmethod
+    def _finish_frame(cls, scene):
+        frame = cls._frame
+        cls._frame = None
+        if frame is None or not cls._job:
+            return
+        now = time.perf_counter()
+        wall = now - frame['t0']
+        cpu = time.process_time() - frame['cpu0']
+        write = now - frame['rendered'] if frame['rendered'] is not None else None
+        path = scene.render.frame_path(frame=frame['frame'])
+        size = None
+        if scene.render.is_movie_format:
+            # Frames are appended to one movie; its size is taken at job end
+            cls._job['movie'] = path
+        else:
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                pass
+        record = {
+            'type': 'frame',
+            'batch': cls._batch_id,
+            'camera': cls._job['camera'],
+            'frame': frame['frame'],
+            'wall': round(wall, 4),
+            'write': round(write, 4) if write is not None else None,
+            'bytes': size,
+            'rss': sample_rss(),
+            'cpu_percent': round(100.0 * cpu / wall, 1) if wall > 0 else 0.0,
+        }
+        cls._frames.append(record)
+        cls._write(record)
+
+    @classmethod
+    def _write(cls, record):
+        if cls._log:
+            cls._log.write(json.dumps(record) + '\n')
+
+    @classmethod
+    def _handler_table(cls):
+        handlers = bpy.app.handlers
+        return (
+            (handlers.render_pre, telemetry_render_pre),
+            (handlers.render_post, telemetry_render_post),
+            (handlers.render_write, telemetry_render_write),
+            (handlers.frame_change_post, telemetry_frame_change),
+        )
+
+
+def telemetry_render_pre(scene, depsgraph=None):
+    if RenderTelemetry._job:
+        RenderTelemetry._start_frame(scene)
+
+
+def telemetry_render_post(scene, depsgraph=None):
+    frame = RenderTelemetry._frame
+    if frame is not None:
+        frame['rendered'] = time.perf_counter()
+
+
+def telemetry_render_write(scene, depsgraph=None):
+    if RenderTelemetry._frame is not None:
+        RenderTelemetry._finish_frame(scene)
+
+
+def telemetry_frame_change(scene, depsgraph=None):
+    """Frame boundaries for OpenGL jobs, which fire no render handlers."""
+    job = RenderTelemetry._job
+    if not job or job['kind'] != 'OPENGL':
+        return
+    if RenderTelemetry._frame is not None:
+        RenderTelemetry._finish_frame(scene)
+    RenderTelemetry._start_frame(scene)
@@ -0,0 +1,158 @@
+"""Camera thumbnails for the sidebar camera lists.
+
+Thumbnails are drawn offscreen at a tiny resolution, one camera per timer
+tick, and cached on disk as PNGs named after a hash of everything that
+changes the picture: camera matrix, lens/sensor/shift/clipping, aspect and
+frame. The panel only ever looks up an icon; a missing or stale thumbnail
+queues the camera and the previous icon (if any) is shown until the new
+one is ready, so drawing never waits on a render.
+"""
+import hashlib
+import os
+import bpy
+import bpy.utils.previews
+from .callbacks import tag_view3d_redraw
+from .offscreen import camera_pixels, write_png
+from .profiles import effective_settings
+from .storage import user_cache_dir
+
+THUMB_WIDTH = 128
+_TICK_SECONDS = 0.1
+# Previews of outdated keys stay loaded; start over past this many
+_MAX_LOADED = 256
+
+_previews = None
+_queue = {}        # camera object name -> None (ordered set)
+_last_icon = {}    # camera object name -> icon_id of the newest loaded thumbnail
+_failed = set()    # cache keys that couldn't be drawn (no 3D view etc.)
+
+
+def cache_dir():
+    return user_cache_dir("thumbnails")
+
+
+def _aspect(scene, cam_obj):
+    settings = effective_settings(cam_obj, scene)
+    if settings.use_custom_settings:
+        return settings.resolution_x, settings.resolution_y
+    return scene.render.resolution_x, scene.render.resolution_y
+
+
+def thumbnail_size(scene, cam_obj):
+    res_x, res_y = _aspect(scene, cam_obj)
+    height = max(int(round(THUMB_WIDTH * res_y / max(res_x, 1))), 1)
+    return THUMB_WIDTH, min(height, THUMB_WIDTH * 2)
+
+
+def thumbnail_key(scene, cam_obj):
+    """Hash of the state the thumbnail depends on"""
+    cam = cam_obj.data
+    matrix = tuple(round(v, 4) for row in cam_obj.matrix_world for v in row)
+    parts = (
+        matrix, cam.type, round(cam.lens, 4), round(cam.ortho_scale, 4),
+        round(cam.sensor_width, 4), round(cam.sensor_height, 4), cam.sensor_fit,
+        round(cam.shift_x, 4), round(cam.shift_y, 4),
+        round(cam.clip_start, 4), round(cam.clip_end, 4),
+        thumbnail_size(scene, cam_obj), scene.frame_current,
+    )
+    return hashlib.sha1(repr(parts).encode()).hexdigest()[:20]
+
+
+def _cache_path(key):
+    return os.path.join(cache_dir(), f"{key}.png")
+
+
+def get_thumbnail_icon(context, cam_obj):
+    """Icon id for cam_obj's thumbnail, or 0 if none is loaded yet.
+
+    Cheap enough to call from draw(): loads a cached PNG as a preview
+    (Blender decodes it lazily) or queues the camera for generation.
+    """
+    if _previews is None:
+        return 0
+    key = thumbnail_key(context.scene, cam_obj)
+    preview = _previews.get(key)
+    if preview is None:
+        path = _cache_path(key)
+        if os.path.exists(path):
+            if len(_previews) >= _MAX_LOADED:
+                _previews.clear()
+                _last_icon.clear()
+            preview = _previews.load(key, path, 'IMAGE')
+        elif key not in _failed:
+            _request(cam_obj.name)
+    if preview is not None:
+        _last_icon[cam_obj.name] = preview.icon_id
+        return preview.icon_id
+    return _last_icon.get(cam_obj.name, 0)
+
+
+def _request(name):
+    if name in _queue:
+        return
+    _queue[name] = None
+    if not bpy.app.timers.is_registered(_process_queue):
+        bpy.app.timers.register(_process_queue, first_interval=_TICK_SECONDS)
+
+
+def _process_queue():
+    """Timer: draw one queued camera, then yield back to the UI"""
+    if not _queue or _previews is None:
+        return None
+    context = bpy.context
+    # Every frame is a new key during playback; wait until it stops
+    if any(w.screen.is_animation_playing for w in context.window_manager.windows):
+        return 0.5
+    name = next(iter(_queue))
+    del _queue[name]
+
+    scene = context.scene
+    cam_obj = scene.objects.get(name) if scene else None
+    if cam_obj is not None and cam_obj.type == 'CAMERA':
+        key = thumbnail_key(scene, cam_obj)
+        path = _cache_path(key)
+        if not os.path.exists(path):
+            width, height = thumbnail_size(scene, cam_obj)
+            pixels = camera_pixels(context, cam_obj, width, height)
+            if pixels is None:
+                _failed.add(key)
+            else:
+                tmp_path = path + ".tmp"
+                write_png(tmp_path, width, height, pixels)
+                os.replace(tmp_path, path)
+                tag_view3d_redraw()
+
+    return _TICK_SECONDS if _queue else None
+
+
+def clear_cache():
+    """Delete cached thumbnails and unload loaded previews"""
+    _queue.clear()
+    _last_icon.clear()
+    _failed.clear()
+    if _previews is not None:
+        _previews.clear()
+    folder = cache_dir()
+    for name in os.listdir(folder):
+        if name.endswith(".png"):
+            try:
+                os.remove(os.path.join(folder, name))
+            except OSError:
+                pass
+
+
+def register():
+    global _previews
+    _previews = bpy.utils.previews.new()
+
+
+def unregister():
+    global _previews
+    if bpy.app.timers.is_registered(_process_queue):
+        bpy.app.timers.unregister(_process_queue)
+    _queue.clear()
+    _last_icon.clear()
+    _failed.clear()
+    if _previews is not None:
+        bpy.utils.previews.remove(_previews)
+        _previews = None